@@ -0,0 +1 @@
+"""Performance scripts for the Wildfire Severity Predictor (run with ``python -m``)."""
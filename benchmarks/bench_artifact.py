@@ -0,0 +1,116 @@
+"""Cold start and memory: pickle load vs the memory-mapped ``.wfm`` artifact.
+
+    python -m wildfire.artifact export        # once, writes best_fire_model.wfm
+    python -m benchmarks.bench_artifact --workers 4
+
+For each mode the script starts ``--workers`` processes at the same time.
+Each one loads the model, scores a row, and then waits while the parent
+reads its /proc smaps. PSS (proportional set size) splits shared pages
+between the processes mapping them, so the gap between RSS and PSS shows
+how much of the model the workers really share. Linux only.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+MODES = ("pickle", "mapped")
+
+
+def _smaps_kb(pid):
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return fields
+
+
+def _rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _child(mode):
+    """Load the model in ``mode``, report timings, then wait for the parent."""
+    import numpy as np  # noqa: F401  baseline: every worker needs numpy anyway
+
+    baseline_kb = _rss_kb()
+    start = time.perf_counter()
+    from wildfire.predictor import Predictor
+    if mode == "pickle":
+        import joblib  # noqa: F401
+        import sklearn  # noqa: F401
+        import xgboost  # noqa: F401
+    else:
+        import wildfire.artifact  # noqa: F401
+    imported = time.perf_counter()
+
+    if mode == "pickle":
+        predictor = Predictor.load(fused=False)
+    else:
+        predictor = Predictor.load_mapped()
+    loaded = time.perf_counter()
+    predictor.predict_batch([[15, 38.5, -121.5, 75, 25, 5, 1, 0, 1, 0]])
+
+    print(json.dumps({
+        "import_ms": (imported - start) * 1000,
+        "load_ms": (loaded - imported) * 1000,
+        "rss_delta_kb": _rss_kb() - baseline_kb,
+    }), flush=True)
+    sys.stdin.read()
+
+
+def _run_mode(mode, workers):
+    procs = [
+        subprocess.Popen([sys.executable, "-m", "benchmarks.bench_artifact", "--child", mode],
+                         stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        for _ in range(workers)
+    ]
+    reports = [json.loads(proc.stdout.readline()) for proc in procs]
+    # Every worker is loaded and idle here, so shared pages are counted once
+    for proc, report in zip(procs, reports):
+        smaps = _smaps_kb(proc.pid)
+        report["rss_kb"] = smaps.get("Rss", 0)
+        report["pss_kb"] = smaps.get("Pss", 0)
+        report["private_kb"] = smaps.get("Private_Clean", 0) + smaps.get("Private_Dirty", 0)
+    for proc in procs:
+        proc.stdin.close()
+        proc.wait()
+
+    def mean(key):
+        return sum(r[key] for r in reports) / len(reports)
+
+    return {key: mean(key) for key in reports[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare pickle and memory-mapped model loading")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child)
+        return
+
+    from wildfire.artifact import ARTIFACT_FILE
+    from wildfire.predictor import DEFAULT_MODEL_DIR
+    if not (DEFAULT_MODEL_DIR / ARTIFACT_FILE).exists():
+        raise SystemExit(f"{ARTIFACT_FILE} not found; run `python -m wildfire.artifact export` first")
+
+    results = {mode: _run_mode(mode, args.workers) for mode in MODES}
+    print(f"{args.workers} concurrent workers per mode (means per worker)")
+    print(f"{'mode':<8}{'imports ms':>12}{'load ms':>10}{'RSS +MB':>10}{'RSS MB':>9}{'PSS MB':>9}{'private MB':>12}")
+    for mode, r in results.items():
+        print(f"{mode:<8}{r['import_ms']:>12.1f}{r['load_ms']:>10.2f}{r['rss_delta_kb'] / 1024:>10.1f}"
+              f"{r['rss_kb'] / 1024:>9.1f}{r['pss_kb'] / 1024:>9.1f}{r['private_kb'] / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
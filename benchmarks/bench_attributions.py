@@ -0,0 +1,84 @@
+"""Microbenchmark: per-feature contributions vs a plain prediction.
+
+    python -m benchmarks.bench_attributions [--budget-ms 5] [--iterations 500]
+
+Measures single-row latency, uncached and as a cache hit, and batch
+throughput for the bundled XGBoost model (native TreeSHAP) and a Random
+Forest fitted on synthetic incidents (vectorized Saabas paths). Each
+method is first checked for additivity: bias plus contributions must
+equal the prediction. Exits non-zero if an uncached single row's p99
+exceeds ``--budget-ms``.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from wildfire.attributions import cached_contributions, contributions, method
+from wildfire.features import FEATURE_COLUMNS
+from wildfire.metrics import percentile
+from wildfire.predictor import Predictor
+from wildfire.scenarios import synthetic_incidents
+
+
+def _latencies_ms(fn, inputs):
+    fn(inputs[0])  # first call outside the timed loop
+    samples = []
+    for item in inputs:
+        start = time.perf_counter()
+        fn(item)
+        samples.append((time.perf_counter() - start) * 1000)
+    return sorted(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=5.0, help="Allowed p99 for one uncached row")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--batch-rows", type=int, default=10000)
+    args = parser.parse_args()
+
+    from sklearn.ensemble import RandomForestRegressor
+
+    bundled = Predictor.load()
+    rng = np.random.default_rng(42)
+    X_train = synthetic_incidents(5000, seed=1)
+    y_train = np.clip(bundled.predict_batch(X_train), 1, None) * rng.lognormal(0, 0.75, len(X_train))
+    forest = RandomForestRegressor(n_estimators=100, min_samples_leaf=5, random_state=42, n_jobs=1)
+    forest_predictor = Predictor(forest.fit(bundled.scaler.transform(X_train), y_train), bundled.scaler)
+    forest_predictor.compile()
+
+    # Distinct rows so no call is a cache hit
+    rows = synthetic_incidents(args.iterations, seed=2)
+    batch = synthetic_incidents(args.batch_rows, seed=3)
+    failed = False
+
+    print(f"{'method':<10}{'predict p50':>12}{'explain p50':>12}{'explain p99':>12}{'cache hit':>11}"
+          f"{'batch us/row':>14}{'max |sum - pred|':>18}")
+    for predictor in (bundled, forest_predictor):
+        values, bias = contributions(predictor, batch[:2000])
+        error = np.abs(values.sum(axis=1) + bias - predictor.predict_reference(batch[:2000])).max()
+
+        predict_ms = _latencies_ms(lambda row: predictor.predict_batch(row[None, :]), rows)
+        explain_ms = _latencies_ms(lambda row: contributions(predictor, row[None, :]), rows)
+        features = dict(zip(FEATURE_COLUMNS, rows[0]))
+        cached_contributions(predictor, features)
+        hit_ms = _latencies_ms(lambda _: cached_contributions(predictor, features), rows[:100])
+
+        start = time.perf_counter()
+        contributions(predictor, batch)
+        batch_us = (time.perf_counter() - start) / len(batch) * 1e6
+
+        p99 = percentile(explain_ms, 99)
+        failed |= p99 > args.budget_ms
+        print(f"{method(predictor):<10}{percentile(predict_ms, 50):>10.3f}ms{percentile(explain_ms, 50):>10.3f}ms"
+              f"{p99:>10.3f}ms{percentile(hit_ms, 50):>9.3f}ms{batch_us:>14.2f}{error:>18.4g}")
+
+    print(f"\nbudget: uncached single-row p99 <= {args.budget_ms:g} ms -> {'FAIL' if failed else 'ok'}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Per-render cost of the Analytics charts and the Prediction gauge.
+
+    python -m benchmarks.bench_figures [--repeats 30] [--json after.json]
+    python -m benchmarks.bench_figures --baseline before.json   # side by side
+
+Drives app.py through ``RerunProbe`` (see ``benchmarks.bench_reruns``):
+
+- ``analytics rerun``: reruns the Analytics page, which draws the same
+  charts every time
+- ``predict``: clicks Predict Severity after alternating one input, so
+  every click draws the gauge (and the contributions chart) for a new
+  prediction
+- ``gauge rerun``: reruns only the gauge's fragment, as its interval
+  toggle does, so the gauge is the only chart drawn
+
+For each it reports the ``figure_build`` and ``figure_render`` stage time
+per rerun (from ``wildfire.instrumentation``), the bytes of the
+``plotly_chart`` messages and the rerun's total time and bytes.
+"""
+import argparse
+import json
+import statistics
+from pathlib import Path
+
+from benchmarks.bench_reruns import RerunProbe, _button
+from wildfire.instrumentation import FIGURE_BUILD, FIGURE_RENDER, timings
+
+
+def _stage_ms(stage, reruns):
+    """Total time recorded for ``stage`` since the last reset, per rerun."""
+    recorder = timings.summary().get(stage)
+    return recorder["mean_ms"] * recorder["count"] / reruns if recorder else 0.0
+
+
+def _analytics(probe, i):
+    return probe.run()
+
+
+def _predict(probe, i):
+    probe.interact(lambda app: app.number_input(key="helicopters").set_value(3 + i % 2))
+    return probe.interact(lambda app: _button("Predict Severity")(app).click())
+
+
+def _gauge(probe, i):
+    if i < 0:
+        _predict(probe, i)
+    gauge = next(chart for chart in probe.app.get("plotly_chart") if '"type":"indicator"' in chart.proto.spec)
+    return probe.run(probe.fragments[gauge.proto.id])
+
+
+SCENARIOS = [
+    ("analytics rerun", "📈 Analytics", _analytics),
+    ("predict", "📊 Prediction", _predict),
+    ("gauge rerun", "📊 Prediction", _gauge),
+]
+
+
+def measure(repeats=30):
+    results = {}
+    for name, page, step in SCENARIOS:
+        probe = RerunProbe()
+        probe.run()
+        probe.app.sidebar.radio[0].set_value(page)
+        probe.run()
+        step(probe, -1)  # first visit (and setup): imports and caches outside the measurement
+        timings.reset()
+        samples = [step(probe, i) for i in range(repeats)]
+        results[name] = {
+            "build_ms": _stage_ms(FIGURE_BUILD, repeats),
+            "render_ms": _stage_ms(FIGURE_RENDER, repeats),
+            "chart_bytes": int(statistics.median(sample["elements"].get("plotly_chart", 0) for sample in samples)),
+            "rerun_ms": statistics.median(sample["ms"] for sample in samples),
+            "bytes": int(statistics.median(sample["bytes"] for sample in samples)),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=30)
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--baseline", help="Previous --json results to show alongside")
+    args = parser.parse_args()
+
+    results = measure(args.repeats)
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else {}
+
+    print(f"{'':<26}{'build ms':>10}{'render ms':>11}{'chart bytes':>13}{'rerun ms':>10}{'bytes':>9}")
+    for name, entry in results.items():
+        for label, row in ((f"{name} (before)", baseline.get(name)), (name, entry)):
+            if row is None:
+                continue
+            print(f"{label:<26}{row['build_ms']:>10.2f}{row['render_ms']:>11.2f}{row['chart_bytes']:>13,}"
+                  f"{row['rerun_ms']:>10.1f}{row['bytes']:>9,}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
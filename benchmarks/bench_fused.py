@@ -0,0 +1,64 @@
+"""Microbenchmark: scaler.transform + model.predict vs the fused fast path.
+
+    python -m benchmarks.bench_fused [--iterations 2000]
+
+Asserts numeric parity on the benchmark rows before timing anything.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from wildfire.features import FEATURE_COLUMNS
+from wildfire.fused import check_parity
+from wildfire.predictor import FUSED_MAX_ROWS, Predictor
+
+
+def _per_call_us(fn, iterations):
+    fn()  # first call outside the timed loop
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--batch-rows", type=int, default=10000)
+    args = parser.parse_args()
+
+    predictor = Predictor.load()
+    if predictor.fused is None:
+        raise SystemExit("Fused fast path unavailable for this model")
+
+    rng = np.random.default_rng(42)
+    scaler = predictor.scaler
+    X = np.abs(rng.normal(scaler.mean_, scaler.scale_, size=(args.batch_rows, len(FEATURE_COLUMNS))))
+    max_error = check_parity(predictor.fused, predictor.predict_reference, X)
+
+    row = X[:1]
+    features = dict(zip(FEATURE_COLUMNS, row[0]))
+    slow_us = _per_call_us(lambda: predictor.predict_reference(row), args.iterations)
+    fast_us = _per_call_us(lambda: predictor.fused.predict(row), args.iterations)
+    one_us = _per_call_us(lambda: predictor.predict_one(features), args.iterations)
+
+    batch_iterations = max(args.iterations // 200, 3)
+    slow_batch = _per_call_us(lambda: predictor.predict_reference(X), batch_iterations)
+    fast_batch = _per_call_us(lambda: predictor.fused.predict(X), batch_iterations)
+    routed_batch = _per_call_us(lambda: predictor.predict_batch(X), batch_iterations)
+
+    print(f"parity: max abs error {max_error:.4g} acres over {len(X):,} rows")
+    print(f"{'path':<32}{'per call (us)':>16}")
+    print(f"{'scaler+model, 1 row':<32}{slow_us:>16.1f}")
+    print(f"{'fused, 1 row':<32}{fast_us:>16.1f}")
+    print(f"{'Predictor.predict_one':<32}{one_us:>16.1f}")
+    print(f"{f'scaler+model, {len(X):,} rows':<32}{slow_batch:>16.1f}")
+    print(f"{f'fused, {len(X):,} rows':<32}{fast_batch:>16.1f}")
+    print(f"{'Predictor.predict_batch':<32}{routed_batch:>16.1f}")
+    print(f"single-row speedup: {slow_us / fast_us:.1f}x "
+          f"(batches above {FUSED_MAX_ROWS} rows use the native path)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Microbenchmark: prediction intervals vs a plain prediction.
+
+    python -m benchmarks.bench_intervals [--rows 1 100 10000] [--trees 100]
+
+Times ``Predictor.predict_interval`` against ``predict_batch`` for both
+interval sources:
+
+* ``trees``: a Random Forest fitted on synthetic incidents, using the
+  spread of its trees. A per-tree Python loop over the sklearn estimators
+  is timed too, as the baseline the vectorized pass replaces.
+* ``quantile``: the bundled XGBoost model with lower/upper quantile
+  models fitted on the same synthetic incidents.
+
+Synthetic targets are the bundled model's predictions with log-normal
+noise, so the fitted models and intervals have realistic magnitudes.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from wildfire.intervals import fit_interval_models
+from wildfire.predictor import Predictor
+from wildfire.scenarios import synthetic_incidents
+
+
+def _per_call_us(fn, iterations):
+    fn()  # first call outside the timed loop
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def _iterations(rows):
+    return max(3, min(2000, 200000 // rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1, 100, 10000])
+    parser.add_argument("--trees", type=int, default=100, help="Trees in the synthetic forest")
+    parser.add_argument("--train-rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    from sklearn.ensemble import RandomForestRegressor
+
+    bundled = Predictor.load()
+    rng = np.random.default_rng(42)
+    X_train = synthetic_incidents(args.train_rows, seed=1)
+    y_train = np.clip(bundled.predict_batch(X_train), 1, None) * rng.lognormal(0, 0.75, args.train_rows)
+    scaled = bundled.scaler.transform(X_train)
+
+    forest = RandomForestRegressor(n_estimators=args.trees, min_samples_leaf=5, random_state=42, n_jobs=1)
+    forest_predictor = Predictor(forest.fit(scaled, y_train), bundled.scaler)
+    forest_predictor.compile()
+    bundled.interval_model = fit_interval_models(scaled, y_train)
+    bundled.compile()
+
+    def per_tree_loop(X):
+        frame_scaled = forest_predictor.scaler.transform(X)
+        leaves = np.stack([tree.predict(frame_scaled) for tree in forest.estimators_], axis=1)
+        return leaves.mean(axis=1), *np.quantile(leaves, (0.1, 0.9), axis=1)
+
+    print(f"{'source':<10}{'rows':>8}{'predict (us)':>15}{'interval (us)':>15}{'overhead':>10}{'tree loop (us)':>16}")
+    for rows in args.rows:
+        X = synthetic_incidents(rows, seed=2)
+        iterations = _iterations(rows)
+        for name, predictor in (("trees", forest_predictor), ("quantile", bundled)):
+            plain = _per_call_us(lambda: predictor.predict_batch(X), iterations)
+            interval = _per_call_us(lambda: predictor.predict_interval(X), iterations)
+            loop = ""
+            if name == "trees":
+                loop = f"{_per_call_us(lambda: per_tree_loop(X), max(3, iterations // 10)):>16.1f}"
+            print(f"{name:<10}{rows:>8,}{plain:>15.1f}{interval:>15.1f}{interval / plain:>9.1f}x{loop}")
+
+    X = synthetic_incidents(2000, seed=3)
+    point, lower, upper = forest_predictor.predict_interval(X)
+    assert np.allclose(point, forest_predictor.fused.predict(X)) and np.all(lower <= point) and np.all(point <= upper)
+    print(f"\nchecks: forest interval point == fused prediction, lower <= point <= upper "
+          f"(median width {np.median(upper - lower):,.0f} acres)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Server-side cost of Prediction page interactions: rerun time and bytes sent.
+
+    python -m benchmarks.bench_reruns [--repeats 20] [--json after.json]
+    python -m benchmarks.bench_reruns --baseline before.json   # side by side
+    python -m benchmarks.bench_reruns --full-reruns            # ignore fragments
+
+Drives app.py headlessly with Streamlit's AppTest. AppTest reruns the
+whole script for every interaction, so runs go through ``RerunProbe``.
+When the changed widget lives in an ``st.fragment``, the probe scopes the
+rerun to that fragment, as the browser does. Elements outside the
+fragment stay in place.
+
+Time is measured on the script thread, from script start to script
+finished. Bytes is the serialized size of the ForwardMsgs the run
+produces. A message of at least ``global.minCachedMessageSize`` that the
+browser already received is counted as the hash reference the server
+sends in its place.
+"""
+import argparse
+import dataclasses
+import json
+import statistics
+import time
+from pathlib import Path
+from unittest import mock
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+PAGE = "📊 Prediction"
+
+
+class RerunProbe:
+    """An AppTest session whose reruns can be scoped to one fragment and are measured."""
+
+    def __init__(self, script=APP_PATH, timeout=120):
+        from streamlit import config
+        from streamlit.testing.v1 import AppTest
+
+        self.app = AppTest.from_file(str(script), default_timeout=timeout)
+        self.min_cached_bytes = config.get_option("global.minCachedMessageSize")
+        self.fragments = {}
+        self._deltas = []
+        self._browser_hashes = set()
+        self._scope = None
+        self._events = []
+
+    def run(self, fragment_id=None):
+        """Rerun the app (or one fragment); returns {"ms", "bytes", "messages", "elements"}.
+
+        ``elements`` maps element types (``plotly_chart``, ``markdown``, ...)
+        to the bytes their messages took.
+        """
+        from streamlit.testing.v1 import app_test
+
+        self._scope = fragment_id
+        self._events = []
+        with mock.patch.object(app_test, "LocalScriptRunner", self._runner_class()):
+            self.app.run()
+        if self.app.exception:
+            raise RuntimeError(f"rerun raised: {self.app.exception[0].message}")
+        return self._measure()
+
+    def interact(self, action, full_rerun=False):
+        """Apply ``action(app)`` (which returns the changed widget) and rerun its fragment."""
+        widget = action(self.app)
+        return self.run(None if full_rerun else self.fragments.get(widget.id))
+
+    def _runner_class(self):
+        from streamlit.runtime.scriptrunner import ScriptRunnerEvent
+        from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequests
+        from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+        probe = self
+
+        class ProbeRunner(LocalScriptRunner):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                if probe._scope:
+                    # Drop the full rerun queued by ScriptRunner.__init__; it would
+                    # absorb the fragment-scoped request below
+                    self._requests = ScriptRequests()
+                # The browser still shows everything outside the rerun fragment
+                for msg in probe._deltas:
+                    if not probe._replaced(msg.delta.fragment_id, self._fragment_storage):
+                        self.forward_msg_queue.enqueue(msg)
+                self.on_event.connect(self._probe_event, weak=False)
+
+            def _probe_event(self, sender, event, **kwargs):
+                if event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG:
+                    probe._events.append(("msg", kwargs["forward_msg"]))
+                elif event in (ScriptRunnerEvent.SCRIPT_STARTED,
+                               ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+                               ScriptRunnerEvent.FRAGMENT_STOPPED_WITH_SUCCESS,
+                               ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR):
+                    probe._events.append(("time", time.perf_counter()))
+
+            def request_rerun(self, rerun_data):
+                if probe._scope:
+                    rerun_data = dataclasses.replace(rerun_data, fragment_id_queue=[probe._scope])
+                return super().request_rerun(rerun_data)
+
+            def join(self):
+                super().join()
+                probe._deltas = [msg for msg in self.forward_msgs() if msg.WhichOneof("type") == "delta"]
+
+        return ProbeRunner
+
+    def _replaced(self, fragment_id, storage):
+        """Whether elements of ``fragment_id`` are redrawn by the scoped rerun."""
+        if not self._scope or not fragment_id:
+            return False
+        return fragment_id == self._scope or storage.has_ancestor_in(fragment_id, {self._scope})
+
+    def _measure(self):
+        from streamlit.runtime.forward_msg_cache import create_reference_msg, populate_hash_if_needed
+
+        times = [value for kind, value in self._events if kind == "time"]
+        total = messages = 0
+        elements = {}
+        for kind, msg in self._events:
+            if kind != "msg":
+                continue
+            populate_hash_if_needed(msg)
+            size = msg.ByteSize()
+            if size >= self.min_cached_bytes:
+                if msg.hash in self._browser_hashes:
+                    size = create_reference_msg(msg).ByteSize()
+                self._browser_hashes.add(msg.hash)
+            total += size
+            messages += 1
+            delta = msg.delta if msg.WhichOneof("type") == "delta" else None
+            if delta is not None and delta.WhichOneof("type") == "new_element":
+                element = delta.new_element
+                element_type = element.WhichOneof("type")
+                elements[element_type] = elements.get(element_type, 0) + size
+                widget_id = getattr(getattr(element, element_type), "id", "")
+                if widget_id:
+                    self.fragments[widget_id] = delta.fragment_id or None
+        return {"ms": (times[-1] - times[0]) * 1000 if len(times) > 1 else 0.0,
+                "bytes": total, "messages": messages, "elements": elements}
+
+
+def _button(label):
+    def find(app):
+        return next(button for button in app.button if button.label == label)
+    return find
+
+
+def scenarios():
+    """(name, setup, action) per interaction; ``action(app, i)`` returns the changed widget."""
+    return [
+        ("edit Engines", None, lambda app, i: app.number_input(key="engines").set_value(5 + i % 2)),
+        ("slide Containment", None, lambda app, i: app.slider(key="containment").set_value(70.0 + 5 * (i % 2))),
+        ("click Predict", None, lambda app, i: _button("Predict Severity")(app).click()),
+        ("edit after Predict", lambda app: _button("Predict Severity")(app).click(),
+         lambda app, i: app.number_input(key="helicopters").set_value(3 + i % 2)),
+        ("what-if points", lambda app: app.toggle(key="whatif_enabled").set_value(True),
+         lambda app, i: app.slider(key="whatif_points").set_value(40 + 10 * (i % 2))),
+        ("optimizer cost", None, lambda app, i: app.number_input(key="optimizer_cost_Engines").set_value(5000 + 100 * (i % 2))),
+    ]
+
+
+def measure(repeats=20, full_reruns=False):
+    probe = RerunProbe()
+    probe.run()
+    probe.app.sidebar.radio[0].set_value(PAGE)
+    probe.run()
+    probe.run()  # second visit: page module imported, figures cached in the browser
+    results = {}
+    for name, setup, action in scenarios():
+        if setup is not None:
+            setup(probe.app)
+            probe.run(None)
+        samples = [probe.interact(lambda app: action(app, i), full_rerun=full_reruns)
+                   for i in range(repeats + 1)][1:]
+        times = sorted(sample["ms"] for sample in samples)
+        results[name] = {
+            "median_ms": statistics.median(times),
+            "p90_ms": times[int(0.9 * (len(times) - 1))],
+            "bytes": int(statistics.median(sample["bytes"] for sample in samples)),
+            "messages": int(statistics.median(sample["messages"] for sample in samples)),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--full-reruns", action="store_true",
+                        help="Rerun the whole app for every interaction, as without fragments")
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--baseline", help="Previous --json results to show alongside")
+    args = parser.parse_args()
+
+    results = measure(args.repeats, args.full_reruns)
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else {}
+
+    header = f"{'interaction':<22}{'median ms':>10}{'p90 ms':>9}{'bytes':>10}{'msgs':>6}"
+    if baseline:
+        header += f"{'before ms':>11}{'before bytes':>14}"
+    print(header)
+    for name, entry in results.items():
+        line = (f"{name:<22}{entry['median_ms']:>10.1f}{entry['p90_ms']:>9.1f}"
+                f"{entry['bytes']:>10,}{entry['messages']:>6}")
+        before = baseline.get(name)
+        if before:
+            line += f"{before['median_ms']:>11.1f}{before['bytes']:>14,}"
+        print(line)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Throughput of live incident ingest and re-scoring (wildfire.stream).
+
+    python -m benchmarks.bench_stream [--incidents 2000] [--updates 200000] [--repeat-share 0.3]
+
+Generates one full record per synthetic incident, then partial updates
+that move containment and resource counts the way hourly status reports
+do. ``--repeat-share`` of the updates resend the incident's current values
+and must not trigger a re-score. The same updates go through three paths:
+
+- ``apply``: pre-parsed dicts straight into ``IncidentStream.apply``
+- ``jsonl``: a file followed by ``StreamIngestor.tail``
+- ``tcp``: one local socket connection into ``StreamIngestor.serve``
+
+Each path reports updates/s and how many incidents were re-scored. It
+then checks that every incident's stored prediction equals a fresh
+``predict_batch`` of its final features.
+"""
+import argparse
+import json
+import os
+import socket
+import tempfile
+import time
+
+import numpy as np
+
+from wildfire.features import FEATURE_COLUMNS
+from wildfire.predictor import Predictor
+from wildfire.scenarios import synthetic_incidents
+from wildfire.stream import ID_FIELD, IncidentStream, StreamIngestor
+
+# Fields a status update may change, with the step size per update
+MOVING_FIELDS = {"PercentContained": 5, "PersonnelInvolved": 20, "Engines": 3,
+                 "Helicopters": 1, "Dozers": 1, "WaterTenders": 1}
+
+
+def make_updates(incidents, updates, repeat_share, seed=0):
+    rng = np.random.default_rng(seed)
+    state = synthetic_incidents(incidents, seed=seed)
+    records = [{ID_FIELD: f"INC-{row:05d}", **dict(zip(FEATURE_COLUMNS, values.tolist()))}
+               for row, values in enumerate(state)]
+    moving = [FEATURE_COLUMNS.index(col) for col in MOVING_FIELDS]
+    steps = np.array(list(MOVING_FIELDS.values()), dtype=np.float64)
+    for _ in range(updates):
+        row = int(rng.integers(incidents))
+        fields = rng.choice(len(moving), size=int(rng.integers(1, 3)), replace=False)
+        if rng.random() >= repeat_share:
+            for field in fields:
+                pos = moving[field]
+                state[row, pos] = max(0.0, state[row, pos] + steps[field] * rng.choice((-1, 1)))
+            state[row, FEATURE_COLUMNS.index("PercentContained")] = min(
+                100.0, state[row, FEATURE_COLUMNS.index("PercentContained")])
+        update = {ID_FIELD: f"INC-{row:05d}"}
+        update.update({FEATURE_COLUMNS[moving[field]]: float(state[row, moving[field]]) for field in fields})
+        records.append(update)
+    return records, state
+
+
+def _wait(ingestor, total, timeout=300):
+    deadline = time.monotonic() + timeout
+    while ingestor.lines < total and time.monotonic() < deadline:
+        time.sleep(0.005)
+    ingestor.flush()
+
+
+def _check(stream, predictor, state):
+    frame = stream.frame()
+    expected = predictor.predict_batch(state)
+    actual = frame.loc[[f"INC-{row:05d}" for row in range(len(state))], "PredictedAcres"].to_numpy()
+    return float(np.abs(actual - expected).max())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--incidents", type=int, default=2000)
+    parser.add_argument("--updates", type=int, default=200000)
+    parser.add_argument("--repeat-share", type=float, default=0.3)
+    args = parser.parse_args()
+
+    predictor = Predictor.load()
+    predictor.compile()
+    records, state = make_updates(args.incidents, args.updates, args.repeat_share)
+    lines = [json.dumps(record) for record in records]
+    payload = ("\n".join(lines) + "\n").encode()
+    total = len(records)
+    print(f"{total:,} updates for {args.incidents:,} incidents ({len(payload) / 1e6:.1f} MB of JSON)\n")
+    print(f"{'path':<8}{'seconds':>9}{'updates/s':>12}{'re-scored':>11}{'unchanged':>11}{'batches':>9}{'max err':>10}")
+
+    def report(name, stream, seconds):
+        stats = stream.stats()
+        error = _check(stream, predictor, state)
+        print(f"{name:<8}{seconds:>9.2f}{total / seconds:>12,.0f}{stats['rescored']:>11,}"
+              f"{stats['unchanged']:>11,}{stats['batches']:>9,}{error:>10.2g}")
+
+    stream = IncidentStream(lambda: predictor)
+    start = time.perf_counter()
+    for offset in range(0, total, 4096):
+        stream.apply(records[offset:offset + 4096])
+    report("apply", stream, time.perf_counter() - start)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "updates.jsonl")
+        with open(path, "wb") as handle:
+            handle.write(payload)
+        ingestor = StreamIngestor(IncidentStream(lambda: predictor))
+        start = time.perf_counter()
+        ingestor.tail(path, from_start=True)
+        _wait(ingestor, total)
+        report("jsonl", ingestor.stream, time.perf_counter() - start)
+        ingestor.stop()
+
+    ingestor = StreamIngestor(IncidentStream(lambda: predictor))
+    port = ingestor.serve(port=0)
+    start = time.perf_counter()
+    with socket.create_connection(("127.0.0.1", port)) as conn:
+        conn.sendall(payload)
+    _wait(ingestor, total)
+    report("tcp", ingestor.stream, time.perf_counter() - start)
+    ingestor.stop()
+
+
+if __name__ == "__main__":
+    main()
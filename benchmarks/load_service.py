@@ -0,0 +1,140 @@
+"""Load test for the micro-batching scoring service.
+
+    python -m benchmarks.load_service --concurrency 64 --requests 5000
+    python -m benchmarks.load_service --target 127.0.0.1:8765   # running service
+
+Without ``--target`` an in-process service is started on an ephemeral port
+with the given batching options. Each simulated client holds one keep-alive
+connection and sends its share of requests back to back. The script prints
+client-side latency and throughput plus the server's /metrics counters.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+
+from wildfire.features import FEATURE_COLUMNS
+from wildfire.metrics import percentile
+from wildfire.service import (DEFAULT_MAX_BATCH, DEFAULT_MAX_QUEUE, DEFAULT_WINDOW_MS,
+                              create_service)
+
+
+def _random_incident(rng):
+    return dict(zip(FEATURE_COLUMNS, [
+        rng.randint(0, 57), rng.uniform(32.5, 42.0), rng.uniform(-124.5, -114.0),
+        rng.choice([0, 10, 30, 50, 75, 95, 100]), rng.randint(0, 500), rng.randint(0, 75),
+        rng.randint(0, 15), rng.randint(0, 10), rng.randint(0, 20), rng.randint(0, 1),
+    ]))
+
+
+async def _request(reader, writer, host, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+                  f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+                  ).encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def _client(host, port, n_requests, rows_per_request, seed, latencies, statuses):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(n_requests):
+            incidents = [_random_incident(rng) for _ in range(rows_per_request)]
+            payload = incidents[0] if rows_per_request == 1 else incidents
+            started = time.perf_counter()
+            status, _ = await _request(reader, writer, host, "POST", "/predict", payload)
+            latencies.append(time.perf_counter() - started)
+            statuses[status] += 1
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, concurrency, n_requests, rows_per_request):
+    latencies, statuses = [], Counter()
+    # The first n_requests % clients clients send one extra request
+    clients = max(min(concurrency, n_requests), 1)
+    per_client, extra = divmod(n_requests, clients)
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        _client(host, port, per_client + (seed < extra), rows_per_request, seed, latencies, statuses)
+        for seed in range(clients)
+    ])
+    elapsed = time.perf_counter() - started
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, server_metrics = await _request(reader, writer, host, "GET", "/metrics")
+    writer.close()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "statuses": dict(statuses),
+        "elapsed_s": elapsed,
+        "requests_per_s": len(latencies) / elapsed,
+        "rows_per_s": len(latencies) * rows_per_request / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "server": server_metrics,
+    }
+
+
+async def _main(args):
+    service = None
+    if args.target:
+        host, _, port = args.target.partition(":")
+        port = int(port)
+    else:
+        from wildfire.predictor import Predictor, latest_model_dir
+
+        service = create_service(Predictor.load(latest_model_dir()), port=0, window_ms=args.window_ms,
+                                 max_batch=args.max_batch, max_queue=args.max_queue)
+        await service.start()
+        host, port = service.host, service.port
+    try:
+        return await run_load(host, port, args.concurrency, args.requests, args.rows_per_request)
+    finally:
+        if service is not None:
+            await service.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the wildfire scoring service")
+    parser.add_argument("--target", help="host:port of a running service (default: in-process)")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rows-per-request", type=int, default=1)
+    parser.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW_MS)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    parser.add_argument("--max-queue", type=int, default=DEFAULT_MAX_QUEUE)
+    parser.add_argument("--json", action="store_true", help="Print the raw result as JSON")
+    args = parser.parse_args()
+
+    result = asyncio.run(_main(args))
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    server = result["server"]
+    print(f"requests: {result['requests']:,}  statuses: {result['statuses']}")
+    print(f"client:   {result['requests_per_s']:,.0f} req/s  {result['rows_per_s']:,.0f} rows/s  "
+          f"p50 {result['p50_ms']:.2f} ms  p99 {result['p99_ms']:.2f} ms")
+    print(f"server:   p50 {server['p50_ms']:.2f} ms  p99 {server['p99_ms']:.2f} ms  "
+          f"batches {server['batches']:,}  mean batch {server['mean_batch_rows']:.1f} rows  "
+          f"rejected {server['rejected']:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Load test: many concurrent Streamlit sessions on the Prediction page.
+
+    python -m benchmarks.load_sessions [--sessions 8] [--interactions 20] [--json after.json]
+    python -m benchmarks.load_sessions --workers 0 --json direct.json   # no executor
+    python -m benchmarks.load_sessions --baseline direct.json           # side by side
+
+Each session is an AppTest of app.py running on its own thread, as
+Streamlit runs each browser session's script on its own thread. Every
+session opens the Prediction page and turns on a two-input What-If sweep.
+After that, each interaction enters new incident values and clicks
+Predict Severity. The full rerun then scores one row (plus its interval
+and contributions) and a ``--points`` x ``--points`` grid, and the inputs
+never repeat, so no prediction comes from a cache.
+
+``--workers``, ``--threads``, ``--max-queue`` and ``--timeout`` configure
+the shared inference executor (``wildfire.executor``) through its
+environment variables. ``--workers 0`` calls the model directly on every
+session thread, as before the executor. The report gives interactions/s
+over all sessions, rerun latency percentiles as seen by a session, and
+the executor's queue wait, rejections and timeouts. A rerun counts as
+turned away when the page shows the model-busy warning instead of a
+result.
+
+AppTest is built for one session at a time: every run installs a fresh
+mock Runtime singleton, compiles the script and patches the config, then
+clears the singleton again, so overlapping runs break each other.
+``shared_runtime`` installs those once for the whole test instead. All
+sessions then share one runtime and one script cache, like the sessions
+of one Streamlit server.
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+from wildfire.executor import QUEUE_ENV_VAR, THREADS_ENV_VAR, TIMEOUT_ENV_VAR, WORKERS_ENV_VAR
+from wildfire.metrics import percentile
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+PAGE = "📊 Prediction"
+
+# Seconds AppTest waits for one rerun before failing the session
+RUN_TIMEOUT_SECONDS = 300
+
+# Text of the warning shown when the executor turns a call away
+BUSY_TEXT = "busy with other sessions"
+
+
+@contextlib.contextmanager
+def shared_runtime():
+    """One mock Runtime, script cache and config patch for every concurrent AppTest run."""
+    from streamlit.runtime import Runtime
+    from streamlit.testing.v1 import app_test, local_script_runner
+    from streamlit.testing.v1.util import patch_config_options
+
+    runtime = mock.MagicMock(spec=Runtime)
+    runtime.media_file_mgr = app_test.MediaFileManager(app_test.MemoryMediaFileStorage("/mock/media"))
+    runtime.dataframe_source_mgr = app_test.DataframeSourceManager()
+    runtime.cache_storage_manager = app_test.MemoryCacheStorageManager()
+    runtime.bidi_component_registry = app_test.BidiComponentManager()
+    runtime.bidi_component_registry.discover_and_register_components(start_file_watching=False)
+    script_cache = app_test.ScriptCache()
+    # Compiled once up front: concurrent ast.parse calls can fail on Python 3.11
+    script_cache.get_bytecode(str(APP_PATH))
+
+    Runtime._instance = runtime
+    try:
+        # Runs now set and clear a stand-in instead of the real singleton
+        with mock.patch.object(app_test, "Runtime", type("Runtime", (), {"_instance": None})), \
+                mock.patch.object(app_test, "ScriptCache", lambda: script_cache), \
+                mock.patch.object(local_script_runner, "ScriptCache", lambda: script_cache), \
+                mock.patch.object(app_test, "patch_config_options", lambda options: contextlib.nullcontext()), \
+                patch_config_options({"global.appTest": True}):
+            yield
+    finally:
+        Runtime._instance = None
+
+
+def _predict_button(app):
+    return next(button for button in app.button if button.label == "Predict Severity")
+
+
+def _session(seed, args, ready, start, results):
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    app = AppTest.from_file(str(APP_PATH), default_timeout=RUN_TIMEOUT_SECONDS)
+    try:
+        app.run()
+        app.sidebar.radio[0].set_value(PAGE).run()
+        app.toggle(key="whatif_enabled").set_value(True).run()
+        app.multiselect(key="whatif_features").set_value(["Helicopters", "Engines"]).run()
+        app.slider(key="whatif_points").set_value(args.points).run()
+    except BaseException:
+        # Release the other sessions instead of leaving them at the barrier
+        ready.abort()
+        raise
+    ready.wait()
+    start.wait()
+
+    latencies, busy, errors = [], 0, 0
+    for _ in range(args.interactions):
+        app.slider(key="containment").set_value(float(rng.randrange(0, 101, 5)))
+        app.number_input(key="personnel").set_value(rng.randint(0, 500))
+        app.number_input(key="engines").set_value(rng.randint(0, 75))
+        _predict_button(app).click()
+        started = time.perf_counter()
+        app.run()
+        latencies.append(time.perf_counter() - started)
+        if app.exception:
+            errors += 1
+        elif any(BUSY_TEXT in str(warning.value) for warning in app.warning):
+            busy += 1
+    results[seed] = {"latencies": latencies, "busy": busy, "errors": errors}
+
+
+def run_load(args):
+    """Run every session's interactions at once; returns throughput, latency and executor stats."""
+    from wildfire.executor import shared_executor
+
+    results = {}
+    ready = threading.Barrier(args.sessions + 1)
+    start = threading.Barrier(args.sessions + 1)
+    threads = [threading.Thread(target=_session, args=(seed, args, ready, start, results), daemon=True)
+               for seed in range(args.sessions)]
+    with shared_runtime():
+        for thread in threads:
+            thread.start()
+        # Sessions are set up, the model loaded and warmed; reset counters and go
+        ready.wait()
+        executor = shared_executor()
+        executor.latency.reset()
+        executor.wait.reset()
+        started = time.perf_counter()
+        start.wait()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(value for result in results.values() for value in result["latencies"])
+    stats = executor.stats()
+    return {
+        "sessions": args.sessions,
+        "workers": stats["workers"],
+        "threads": stats["threads"],
+        "interactions": len(latencies),
+        "elapsed_s": elapsed,
+        "interactions_per_s": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+        "busy": sum(result["busy"] for result in results.values()),
+        "errors": sum(result["errors"] for result in results.values()),
+        "executor": {key: stats[key] for key in ("count", "p50_ms", "p99_ms", "wait_p50_ms", "wait_p99_ms",
+                                                 "rejected", "timed_out")},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--interactions", type=int, default=20, help="Predict clicks per session")
+    parser.add_argument("--points", type=int, default=100, help="What-If grid points per input")
+    parser.add_argument("--workers", type=int, help="Executor workers (default: one per core; 0 = no executor)")
+    parser.add_argument("--threads", type=int, default=1, help="Native threads per worker")
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds per inference call")
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--baseline", help="Previous --json results to show alongside")
+    args = parser.parse_args()
+
+    # Read by shared_executor() on the first app run
+    if args.workers is not None:
+        os.environ[WORKERS_ENV_VAR] = str(args.workers)
+    os.environ[THREADS_ENV_VAR] = str(args.threads)
+    os.environ[QUEUE_ENV_VAR] = str(args.max_queue)
+    os.environ[TIMEOUT_ENV_VAR] = str(args.timeout)
+
+    result = run_load(args)
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+
+    print(f"{'':<14}{'workers':>8}{'int/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'busy':>6}{'errors':>7}")
+    for name, entry in (("baseline", baseline), ("this run", result)):
+        if entry is None:
+            continue
+        print(f"{name:<14}{entry['workers']:>8}{entry['interactions_per_s']:>8.2f}{entry['p50_ms']:>9.0f}"
+              f"{entry['p95_ms']:>9.0f}{entry['p99_ms']:>9.0f}{entry['max_ms']:>9.0f}{entry['busy']:>6}{entry['errors']:>7}")
+    executor = result["executor"]
+    if result["workers"]:
+        print(f"\nexecutor: {executor['count']:,} calls  p50 {executor['p50_ms']:.1f} ms  p99 {executor['p99_ms']:.1f} ms  "
+              f"queue wait p50 {executor['wait_p50_ms']:.1f} ms  p99 {executor['wait_p99_ms']:.1f} ms  "
+              f"rejected {executor['rejected']:,}  timed out {executor['timed_out']:,}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Import-time and rerun-time report for the Streamlit app.
+
+    python -m benchmarks.startup_report [--reruns 10] [--json report.json]
+    python -m benchmarks.startup_report --baseline report.json   # flag regressions
+
+Import times are measured in fresh interpreters with streamlit already
+imported (every rerun has it). Each entry lists the heavy libraries it
+pulled in. Rerun times come from driving app.py with Streamlit's AppTest:
+a cold first run (model load and warm-up), then ``--reruns`` reruns of each
+page. With ``--baseline``, any median that grows by more than
+``--tolerance`` is reported and the script exits with status 1.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+IMPORT_TARGETS = [
+    "views.theme", "views.home", "views.about", "views.prediction", "views.riskmap", "views.analytics",
+    "views.live",
+    "wildfire.predictor", "wildfire.cache", "wildfire.scenarios", "wildfire.stream", "wildfire.executor",
+]
+HEAVY_MODULES = ["pandas", "plotly", "xgboost", "sklearn", "joblib", "numpy"]
+
+_IMPORT_PROBE = """
+import json, sys, time
+import streamlit
+before = set(sys.modules)
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+new = set(sys.modules) - before
+print(json.dumps({{"ms": elapsed * 1000,
+                   "heavy": sorted(m for m in {heavy!r} if m in new)}}))
+"""
+
+
+def measure_imports(repeats=3):
+    results = {}
+    for module in IMPORT_TARGETS:
+        runs = []
+        for _ in range(repeats):
+            out = subprocess.run(
+                [sys.executable, "-c", _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                capture_output=True, text=True, check=True, cwd=APP_PATH.parent,
+            ).stdout
+            runs.append(json.loads(out.strip().splitlines()[-1]))
+        results[module] = {
+            "import_ms": statistics.median(run["ms"] for run in runs),
+            "heavy": runs[-1]["heavy"],
+        }
+    return results
+
+
+def measure_reruns(reruns=10):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=120)
+    start = time.perf_counter()
+    at.run()
+    results = {"cold_start": {"median_ms": (time.perf_counter() - start) * 1000}}
+
+    for page in at.sidebar.radio[0].options:
+        at.sidebar.radio[0].set_value(page).run()  # first visit imports the page module
+        samples = []
+        for _ in range(reruns):
+            start = time.perf_counter()
+            at.run()
+            samples.append((time.perf_counter() - start) * 1000)
+        if at.exception:
+            raise RuntimeError(f"{page} raised: {at.exception}")
+        samples.sort()
+        results[page] = {
+            "median_ms": statistics.median(samples),
+            "p90_ms": samples[int(0.9 * (len(samples) - 1))],
+        }
+    return results
+
+
+def compare(report, baseline, tolerance):
+    """Return human-readable regressions of ``report`` against ``baseline``."""
+    regressions = []
+    for section, key in (("imports", "import_ms"), ("reruns", "median_ms")):
+        for name, entry in report[section].items():
+            before = baseline.get(section, {}).get(name, {}).get(key)
+            if before and entry[key] > before * (1 + tolerance):
+                regressions.append(f"{section}/{name}: {before:.1f} ms -> {entry[key]:.1f} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report app import and rerun times")
+    parser.add_argument("--reruns", type=int, default=10)
+    parser.add_argument("--json", help="Write the report to this file")
+    parser.add_argument("--baseline", help="Previous --json report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown before flagging (default 0.25)")
+    args = parser.parse_args()
+
+    report = {"imports": measure_imports(), "reruns": measure_reruns(args.reruns)}
+
+    print(f"{'module':<24}{'import ms':>10}  heavy dependencies")
+    for module, entry in report["imports"].items():
+        print(f"{module:<24}{entry['import_ms']:>10.1f}  {', '.join(entry['heavy']) or '-'}")
+    print()
+    print(f"{'rerun':<24}{'median ms':>10}{'p90 ms':>10}")
+    for page, entry in report["reruns"].items():
+        print(f"{page:<24}{entry['median_ms']:>10.1f}{entry.get('p90_ms', entry['median_ms']):>10.1f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        regressions = compare(report, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""Inference benchmark suite for the model and scaler pickles.
+
+    python -m benchmarks.suite [--max-rows 1000000] [--json baseline.json]
+    python -m benchmarks.suite --baseline baseline.json   # flag regressions
+
+Every measurement scores synthetic incidents from
+``wildfire.scenarios.synthetic_incidents``, which stay within the ranges of
+the demo scenarios (see ``feature_ranges``). The suite reports:
+
+- load: cold import + load in a fresh interpreter, for the plain pickle
+  path and for the fused path (which adds the parity check)
+- single_row: p50/p99 of one-row calls through the reference pipeline
+  (DataFrame, scaler.transform, model.predict), predict_batch and
+  predict_one without a cache
+- batch: rows/s and tracemalloc peak for 1 to ``--max-rows`` rows, for
+  the reference pipeline and for predict_batch
+- peak_rss_mb: the process high-water mark once everything has run
+
+With ``--baseline``, any timing that gets slower by more than
+``--tolerance``, or any throughput that drops by that much, is reported
+and the script exits with status 1.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+_LOAD_PROBE = """
+import json, time
+start = time.perf_counter()
+from wildfire.predictor import Predictor
+import joblib, numpy, sklearn, xgboost
+imported = time.perf_counter()
+predictor = Predictor.load(fused={fused})
+loaded = time.perf_counter()
+print(json.dumps({{"import_ms": (imported - start) * 1000, "load_ms": (loaded - imported) * 1000}}))
+"""
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def measure_load(repeats=3):
+    results = {}
+    for name, fused in (("pickle", False), ("fused", True)):
+        runs = []
+        for _ in range(repeats):
+            out = subprocess.run([sys.executable, "-c", _LOAD_PROBE.format(fused=fused)],
+                                 capture_output=True, text=True, check=True, cwd=ROOT).stdout
+            runs.append(json.loads(out.strip().splitlines()[-1]))
+        results[name] = {key: statistics.median(run[key] for run in runs)
+                         for key in ("import_ms", "load_ms")}
+    return results
+
+
+def _latencies_us(fn, iterations):
+    fn()  # first call outside the timed loop
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return {
+        "p50_us": samples[len(samples) // 2],
+        "p99_us": samples[min(len(samples) - 1, int(0.99 * len(samples)))],
+    }
+
+
+def measure_single_row(predictor, X, iterations):
+    from wildfire.features import FEATURE_COLUMNS
+
+    row = X[:1]
+    features = dict(zip(FEATURE_COLUMNS, row[0]))
+    return {
+        "reference": _latencies_us(lambda: predictor.predict_reference(row), iterations),
+        "predict_batch": _latencies_us(lambda: predictor.predict_batch(row), iterations),
+        "predict_one": _latencies_us(lambda: predictor.predict_one(features), iterations),
+    }
+
+
+def batch_sizes(max_rows):
+    sizes, n = [], 1
+    while n <= max_rows:
+        sizes.append(n)
+        n *= 10
+    return sizes
+
+
+def measure_batches(predictor, X, max_rows, budget_s=1.0):
+    """Throughput and peak traced memory per batch size.
+
+    Each size repeats until ``budget_s`` of work (at least once). Peak
+    memory comes from a separate traced call, so tracing cost does not
+    skew the timings.
+    """
+    results = {}
+    for name, fn in (("reference", predictor.predict_reference), ("predict_batch", predictor.predict_batch)):
+        results[name] = {}
+        for n in batch_sizes(max_rows):
+            rows = X[:n]
+            fn(rows)
+            calls, start = 0, time.perf_counter()
+            while True:
+                fn(rows)
+                calls += 1
+                elapsed = time.perf_counter() - start
+                if elapsed >= budget_s or (n >= 100_000 and calls >= 3):
+                    break
+
+            tracemalloc.start()
+            fn(rows)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            results[name][str(n)] = {
+                "ms_per_call": elapsed / calls * 1000,
+                "rows_per_s": n * calls / elapsed,
+                "peak_traced_mb": peak / 2**20,
+            }
+    return results
+
+
+def environment():
+    import numpy
+    import sklearn
+    import xgboost
+
+    from wildfire.predictor import artifact_version
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "sklearn": sklearn.__version__,
+        "xgboost": xgboost.__version__,
+        "model_version": artifact_version(),
+    }
+
+
+def compare(report, baseline, tolerance):
+    """Return human-readable regressions of ``report`` against ``baseline``."""
+    regressions = []
+
+    def check(label, now, before, higher_is_better=False):
+        if not before:
+            return
+        worse = now < before * (1 - tolerance) if higher_is_better else now > before * (1 + tolerance)
+        if worse:
+            regressions.append(f"{label}: {before:,.2f} -> {now:,.2f}")
+
+    for name, entry in report["load"].items():
+        check(f"load/{name} load_ms", entry["load_ms"], baseline.get("load", {}).get(name, {}).get("load_ms"))
+    for name, entry in report["single_row"].items():
+        check(f"single_row/{name} p50_us", entry["p50_us"],
+              baseline.get("single_row", {}).get(name, {}).get("p50_us"))
+    for name, sizes in report["batch"].items():
+        for n, entry in sizes.items():
+            before = baseline.get("batch", {}).get(name, {}).get(n, {})
+            check(f"batch/{name}/{n} rows_per_s", entry["rows_per_s"], before.get("rows_per_s"),
+                  higher_is_better=True)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark model loading, latency, throughput and memory")
+    parser.add_argument("--max-rows", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=2000, help="Single-row calls per path")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write the report to this file")
+    parser.add_argument("--baseline", help="Previous --json report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown before flagging (default 0.25)")
+    args = parser.parse_args()
+
+    from wildfire.predictor import Predictor
+    from wildfire.scenarios import synthetic_incidents
+
+    X = synthetic_incidents(args.max_rows, seed=args.seed)
+    predictor = Predictor.load()
+
+    report = {
+        "environment": environment(),
+        "load": measure_load(),
+        "single_row": measure_single_row(predictor, X, args.iterations),
+        "batch": measure_batches(predictor, X, args.max_rows),
+    }
+    # ru_maxrss is in kB on Linux
+    report["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(f"model {report['environment']['model_version']} • {report['environment']['cpus']} CPUs")
+    print(f"\n{'load':<16}{'import ms':>12}{'load ms':>10}")
+    for name, entry in report["load"].items():
+        print(f"{name:<16}{entry['import_ms']:>12.1f}{entry['load_ms']:>10.1f}")
+    print(f"\n{'single row':<16}{'p50 µs':>12}{'p99 µs':>10}")
+    for name, entry in report["single_row"].items():
+        print(f"{name:<16}{entry['p50_us']:>12.1f}{entry['p99_us']:>10.1f}")
+    for name, sizes in report["batch"].items():
+        print(f"\n{name:<16}{'ms/call':>12}{'rows/s':>14}{'peak MB':>10}")
+        for n, entry in sizes.items():
+            print(f"{int(n):<16,}{entry['ms_per_call']:>12.3f}{entry['rows_per_s']:>14,.0f}"
+                  f"{entry['peak_traced_mb']:>10.1f}")
+    print(f"\npeak RSS {report['peak_rss_mb']:.0f} MB")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        regressions = compare(report, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
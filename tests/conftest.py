@@ -0,0 +1,77 @@
+"""Shared fixtures: the bundled model and small models fitted on synthetic incidents."""
+import warnings
+
+import pytest
+
+from wildfire.predictor import Predictor
+from wildfire.scenarios import synthetic_incidents
+
+
+@pytest.fixture(scope="session")
+def incidents():
+    return synthetic_incidents(500, seed=1)
+
+
+@pytest.fixture(scope="session")
+def bundled():
+    """The repo's XGBoost pickles, compiled."""
+    with warnings.catch_warnings():
+        # The pickles were written by older sklearn/xgboost releases
+        warnings.simplefilter("ignore")
+        return Predictor.load()
+
+
+@pytest.fixture(scope="session")
+def fit_predictor(bundled, incidents):
+    """Return a compiled Predictor around ``model`` fitted to the bundled model's predictions."""
+    def fit(model):
+        scaler = bundled.scaler
+        model.fit(scaler.transform(incidents), bundled.predict_batch(incidents))
+        predictor = Predictor(model, scaler, version=type(model).__name__)
+        assert predictor.compile()
+        return predictor
+    return fit
+
+
+@pytest.fixture(scope="session")
+def write_labeled_incidents():
+    """Return ``write(path, n, seed, shuffle_labels=False)`` for raw incident CSVs.
+
+    AcresBurned follows the resources and containment, unless the labels
+    are shuffled.
+    """
+    import numpy as np
+    import pandas as pd
+
+    def write(path, n, seed, shuffle_labels=False):
+        rng = np.random.default_rng(seed)
+        frame = pd.DataFrame({
+            "Counties": rng.choice(["Butte", "Fresno", "Kern", "Los Angeles", "Riverside", "Shasta"], n),
+            "Latitude": rng.uniform(32.5, 42, n),
+            "Longitude": rng.uniform(-124, -114, n),
+            "PercentContained": rng.uniform(0, 100, n).round(),
+            "PersonnelInvolved": rng.integers(0, 2000, n),
+            "Engines": rng.integers(0, 200, n),
+            "Helicopters": rng.integers(0, 20, n),
+            "Dozers": rng.integers(0, 40, n),
+            "WaterTenders": rng.integers(0, 30, n),
+            "MajorIncident": rng.random(n) < 0.3,
+        })
+        acres = (5 * frame["PersonnelInvolved"] + 40 * frame["Engines"]
+                 + 2000 * frame["MajorIncident"] - 10 * frame["PercentContained"] + 1000)
+        if shuffle_labels:
+            acres = rng.permutation(acres.to_numpy()) * 5
+        frame.insert(0, "AcresBurned", acres)
+        frame.to_csv(path, index=False)
+        return path
+    return write
+
+
+@pytest.fixture
+def trained_base(tmp_path, write_labeled_incidents):
+    """A repo-like directory whose artifacts/LATEST is an XGBoost trained on 600 incidents."""
+    from wildfire.training import train
+
+    train(write_labeled_incidents(tmp_path / "history.csv", 600, seed=0), tmp_path / "artifacts",
+          jobs=1, names=["XGBoost"])
+    return tmp_path
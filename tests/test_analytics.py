@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from wildfire import analytics
+
+
+def incidents(n, seed, counties=("Butte", "Fresno", "Kern")):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "AcresBurned": np.where(rng.random(n) < 0.1, np.nan, rng.lognormal(6, 2.5, n).round()),
+        "Counties": rng.choice(counties, n),
+        "Latitude": rng.uniform(32.5, 42, n),
+        "Longitude": rng.uniform(-124, -114, n),
+        "PercentContained": rng.uniform(0, 100, n).round(),
+        "PersonnelInvolved": np.where(rng.random(n) < 0.5, np.nan, rng.integers(0, 2000, n)),
+        "Engines": rng.integers(0, 200, n),
+        "Helicopters": rng.integers(0, 20, n),
+        "Dozers": rng.integers(0, 40, n),
+        "WaterTenders": rng.integers(0, 30, n),
+        "MajorIncident": rng.random(n) < 0.3,
+        "Name": [f"Fire {i}" for i in range(n)],
+    })
+
+
+def flatten(value, prefix=""):
+    if isinstance(value, dict):
+        return {key: leaf for name, item in value.items() for key, leaf in flatten(item, f"{prefix}/{name}").items()}
+    return {prefix: value}
+
+
+def assert_same_store(store, expected_store):
+    meta, expected = analytics.read_meta(store), analytics.read_meta(expected_store)
+    assert meta["counties"] == expected["counties"]
+    assert meta["source"]["bytes"] == expected["source"]["bytes"]
+    assert flatten(meta["aggregates"]) == pytest.approx(flatten(expected["aggregates"]))
+    for column in analytics.DATASET_COLUMNS:
+        np.testing.assert_array_equal(analytics.read_column(column, store),
+                                      analytics.read_column(column, expected_store))
+
+
+@pytest.fixture
+def small_parts(monkeypatch):
+    monkeypatch.setattr(analytics, "PART_ROWS", 64)
+
+
+def test_refresh_matches_a_full_rebuild(tmp_path, small_parts):
+    csv = tmp_path / "incidents.csv"
+    incidents(300, seed=0).to_csv(csv, index=False)
+    analytics.ingest(csv, tmp_path / "store")
+
+    # New rows, including a county the store has not seen
+    incidents(150, seed=1, counties=("Kern", "Shasta")).to_csv(csv, mode="a", header=False, index=False)
+    meta = analytics.refresh(tmp_path / "store")
+    assert meta["last_ingest"]["rows"] == 150
+    assert meta["aggregates"]["rows"] == 450
+    assert meta["counties"][-1] == "Shasta"
+
+    analytics.ingest(csv, tmp_path / "rebuilt")
+    assert_same_store(tmp_path / "store", tmp_path / "rebuilt")
+
+
+def test_unchanged_source_reads_nothing(tmp_path):
+    csv = tmp_path / "incidents.csv"
+    incidents(100, seed=0).to_csv(csv, index=False)
+    analytics.ingest(csv, tmp_path / "store")
+    meta = analytics.refresh(tmp_path / "store")
+    assert meta["last_ingest"]["rows"] == 0
+    assert meta["aggregates"]["rows"] == 100
+
+
+def test_shrunk_source_is_rebuilt(tmp_path, small_parts):
+    csv = tmp_path / "incidents.csv"
+    incidents(300, seed=0).to_csv(csv, index=False)
+    analytics.ingest(csv, tmp_path / "store")
+
+    incidents(80, seed=2).to_csv(csv, index=False)
+    meta = analytics.refresh(tmp_path / "store")
+    assert meta["aggregates"]["rows"] == 80
+    analytics.ingest(csv, tmp_path / "rebuilt")
+    assert_same_store(tmp_path / "store", tmp_path / "rebuilt")
+
+
+def test_refresh_needs_a_store(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        analytics.refresh(tmp_path / "missing")
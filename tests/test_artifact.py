@@ -0,0 +1,50 @@
+import json
+
+import numpy as np
+import pytest
+
+from wildfire.artifact import export_artifact, load_artifact, read_header
+from wildfire.predictor import Predictor
+
+
+def test_round_trip_predicts_the_same(bundled, incidents, tmp_path):
+    path = tmp_path / "model.wfm"
+    header = export_artifact(bundled, path)
+    mapped = Predictor.load_mapped(path)
+
+    assert read_header(path)["params"] == header["params"]
+    assert mapped.version == bundled.version
+    assert mapped.model_dir == tmp_path
+    np.testing.assert_array_equal(mapped.predict_batch(incidents), bundled.fused.predict(incidents))
+    np.testing.assert_allclose(mapped.scaler.mean_, bundled.scaler.mean_)
+    np.testing.assert_allclose(mapped.scaler.scale_, bundled.scaler.scale_)
+
+
+def test_arrays_are_read_only_views(bundled, tmp_path):
+    export_artifact(bundled, tmp_path / "model.wfm")
+    fused, _, _ = load_artifact(tmp_path / "model.wfm")
+    assert not fused.threshold.flags.writeable
+
+
+def test_files_without_node_values_disable_path_contributions(bundled, tmp_path):
+    path = tmp_path / "model.wfm"
+    export_artifact(bundled, path)
+    header = read_header(path)
+    # Rewrite the header as written before node_values was recorded, same length
+    encoded = json.dumps(header).encode()
+    header["params"].pop("node_values")
+    legacy = json.dumps(header).encode().ljust(len(encoded))
+    data = bytearray(path.read_bytes())
+    start = data.index(encoded)
+    data[start:start + len(encoded)] = legacy
+    path.write_bytes(bytes(data))
+
+    fused, _, _ = load_artifact(path)
+    assert not fused.node_values
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "model.wfm"
+    path.write_bytes(b"NOPE" + bytes(60))
+    with pytest.raises(ValueError):
+        read_header(path)
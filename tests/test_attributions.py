@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge
+from sklearn.tree import DecisionTreeRegressor
+
+from wildfire import attributions
+from wildfire.artifact import export_artifact
+from wildfire.predictor import Predictor
+
+
+def assert_sums_to_prediction(predictor, X):
+    values, bias = attributions.contributions(predictor, X)
+    assert values.shape == X.shape
+    np.testing.assert_allclose(bias + values.sum(axis=1), predictor.predict_batch(X), rtol=1e-4, atol=1e-2)
+
+
+def test_treeshap_sums_to_prediction(bundled, incidents):
+    assert attributions.method(bundled) == "treeshap"
+    assert_sums_to_prediction(bundled, incidents)
+
+
+@pytest.mark.parametrize("model, kind", [
+    (DecisionTreeRegressor(max_depth=6, random_state=0), "saabas"),
+    (RandomForestRegressor(n_estimators=10, max_depth=6, n_jobs=1, random_state=0), "saabas"),
+    (Ridge(), "linear"),
+], ids=lambda value: type(value).__name__ if not isinstance(value, str) else value)
+def test_sums_to_prediction(fit_predictor, incidents, model, kind):
+    predictor = fit_predictor(model)
+    assert attributions.method(predictor) == kind
+    assert_sums_to_prediction(predictor, incidents)
+
+
+@pytest.mark.parametrize("model", [
+    DecisionTreeRegressor(max_depth=6, random_state=0),
+    Ridge(),
+], ids=lambda model: type(model).__name__)
+def test_mapped_model_matches_pickled(fit_predictor, incidents, tmp_path, model):
+    predictor = fit_predictor(model)
+    export_artifact(predictor, tmp_path / "model.wfm")
+    mapped = Predictor.load_mapped(tmp_path / "model.wfm")
+    assert attributions.method(mapped) == attributions.method(predictor)
+    assert_sums_to_prediction(mapped, incidents)
+    for got, expected in zip(attributions.contributions(mapped, incidents),
+                             attributions.contributions(predictor, incidents)):
+        np.testing.assert_allclose(got, expected, rtol=1e-6, atol=1e-6)
+
+
+def test_mapped_xgboost_has_no_attributions(bundled, incidents, tmp_path):
+    # XGBoost's internal node weights are not subtree outputs; no path credits
+    export_artifact(bundled, tmp_path / "model.wfm")
+    mapped = Predictor.load_mapped(tmp_path / "model.wfm")
+    assert attributions.method(mapped) is None
+    with pytest.raises(ValueError):
+        attributions.contributions(mapped, incidents)
+    with pytest.raises(ValueError):
+        mapped.fused.path_contributions(incidents)
+
+
+def test_cached_contributions_match(bundled):
+    features = dict(zip(attributions.FEATURE_COLUMNS, [10, 38.5, -121.0, 40, 100, 10, 2, 1, 3, 1]))
+    first = attributions.cached_contributions(bundled, features)
+    assert attributions.cached_contributions(bundled, features) is first
+    assert first["bias"] + sum(first["contributions"].values()) == pytest.approx(
+        bundled.predict_one(features), rel=1e-4, abs=1e-2)
@@ -0,0 +1,84 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wildfire import batch
+from wildfire.attributions import contribution_columns
+from wildfire.features import FEATURE_COLUMNS
+
+
+def incident_file(rows):
+    frame = pd.DataFrame(rows, columns=["Name"] + FEATURE_COLUMNS)
+    return io.BytesIO(frame.to_csv(index=False).encode())
+
+
+def score(fileobj, predict_fn, **kwargs):
+    out = io.StringIO()
+    progress = [dict(p, severity=dict(p["severity"]))
+                for p in batch.score_file(fileobj, "incidents.csv", predict_fn, out, **kwargs)]
+    out.seek(0)
+    return pd.read_csv(out), progress
+
+
+def total_personnel(X):
+    return X["PersonnelInvolved"].to_numpy() * 200
+
+
+ROWS = [
+    ["a", 1, 38.0, -121.0, 50, 10, 1, 0, 0, 0, 0],
+    ["b", 2, 38.5, -121.5, 20, 500, 5, 1, 1, 1, "yes"],
+    ["c", 3, 39.0, -122.0, 0, "lots", 5, 1, 1, 1, 1],
+    ["d", 4, 39.5, -122.5, 90, 1000, 5, 1, 1, 1, "no"],
+    ["e", 5, 40.0, -123.0, 10, 2, 1, 0, 0, 0, 0],
+]
+
+
+def test_scores_chunk_by_chunk():
+    scored, progress = score(incident_file(ROWS), total_personnel, chunk_rows=2)
+    assert len(progress) == 3
+    assert [p["rows"] for p in progress] == [2, 4, 5]
+    assert progress[-1]["fraction"] == 1.0
+    assert progress[-1]["invalid"] == 1
+    assert progress[-1]["severity"] == {"Minor": 2, "Moderate": 1, "Severe": 1}
+
+    assert list(scored["Name"]) == ["a", "b", "c", "d", "e"]
+    np.testing.assert_array_equal(scored[batch.PREDICTION_COLUMN], [2000, 100000, np.nan, 200000, 400])
+    assert list(scored[batch.SEVERITY_COLUMN].fillna("")) == ["Minor", "Moderate", "", "Severe", "Minor"]
+
+
+def test_missing_columns_are_rejected():
+    frame = pd.DataFrame({"Latitude": [38.0]})
+    with pytest.raises(ValueError, match="Missing required column"):
+        next(batch.score_file(io.BytesIO(frame.to_csv(index=False).encode()), "x.csv", total_personnel,
+                              io.StringIO()))
+    with pytest.raises(ValueError, match="Unsupported file type"):
+        next(batch.score_file(incident_file(ROWS), "x.xlsx", total_personnel, io.StringIO()))
+
+
+def test_interval_and_contribution_columns():
+    def with_bounds(X):
+        predictions = total_personnel(X)
+        return predictions, predictions / 2, predictions * 2
+
+    def explain(X):
+        return np.tile(np.arange(len(FEATURE_COLUMNS), dtype=float), (len(X), 1))
+
+    scored, progress = score(incident_file(ROWS), with_bounds, chunk_rows=2, intervals=True, explain_fn=explain)
+    np.testing.assert_array_equal(scored[batch.LOWER_COLUMN], [1000, 50000, np.nan, 100000, 200])
+    np.testing.assert_array_equal(scored[batch.UPPER_COLUMN], [4000, 200000, np.nan, 400000, 800])
+    # 50,000-200,000 and 100,000-400,000 cross a band boundary
+    assert progress[-1]["uncertain"] == 2
+    columns = contribution_columns()
+    np.testing.assert_array_equal(scored.loc[0, columns].to_numpy(dtype=float), np.arange(len(FEATURE_COLUMNS)))
+    assert scored.loc[2, columns].isna().all()
+
+
+def test_header_only_file_writes_the_full_header():
+    scored, progress = score(incident_file([]), total_personnel, intervals=True,
+                             explain_fn=lambda X: np.zeros((len(X), len(FEATURE_COLUMNS))))
+    assert scored.empty
+    assert list(scored.columns) == (["Name"] + FEATURE_COLUMNS + [batch.PREDICTION_COLUMN, batch.LOWER_COLUMN,
+                                     batch.UPPER_COLUMN, batch.SEVERITY_COLUMN] + contribution_columns())
+    assert progress[-1]["fraction"] == 1.0
@@ -0,0 +1,59 @@
+import numpy as np
+
+from wildfire.cache import PredictionCache, feature_key
+from wildfire.features import FEATURE_COLUMNS
+from wildfire.predictor import Predictor
+from wildfire.scenarios import DEMO_SCENARIOS, scenario_features
+
+
+def test_feature_key_is_canonical():
+    ints = dict(zip(FEATURE_COLUMNS, range(10)))
+    floats = {col: np.float32(value) for col, value in ints.items()}
+    assert feature_key(ints) == feature_key(floats)
+    assert feature_key({**ints, "Counties": -0.0}) == feature_key({**ints, "Counties": 0})
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PredictionCache(maxsize=2)
+    cache.put("a", "v1", 1.0)
+    cache.put("b", "v1", 2.0)
+    assert cache.get("a", "v1") == 1.0
+    cache.put("c", "v1", 3.0)
+    assert cache.get("b", "v1") is None
+    assert cache.get("a", "v1") == 1.0
+    assert cache.stats()["evictions"] == 1
+
+
+def test_interleaved_versions_keep_each_others_entries():
+    cache = PredictionCache()
+    for i in range(5):
+        cache.put(i, "new", float(i))
+    cache.put(0, "old", -1.0)
+    assert cache.get(0, "old") == -1.0
+    assert cache.get(1, "old") is None
+    assert [cache.get(i, "new") for i in range(5)] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert cache.get(0, "old") == -1.0
+
+
+def test_old_version_entries_age_out():
+    cache = PredictionCache(maxsize=3)
+    cache.put("a", "old", 1.0)
+    for key in "xyz":
+        cache.put(key, "new", 2.0)
+    assert cache.get("a", "old") is None
+    assert cache.stats()["size"] == 3
+
+
+def test_warm_up_survives_lookups_from_the_old_predictor(bundled):
+    # A hot reload warms the new predictor while sessions still use the old one
+    cache = PredictionCache()
+    old = Predictor(bundled.model, bundled.scaler, fused=bundled.fused, version="old", cache=cache)
+    new = Predictor(bundled.model, bundled.scaler, fused=bundled.fused, version="new", cache=cache)
+    scenarios = {name: scenario_features(values) for name, values in DEMO_SCENARIOS.items()}
+    new.warm_up(scenarios, batch_rows=16, repeats=1)
+    scenario = next(iter(scenarios.values()))
+    old.predict_one(scenario)
+
+    hits = cache.stats()["hits"]
+    new.predict_one(scenario)
+    assert cache.stats()["hits"] == hits + 1
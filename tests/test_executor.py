@@ -0,0 +1,96 @@
+import threading
+
+import numpy as np
+import pytest
+
+from wildfire.executor import InferenceExecutor, InferenceTimeout, Overloaded, long_running
+
+
+def _block(started, release):
+    started.set()
+    release.wait(5)
+    return "done"
+
+
+def test_full_queue_raises_overloaded():
+    executor = InferenceExecutor(workers=1, max_queue=1, timeout=5)
+    started, release = threading.Event(), threading.Event()
+    busy = executor._submit(_block, started, release)
+    assert started.wait(5)
+    # The worker is busy, so this one takes the only queue slot
+    queued = executor._submit(lambda: "queued")
+    with pytest.raises(Overloaded):
+        executor.run(lambda: "rejected")
+    assert executor.stats()["rejected"] == 1
+
+    release.set()
+    assert busy.result(5)[0] == "done"
+    assert queued.result(5)[0] == "queued"
+
+
+def test_timed_out_queued_call_is_dropped():
+    executor = InferenceExecutor(workers=1, max_queue=4, timeout=5)
+    started, release = threading.Event(), threading.Event()
+    busy = executor._submit(_block, started, release)
+    assert started.wait(5)
+    ran = []
+    with pytest.raises(InferenceTimeout):
+        executor.run(ran.append, "late", timeout=0.05)
+
+    release.set()
+    busy.result(5)
+    # The worker skips the cancelled call and serves the next one
+    assert executor.run(lambda: "next") == "next"
+    assert ran == []
+    assert executor.stats()["timed_out"] == 1
+
+
+def test_call_from_worker_runs_inline():
+    executor = InferenceExecutor(workers=1, max_queue=1, timeout=5)
+
+    def outer():
+        # Queued instead, this would wait forever on the only worker
+        return executor.run(threading.current_thread), threading.current_thread()
+
+    inner_thread, outer_thread = executor.run(outer)
+    assert inner_thread is outer_thread
+    assert outer_thread.name.startswith("inference-")
+
+
+def test_no_workers_runs_on_caller():
+    executor = InferenceExecutor(workers=0)
+    assert executor.run(threading.current_thread) is threading.current_thread()
+    assert executor.bind("predictor") == "predictor"
+
+
+def test_bound_predictor_passes_kwargs_and_timeouts(bundled):
+    executor = InferenceExecutor(workers=1, timeout=5, long_timeout=50)
+    bound = executor.bind(bundled)
+    calls = []
+
+    def run(fn, *args, timeout=None, **kwargs):
+        calls.append((timeout, kwargs))
+        return fn(*args, **kwargs)
+
+    executor.run = run
+    X = np.array([[float(i)] * 10 for i in range(1, 4)])
+    assert np.allclose(bound.predict_batch(X), bundled.predict_batch(X))
+    long_running(bound).predict_batch(X=X)
+    assert [timeout for timeout, _ in calls] == [None, 50]
+    assert list(calls[1][1]) == ["X"]
+    # Other attributes come from the predictor itself
+    assert bound.version == bundled.version
+    assert long_running(bundled) is bundled
+
+
+def test_bind_leaves_the_model_unchanged(bundled):
+    before = bundled.model.get_params()["n_jobs"]
+    executor = InferenceExecutor(workers=1, threads=1)
+    bound = executor.bind(bundled)
+    X = np.array([[float(i)] * 10 for i in range(1, 4)])
+
+    assert bound.predict_batch(X) == pytest.approx(bundled.predict_batch(X))
+    assert bundled.model.get_params()["n_jobs"] == before
+    assert bound.limited.model.get_params()["n_jobs"] == 1
+    # The limited copy is made once per predictor
+    assert executor.bind(bundled).limited is bound.limited
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge
+from sklearn.tree import DecisionTreeRegressor
+from xgboost import XGBRegressor
+
+from wildfire.fused import FusedLinear, FusedTrees, check_parity
+
+
+def test_bundled_model_compiles(bundled):
+    assert isinstance(bundled.fused, FusedTrees)
+
+
+@pytest.mark.parametrize("model", [
+    XGBRegressor(n_estimators=20, max_depth=4, n_jobs=1),
+    DecisionTreeRegressor(max_depth=6, random_state=0),
+    RandomForestRegressor(n_estimators=10, max_depth=6, n_jobs=1, random_state=0),
+    Ridge(),
+], ids=lambda model: type(model).__name__)
+def test_fused_matches_scaler_and_model(fit_predictor, incidents, model):
+    predictor = fit_predictor(model)
+    # Off-grid and exactly-on-threshold inputs both take the native branch
+    probe = np.vstack([incidents, np.round(incidents)])
+    check_parity(predictor.fused, predictor.predict_reference, probe)
+
+
+def test_xgboost_missing_values_follow_default_direction(bundled, incidents):
+    X = incidents[:50].copy()
+    X[::3, 5] = np.nan
+    np.testing.assert_allclose(bundled.fused.predict(X), bundled.predict_reference(X), rtol=1e-4, atol=1e-2)
+
+
+def test_linear_is_fused_linear(fit_predictor):
+    assert isinstance(fit_predictor(Ridge()).fused, FusedLinear)
@@ -0,0 +1,50 @@
+import json
+
+import joblib
+import pytest
+
+from wildfire import incremental, training
+from wildfire.features import FEATURE_COLUMNS
+from wildfire.predictor import latest_model_dir
+
+
+def test_training_writes_a_reference_sample(trained_base):
+    reference = joblib.load(latest_model_dir(trained_base) / training.REFERENCE_FILE)
+    assert reference["X"].shape == (120, len(FEATURE_COLUMNS))
+    assert len(reference["y"]) == 120
+
+
+def test_update_from_similar_rows_is_accepted(trained_base, tmp_path, write_labeled_incidents):
+    parent = latest_model_dir(trained_base)
+    manifest = incremental.update(write_labeled_incidents(tmp_path / "new.csv", 200, seed=1),
+                                  base_dir=trained_base, trees=10, tolerance=0.05)
+    assert manifest["accepted"]
+    assert manifest["validation"]["reference"]["rows"] == 120
+    assert manifest["lineage"] == [parent.name]
+    child = latest_model_dir(trained_base)
+    assert child != parent
+    # The parent's reference rows carry forward, joined by this update's holdout
+    reference = joblib.load(child / training.REFERENCE_FILE)
+    assert len(reference["y"]) == 120 + manifest["validation"]["holdout_rows"]
+    assert json.loads((child / "manifest.json").read_text())["parent"] == parent.name
+
+
+def test_update_that_forgets_the_reference_is_rejected(trained_base, tmp_path, write_labeled_incidents):
+    parent = latest_model_dir(trained_base)
+    noise = write_labeled_incidents(tmp_path / "noise.csv", 400, seed=2, shuffle_labels=True)
+    manifest = incremental.update(noise, base_dir=trained_base, trees=50)
+    reference = manifest["validation"]["reference"]
+    assert reference["updated"]["R2"] < reference["parent"]["R2"] - incremental.DEFAULT_TOLERANCE
+    assert not manifest["accepted"]
+    assert latest_model_dir(trained_base) == parent
+
+    forced = incremental.update(noise, base_dir=trained_base, trees=50, force=True)
+    assert not forced["accepted"]
+    assert latest_model_dir(trained_base).name == forced["version"]
+
+
+def test_only_tree_ensembles_can_be_updated():
+    from sklearn.linear_model import LinearRegression
+
+    with pytest.raises(ValueError, match="cannot be updated incrementally"):
+        incremental.model_kind(LinearRegression())
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
+
+from wildfire.intervals import DEFAULT_COVERAGE, contain, empirical_coverage, fit_interval_models
+from wildfire.predictor import FUSED_MAX_ROWS, Predictor
+from wildfire.scenarios import synthetic_incidents
+
+
+@pytest.fixture(scope="module")
+def noisy_incidents():
+    """(X, y) whose acres follow personnel plus heavy noise; train and test halves."""
+    X = synthetic_incidents(4000, seed=7)
+    y = 10 * X[:, 4] + np.random.default_rng(7).normal(0, 500, len(X))
+    return (X[:2000], y[:2000]), (X[2000:], y[2000:])
+
+
+def test_contain_orders_the_bounds_around_the_prediction():
+    prediction, lower, upper = contain(np.array([5.0, 5.0, 5.0]), np.array([1.0, 9.0, 6.0]),
+                                       np.array([9.0, 1.0, 8.0]))
+    np.testing.assert_array_equal(lower, [1.0, 1.0, 5.0])
+    np.testing.assert_array_equal(upper, [9.0, 9.0, 8.0])
+    np.testing.assert_array_equal(prediction, [5.0, 5.0, 5.0])
+
+
+def test_tree_intervals_are_per_tree_quantiles(noisy_incidents):
+    (X_train, y_train), (X_test, y_test) = noisy_incidents
+    scaler = StandardScaler().fit(X_train)
+    forest = RandomForestRegressor(n_estimators=50, n_jobs=1, random_state=0)
+    forest.fit(scaler.transform(X_train), y_train)
+    predictor = Predictor(forest, scaler)
+    assert predictor.compile()
+    assert predictor.interval_method == "trees"
+
+    # Fused (small batches) and native (large batches) paths give the same bounds
+    fused = np.concatenate([np.stack(predictor.predict_interval(X_test[start:start + FUSED_MAX_ROWS]))
+                            for start in range(0, len(X_test), FUSED_MAX_ROWS)], axis=1)
+    native = np.stack(predictor.predict_interval(X_test))
+    np.testing.assert_allclose(fused, native, rtol=1e-6, atol=1e-6)
+
+    per_tree = np.stack([tree.predict(scaler.transform(X_test)) for tree in forest.estimators_], axis=1)
+    lower, upper = np.quantile(per_tree, [0.1, 0.9], axis=1)
+    prediction = per_tree.mean(axis=1)
+    np.testing.assert_allclose(native[1], np.minimum(lower, prediction), rtol=1e-6, atol=1e-6)
+    np.testing.assert_allclose(native[2], np.maximum(upper, prediction), rtol=1e-6, atol=1e-6)
+    assert np.all(native[1] <= native[0]) and np.all(native[0] <= native[2])
+    # Fully grown trees (the notebook's forest) spread roughly like the noise
+    coverage = empirical_coverage(y_test, native[1], native[2])["coverage"]
+    assert coverage == pytest.approx(DEFAULT_COVERAGE, abs=0.15)
+
+
+def test_quantile_intervals_cover_held_out_outcomes(noisy_incidents):
+    (X_train, y_train), (X_test, y_test) = noisy_incidents
+    scaler = StandardScaler().fit(X_train)
+    predictor = Predictor(RandomForestRegressor(n_estimators=1, n_jobs=1).fit(scaler.transform(X_train), y_train),
+                          scaler)
+    predictor.interval_model = fit_interval_models(scaler.transform(X_train), y_train)
+    assert predictor.compile()
+    assert predictor.interval_method == "quantile"
+
+    _, lower, upper = predictor.predict_interval(X_test)
+    coverage = empirical_coverage(y_test, lower, upper)["coverage"]
+    assert coverage == pytest.approx(DEFAULT_COVERAGE, abs=0.1)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from wildfire.features import FEATURE_COLUMNS, MINOR_MAX_ACRES
+from wildfire.optimizer import (
+    DEFAULT_UNIT_COSTS, RESOURCE_FEATURES, _candidate_rows, candidate_levels, default_caps, optimize,
+)
+from wildfire.scenarios import synthetic_incidents
+
+# Synthetic incidents the bundled model scores above Minor with no resources;
+# the first can be brought under it, the second cannot
+INCIDENTS = synthetic_incidents(400, seed=3)
+REACHABLE, UNREACHABLE = (dict(zip(FEATURE_COLUMNS, INCIDENTS[i])) for i in (328, 240))
+
+
+def all_candidates(predictor, features):
+    """(cost, acres) of every candidate mix, scored in one go."""
+    caps = default_caps()
+    levels = [candidate_levels(predictor, feature, caps[feature]) for feature in RESOURCE_FEATURES]
+    flat_index = np.arange(np.prod([len(level) for level in levels]))
+    rows = _candidate_rows(np.array([float(features[col]) for col in FEATURE_COLUMNS]), levels, flat_index)
+    costs = sum(rows[:, FEATURE_COLUMNS.index(feature)] * DEFAULT_UNIT_COSTS[feature]
+                for feature in RESOURCE_FEATURES)
+    return costs, predictor.predict_batch(rows)
+
+
+def test_stops_at_the_cheapest_feasible_chunk(bundled):
+    result = optimize(bundled, REACHABLE, band="Minor", chunk_rows=4096)
+    assert result["feasible"]
+    assert result["predicted_acres"] <= MINOR_MAX_ACRES
+    assert result["evaluated"] < result["candidates"]
+    assert result["evaluated"] % 4096 == 0
+
+    costs, acres = all_candidates(bundled, REACHABLE)
+    assert len(costs) == result["candidates"]
+    assert result["cost"] == costs[acres <= MINOR_MAX_ACRES].min()
+
+
+def test_infeasible_returns_the_fewest_acres(bundled):
+    result = optimize(bundled, UNREACHABLE, band="Minor", chunk_rows=65536)
+    assert not result["feasible"]
+    assert result["evaluated"] == result["candidates"]
+    _, acres = all_candidates(bundled, UNREACHABLE)
+    assert result["predicted_acres"] == pytest.approx(acres.min())
+
+
+def test_minimums_above_caps_are_rejected(bundled):
+    with pytest.raises(ValueError, match="exceeds cap"):
+        optimize(bundled, REACHABLE, caps={"Engines": 5}, minimums={"Engines": 6})
+
+
+@pytest.mark.parametrize("features", [REACHABLE, UNREACHABLE], ids=["feasible", "infeasible"])
+def test_process_pool_matches_in_process(bundled, features):
+    serial = optimize(bundled, features, band="Minor", chunk_rows=16384)
+    pooled = optimize(bundled, features, band="Minor", chunk_rows=16384, workers=2)
+    for result in (serial, pooled):
+        del result["elapsed_s"]
+    assert pooled == serial
@@ -0,0 +1,101 @@
+import pytest
+
+from wildfire.predictor import ARTIFACTS_DIR, LATEST_FILE, MODEL_FILE, SCALER_FILE
+from wildfire.reloader import ModelReloader
+
+
+class FakePredictor:
+    def __init__(self, model_dir):
+        self.version = (model_dir / MODEL_FILE).read_text()
+
+
+class Loader:
+    """Loads FakePredictors, failing while ``fail`` is set; counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self, model_dir):
+        self.calls += 1
+        if self.fail:
+            raise ValueError("half-written pickle")
+        return FakePredictor(model_dir)
+
+
+def write_version(base, name):
+    version_dir = base / ARTIFACTS_DIR / name
+    version_dir.mkdir(parents=True)
+    (version_dir / MODEL_FILE).write_text(name)
+    (version_dir / SCALER_FILE).write_text("scaler")
+    (base / ARTIFACTS_DIR / LATEST_FILE).write_text(name + "\n")
+
+
+@pytest.fixture
+def loader():
+    return Loader()
+
+
+def test_swaps_after_latest_moves(tmp_path, loader):
+    write_version(tmp_path, "v1")
+    reloader = ModelReloader(tmp_path, loader, poll_seconds=0)
+    first = reloader.current()
+    assert first.version == "v1"
+    assert reloader.current() is first
+    assert loader.calls == 1
+
+    write_version(tmp_path, "v2")
+    reloader.check()
+    assert reloader.wait(5)
+    assert reloader.current().version == "v2"
+    assert reloader.status()["swaps"] == 1
+    assert reloader.model_dir == tmp_path / ARTIFACTS_DIR / "v2"
+
+
+def test_rewritten_pickle_is_reloaded(tmp_path, loader):
+    write_version(tmp_path, "v1")
+    reloader = ModelReloader(tmp_path, loader, poll_seconds=0)
+    reloader.current()
+    (tmp_path / ARTIFACTS_DIR / "v1" / MODEL_FILE).write_text("v1-retrained")
+    reloader.check()
+    assert reloader.wait(5)
+    assert reloader.current().version == "v1-retrained"
+
+
+def test_failed_load_keeps_the_old_model_without_retrying(tmp_path, loader):
+    write_version(tmp_path, "v1")
+    reloader = ModelReloader(tmp_path, loader, poll_seconds=0)
+    old = reloader.current()
+
+    loader.fail = True
+    write_version(tmp_path, "v2")
+    reloader.check()
+    assert reloader.wait(5)
+    assert reloader.current() is old
+    assert "half-written" in reloader.status()["last_error"]
+    calls = loader.calls
+    for _ in range(3):
+        reloader.check()
+    assert reloader.wait(5)
+    assert loader.calls == calls
+
+    # A changed stamp (the pickle finished writing) is tried again
+    loader.fail = False
+    (tmp_path / ARTIFACTS_DIR / "v2" / MODEL_FILE).write_text("v2-finished")
+    reloader.check()
+    assert reloader.wait(5)
+    assert reloader.current().version == "v2-finished"
+    assert reloader.status()["last_error"] is None
+
+
+def test_current_is_none_until_a_load_succeeds(tmp_path, loader):
+    loader.fail = True
+    write_version(tmp_path, "v1")
+    reloader = ModelReloader(tmp_path, loader, poll_seconds=0)
+    assert reloader.current() is None
+    assert reloader.version is None
+    assert not reloader.loading
+
+    loader.fail = False
+    (tmp_path / ARTIFACTS_DIR / "v1" / MODEL_FILE).write_text("v1-fixed")
+    assert reloader.current().version == "v1-fixed"
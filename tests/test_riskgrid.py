@@ -0,0 +1,75 @@
+import time
+
+import numpy as np
+
+from wildfire.riskgrid import PROFILE_FEATURES, RiskGrid, prune_versions
+
+
+class LocationPredictor:
+    def __init__(self, version="test"):
+        self.version = version
+
+    def predict_batch(self, X):
+        return X[:, 1] * 1000 + X[:, 2]
+
+
+def make_grid(tmp_path, resolution=4):
+    return RiskGrid(LocationPredictor(), {col: 0 for col in PROFILE_FEATURES},
+                    cache_dir=tmp_path, resolution=resolution)
+
+
+def test_full_view_covers_every_tile(tmp_path):
+    grid = make_grid(tmp_path)
+    assert (grid.rows, grid.cols) == (19, 21)
+    assert len(grid.tiles_in_view()) == grid.rows * grid.cols
+
+
+def test_view_on_tile_edges(tmp_path):
+    grid = make_grid(tmp_path)
+    assert grid.tiles_in_view((33.0, 34.0, -124.5, -124.0)) == [(1, 0), (2, 0)]
+    # Equal bounds cover no area, so no tiles (the risk map checks for this)
+    assert grid.tiles_in_view((33.0, 33.0, -124.5, -114.0)) == []
+
+
+def test_cell_centres_lie_inside_their_tile(tmp_path):
+    grid = make_grid(tmp_path)
+    lats, lons = grid.cell_centres(2, 3)
+    assert np.all((lats > 33.5) & (lats < 34.0))
+    assert np.all((lons > -123.0) & (lons < -122.5))
+
+
+def test_tiles_are_cached_and_mosaic_places_them(tmp_path):
+    grid = make_grid(tmp_path)
+    view = (33.0, 34.0, -124.5, -123.5)
+    first = {(row, col): acres for row, col, acres, cached in grid.iter_tiles(view)}
+    assert not any(cached for *_, cached in grid.iter_tiles((40.0, 40.5, -120.0, -119.5)))
+    assert all(cached for *_, cached in grid.iter_tiles(view))
+
+    lats, lons, z = grid.mosaic(first)
+    assert z.shape == (2 * 4, 2 * 4) == (len(lats), len(lons))
+    expected = lats[:, None] * 1000 + lons[None, :]
+    np.testing.assert_allclose(z, expected, rtol=1e-6)
+
+
+def test_prune_versions_keeps_only_the_served_version(tmp_path):
+    for version in ("old", "new"):
+        RiskGrid(LocationPredictor(version), {col: 0 for col in PROFILE_FEATURES}, cache_dir=tmp_path,
+                 resolution=2).tile(0, 0)
+    assert prune_versions("new", tmp_path) == 1
+    assert [path.name for path in tmp_path.iterdir()] == ["new"]
+    assert prune_versions("new", tmp_path / "missing") == 0
+
+
+def test_least_recently_viewed_profiles_are_pruned(tmp_path):
+    def view(county):
+        grid = RiskGrid(LocationPredictor(), {col: county for col in PROFILE_FEATURES}, cache_dir=tmp_path,
+                        resolution=2, max_profiles=2)
+        list(grid.iter_tiles((33.0, 33.5, -124.5, -124.0)))
+        return grid.directory.parent
+
+    first, second = view(1), view(2)
+    time.sleep(0.01)
+    view(1)
+    third = view(3)
+    assert first.exists() and third.exists()
+    assert not second.exists()
@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+import pytest
+
+from wildfire.features import FEATURE_COLUMNS
+from wildfire.service import MicroBatcher, Overloaded, ScoringService
+
+
+def run_batcher(scenario, **kwargs):
+    """Run ``scenario(batcher)`` on a started MicroBatcher; returns (result, batch sizes)."""
+    sizes = []
+
+    def predict_batch(rows):
+        sizes.append(len(rows))
+        return [row[0] for row in rows]
+
+    async def main():
+        batcher = MicroBatcher(predict_batch, **kwargs)
+        await batcher.start()
+        try:
+            return await scenario(batcher)
+        finally:
+            await batcher.stop()
+
+    return asyncio.run(main()), sizes
+
+
+def test_batches_never_exceed_max_batch():
+    async def scenario(batcher):
+        return await asyncio.gather(batcher.submit([[i] for i in range(25)]),
+                                    *(batcher.submit([[100 + i]] * 4) for i in range(5)))
+
+    results, sizes = run_batcher(scenario, window_ms=20, max_batch=10)
+    assert max(sizes) <= 10
+    assert sum(sizes) == 45
+    assert results[0] == list(range(25))
+    assert results[1:] == [[100.0 + i] * 4 for i in range(5)]
+
+
+def test_concurrent_requests_share_a_batch():
+    async def scenario(batcher):
+        return await asyncio.gather(*(batcher.submit([[i]]) for i in range(8)))
+
+    results, sizes = run_batcher(scenario, window_ms=20, max_batch=64)
+    assert results == [[float(i)] for i in range(8)]
+    assert sizes == [8]
+
+
+def test_full_queue_rejects_the_whole_request():
+    async def scenario(batcher):
+        with pytest.raises(Overloaded):
+            await batcher.submit([[0]] * 100)
+        return batcher.metrics()
+
+    metrics, sizes = run_batcher(scenario, max_batch=10, max_queue=8)
+    assert metrics["rejected"] == 1
+    assert sizes == []
+
+
+
+async def post_predict(port, length, body):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"POST /predict HTTP/1.1\r\nContent-Length: {length}\r\nConnection: close\r\n\r\n".encode()
+                 + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    writer.close()
+    return int(status_line.split()[1])
+
+
+@pytest.mark.parametrize("length, status", [(None, 200), ("abc", 400), ("-5", 400), ("1.5", 400)])
+def test_content_length_is_validated(length, status):
+    body = json.dumps(dict.fromkeys(FEATURE_COLUMNS, 1)).encode()
+
+    async def main():
+        service = ScoringService(MicroBatcher(lambda rows: [0.0] * len(rows)), port=0)
+        await service.start()
+        try:
+            return await post_predict(service.port, len(body) if length is None else length, body)
+        finally:
+            await service.stop()
+
+    assert asyncio.run(main()) == status
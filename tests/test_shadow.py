@@ -0,0 +1,81 @@
+import threading
+
+import numpy as np
+import pytest
+
+from wildfire.shadow import ShadowScorer
+
+
+class Candidate:
+    """Predicts ``scale`` times the first column, optionally waiting for ``release``."""
+
+    version = "candidate"
+    model = None
+
+    def __init__(self, scale=2.0, release=None):
+        self.scale = scale
+        self.release = release
+
+    def predict_batch(self, X):
+        if self.release is not None:
+            self.release.wait(5)
+        return np.asarray(X)[:, 0] * self.scale
+
+
+def test_divergence_and_band_pairs():
+    shadow = ShadowScorer(Candidate())
+    # Served predictions are the first column; the candidate doubles them
+    X = np.array([[100.0], [8000.0], [60000.0], [0.0]])
+    assert shadow.submit(X, X[:, 0])
+    assert shadow.flush(5)
+
+    stats = shadow.stats()
+    assert stats["rows"] == 4 and stats["batches"] == 1
+    assert stats["mean_abs_delta"] == pytest.approx((100 + 8000 + 60000 + 0) / 4)
+    assert stats["max_abs_delta"] == 60000
+    # 8,000 -> 16,000 crosses Minor/Moderate and 60,000 -> 120,000 Moderate/Severe
+    assert stats["band_disagreement"] == 0.5
+    assert stats["band_pairs"] == {"Minor->Minor": 2, "Minor->Moderate": 1, "Moderate->Severe": 1}
+    assert stats["p50_rel_delta"] == pytest.approx(1.0)
+
+    shadow.reset()
+    assert shadow.stats()["rows"] == 0
+
+
+def test_wrap_submits_the_served_prediction():
+    shadow = ShadowScorer(Candidate(scale=1.0))
+    predict = shadow.wrap(lambda X: (X[:, 0], X[:, 0] - 1, X[:, 0] + 1))
+    prediction, lower, upper = predict(np.array([[5.0], [7.0]]))
+    assert list(prediction) == [5.0, 7.0]
+    assert shadow.flush(5)
+    assert shadow.stats()["rows"] == 2
+    assert shadow.stats()["max_abs_delta"] == 0.0
+
+
+def test_batches_past_max_rows_are_dropped():
+    release = threading.Event()
+    shadow = ShadowScorer(Candidate(release=release), max_rows=100)
+    assert shadow.submit(np.zeros((60, 1)), np.zeros(60))
+    assert shadow.submit(np.zeros((40, 1)), np.zeros(40))
+    assert not shadow.submit(np.zeros((1, 1)), np.zeros(1))
+    assert shadow.stats()["pending_rows"] == 100
+    assert shadow.stats()["dropped"] == 1
+
+    release.set()
+    assert shadow.flush(5)
+    stats = shadow.stats()
+    assert stats["pending_rows"] == 0
+    assert stats["rows"] == 100
+    assert shadow.submit(np.zeros((100, 1)), np.zeros(100))
+
+
+def test_candidate_errors_are_counted():
+    class Broken(Candidate):
+        def predict_batch(self, X):
+            raise RuntimeError("boom")
+
+    shadow = ShadowScorer(Broken())
+    shadow.submit(np.zeros((3, 1)), np.zeros(3))
+    assert shadow.flush(5)
+    assert shadow.stats()["errors"] == 1
+    assert shadow.stats()["pending_rows"] == 0
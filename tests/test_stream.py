@@ -0,0 +1,102 @@
+import json
+import time
+
+import numpy as np
+
+from wildfire.features import FEATURE_COLUMNS
+from wildfire.stream import IncidentStream, StreamIngestor, split_lines
+
+
+class CountingPredictor:
+    """Predicts 100 x PersonnelInvolved and records the rows of every call."""
+
+    def __init__(self, version="v1"):
+        self.version = version
+        self.calls = []
+
+    def predict_batch(self, X):
+        self.calls.append(len(X))
+        return np.asarray(X)[:, FEATURE_COLUMNS.index("PersonnelInvolved")] * 100
+
+
+def incident(incident_id, personnel=10, **values):
+    return {"incident_id": incident_id, **dict.fromkeys(FEATURE_COLUMNS, 1.0),
+            "PersonnelInvolved": personnel, **values}
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_only_changed_incidents_are_rescored():
+    predictor = CountingPredictor()
+    stream = IncidentStream(lambda: predictor, capacity=2)
+    assert stream.apply([incident("a"), incident("b"), incident("c")]) == 3
+    sequence = stream.sequence
+
+    # "a" resent unchanged, "b" changed, "d" incomplete
+    assert stream.apply([incident("a"), {"incident_id": "b", "PersonnelInvolved": 20},
+                         {"incident_id": "d", "Engines": 3}]) == 1
+    assert predictor.calls == [3, 1]
+    changed = stream.frame(since=sequence)
+    assert list(changed.index) == ["b"]
+    assert changed.loc["b", "PredictedAcres"] == 2000
+    stats = stream.stats()
+    assert stats["incidents"] == 4 and stats["unchanged"] == 1 and stats["rescored"] == 4
+
+    # Completing "d" scores it
+    assert stream.apply([{"incident_id": "d", **incident("d")}]) == 1
+
+
+def test_new_model_version_rescores_every_incident():
+    predictor = CountingPredictor()
+    stream = IncidentStream(lambda: predictor)
+    stream.apply([incident(name) for name in "abc"])
+    predictor.version = "v2"
+    assert stream.apply([]) == 3
+    assert stream.stats()["version"] == "v2"
+    assert stream.apply([]) == 0
+
+
+def test_band_changes_are_recorded():
+    stream = IncidentStream(CountingPredictor)
+    stream.apply([incident("a", personnel=10)])
+    stream.apply([incident("a", personnel=500)])
+    assert [(change["from"], change["to"]) for change in stream.band_changes] == [("Minor", "Moderate")]
+
+
+def test_invalid_lines_are_counted():
+    stream = IncidentStream(CountingPredictor)
+    ingestor = StreamIngestor(stream)
+    ingestor.feed([json.dumps(incident("a")), b"not json", b"[1, 2]", json.dumps({"Engines": 1}), b""])
+    assert ingestor.flush(5)
+    stats = stream.stats()
+    assert stats["incidents"] == 1
+    assert stats["invalid"] == 3
+
+
+def test_split_lines_keeps_the_unterminated_rest():
+    lines, rest = split_lines(b'{"a"', b': 1}\n{"b": 2}\n{"c"')
+    assert lines == [b'{"a": 1}', b'{"b": 2}']
+    assert rest == b'{"c"'
+
+
+def test_tail_starts_over_after_truncation(tmp_path):
+    path = tmp_path / "updates.jsonl"
+    path.write_text("\n".join(json.dumps(incident(name)) for name in ("a", "b", "c")) + "\n")
+    stream = IncidentStream(CountingPredictor)
+    ingestor = StreamIngestor(stream)
+    ingestor.tail(path, from_start=True)
+    try:
+        wait_for(lambda: len(stream) == 3)
+        path.write_text(json.dumps(incident("d")) + "\n")
+        wait_for(lambda: len(stream) == 4)
+        with open(path, "a") as f:
+            f.write(json.dumps(incident("e")) + "\n")
+        wait_for(lambda: len(stream) == 5)
+    finally:
+        ingestor.stop()
+    assert stream.stats()["invalid"] == 0
@@ -0,0 +1,36 @@
+import json
+
+from wildfire import training
+from wildfire.predictor import Predictor, latest_model_dir
+
+
+def test_thread_budgets_share_spare_cores():
+    budgets = training.thread_budgets(training.MODEL_NAMES, 9)
+    assert budgets == {"Linear Regression": 1, "Decision Tree": 1, "Random Forest": 4, "XGBoost": 3}
+    assert training.thread_budgets(training.MODEL_NAMES, 2) == dict.fromkeys(training.MODEL_NAMES, 1)
+
+
+def test_train_writes_a_loadable_version(tmp_path, write_labeled_incidents):
+    csv = write_labeled_incidents(tmp_path / "incidents.csv", 400, seed=0)
+    manifest = training.train(csv, tmp_path / "artifacts", jobs=2, names=["Linear Regression", "Decision Tree"])
+
+    assert manifest["best_model"] == max(manifest["metrics"], key=lambda name: manifest["metrics"][name]["R2"])
+    version_dir = latest_model_dir(tmp_path)
+    assert version_dir.name == manifest["version"]
+    written = json.loads((version_dir / "manifest.json").read_text())
+    assert written["stages"].keys() == manifest["stages"].keys()
+    assert written["files"] == {path.name: training._sha256(path)
+                                for path in sorted(version_dir.iterdir()) if path.name != "manifest.json"}
+    assert json.loads((version_dir / "counties.json").read_text()) == sorted(
+        ["Butte", "Fresno", "Kern", "Los Angeles", "Riverside", "Shasta"])
+    assert Predictor.load(version_dir).model_dir == version_dir
+
+
+def test_write_artifacts_suffixes_a_taken_version(trained_base):
+    artifacts = trained_base / "artifacts"
+    taken = latest_model_dir(trained_base).name
+    manifest = {"version": taken}
+    version_dir = training.write_artifacts(artifacts, object(), object(), manifest, [])
+    assert manifest["version"] == f"{taken}-2" == version_dir.name
+    assert latest_model_dir(trained_base) == version_dir
+    assert training.write_artifacts(artifacts, object(), object(), {"version": taken}, []).name == f"{taken}-3"
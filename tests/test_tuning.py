@@ -0,0 +1,35 @@
+import pytest
+
+from wildfire import tuning
+
+
+@pytest.mark.parametrize("name, budgets", [
+    ("XGBoost", [11, 33, 100, 300]),
+    ("Random Forest", [11, 33, 100]),
+])
+def test_rung_budgets(name, budgets):
+    assert tuning.rung_budgets(tuning.MAX_TREES[name], tuning.DEFAULT_ETA, len(tuning.grid_configs(name))) == budgets
+
+
+def test_few_configs_need_few_rungs():
+    assert tuning.rung_budgets(300, 3, 2) == [100, 300]
+    assert tuning.rung_budgets(300, 3, 1) == [300]
+
+
+def test_successive_halving_keeps_the_best_third(tmp_path, monkeypatch, write_labeled_incidents):
+    monkeypatch.setitem(tuning.PARAM_GRIDS, "Random Forest",
+                        {"max_depth": [1, 4, None], "min_samples_leaf": [1, 20, 80]})
+    monkeypatch.setitem(tuning.MAX_TREES, "Random Forest", 30)
+    csv = write_labeled_incidents(tmp_path / "incidents.csv", 300, seed=0)
+    array_dir = tuning.prepare_arrays(csv, tmp_path / "cache")
+    assert tuning.prepare_arrays(csv, tmp_path / "cache") == array_dir
+
+    result = tuning.successive_halving("Random Forest", array_dir, log=lambda line: None)
+    assert result["rung_budgets"] == [10, 30]
+    first, second = ([trial for trial in result["trials"] if trial["rung"] == rung] for rung in (0, 1))
+    assert len(first) == 9 and len(second) == 3
+    best_three = sorted(first, key=lambda trial: -trial["r2"])[:3]
+    assert {trial["config"] for trial in second} == {trial["config"] for trial in best_three}
+    best = max(second, key=lambda trial: trial["r2"])
+    assert result["best_params"] == {**best["params"], "n_estimators": 30}
+    assert result["best_score"] == best["r2"]
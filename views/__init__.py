@@ -0,0 +1 @@
+"""Streamlit page modules, imported by app.py only when their page is shown."""
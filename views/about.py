@@ -0,0 +1,84 @@
+"""ℹ️ About page."""
+import streamlit as st
+
+
+def render(predictor):
+    st.markdown("<h1 style='text-align: center;'>About This Project</h1>", unsafe_allow_html=True)
+    st.markdown("<div class='accent-line'></div>", unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    st.markdown("""
+        <div class='modern-card'>
+            <h3 style='font-size: 18px; margin-bottom: 12px;'>🎓 Academic Project</h3>
+            <p style='font-size: 14px;'>Developed as part of <strong>Computational Intelligence (CO4)</strong> at <strong>MIT Academy of Engineering, Pune</strong> — Academic Year 2024-25</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+            <div class='modern-card'>
+                <h3 style='font-size: 18px; margin-bottom: 12px;'>🎯 Objectives</h3>
+                <p style='font-size: 14px;'>
+                    • Deploy ML models for real-world use<br>
+                    • Create interactive AI interfaces<br>
+                    • Implement predictive analytics<br>
+                    • Apply computational intelligence
+                </p>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+            <div class='modern-card'>
+                <h3 style='font-size: 18px; margin-bottom: 12px;'>🔧 Tech Stack</h3>
+                <p style='font-size: 14px;'>
+                    <strong>ML:</strong> XGBoost, Scikit-learn<br>
+                    <strong>Frontend:</strong> Streamlit<br>
+                    <strong>Data:</strong> Pandas, NumPy<br>
+                    <strong>Viz:</strong> Plotly<br>
+                    <strong>Storage:</strong> Joblib
+                </p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+            <div class='modern-card'>
+                <h3 style='font-size: 18px; margin-bottom: 12px;'>📊 Input Features</h3>
+                <p style='font-size: 14px;'>
+                    1. County Code<br>
+                    2. Latitude & Longitude<br>
+                    3. Containment Percentage<br>
+                    4. Personnel Count<br>
+                    5. Fire Engines<br>
+                    6. Helicopters<br>
+                    7. Bulldozers<br>
+                    8. Water Tenders<br>
+                    9. Major Incident Flag
+                </p>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+            <div class='modern-card'>
+                <h3 style='font-size: 18px; margin-bottom: 12px;'>🎯 Classifications</h3>
+                <p style='font-size: 14px;'>
+                    <span style='color: #10B981;'>✓ Minor:</span> 0-10K acres<br>
+                    <span style='color: #F59E0B;'>⚠ Moderate:</span> 10K-100K acres<br>
+                    <span style='color: #EF4444;'>⚠ Severe:</span> >100K acres
+                </p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    st.markdown("""
+        <div class='modern-card'>
+            <h3 style='font-size: 18px; margin-bottom: 12px;'>🌟 Future Roadmap</h3>
+            <p style='font-size: 14px;'>
+                Real-time weather integration • Historical pattern analysis • Ensemble model predictions • Mobile app development • Emergency system integration
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
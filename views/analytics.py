@@ -0,0 +1,249 @@
+"""📈 Analytics page: aggregates from the analytics store, or sample data without one."""
+import plotly.graph_objects as go
+import streamlit as st
+
+from wildfire.analytics import META_FILE, RESOURCE_COLUMNS, default_store_dir, read_meta, refresh
+from wildfire.instrumentation import FIGURE_BUILD, FIGURE_RENDER, timed
+
+# Shown until `python -m wildfire.analytics ingest` has built the store
+SAMPLE_FIRE_COUNTS = [450, 280, 85]
+SAMPLE_EFFECTIVENESS = [85, 78, 92, 70, 88]
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def load_aggregates(stamp):
+    """Aggregates from meta.json; ``stamp`` (its mtime) keys the cache."""
+    meta = read_meta()
+    return None if meta is None else {**meta["aggregates"], "updated": meta.get("updated")}
+
+
+def _store_stamp():
+    try:
+        return (default_store_dir() / META_FILE).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+# Charts are built once per set of values and shared by every rerun and
+# session, so they are never modified (see views/figures.py)
+@st.cache_resource(max_entries=4, show_spinner=False)
+def severity_pie(categories, counts):
+    fig = go.Figure(data=[go.Pie(
+        labels=categories,
+        values=counts,
+        hole=0.4,
+        marker=dict(colors=['#10b981', '#f59e0b', '#dc2626'])
+    )])
+    
+    fig.update_layout(
+        title={'text': 'Severity Distribution', 'font': {'size': 18}},
+        paper_bgcolor='#0F172A',
+        plot_bgcolor='#0F172A',
+        font={'color': '#F1F5F9', 'family': 'Inter'},
+        height=350,
+        showlegend=True
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def severity_bar(categories, counts):
+    fig = go.Figure(data=[go.Bar(
+        x=categories,
+        y=counts,
+        marker_color=['#10B981', '#F59E0B', '#EF4444'],
+        text=counts,
+        textposition='auto'
+    )])
+    
+    fig.update_layout(
+        title={'text': 'Incidents by Severity', 'font': {'size': 18}},
+        xaxis_title='',
+        yaxis_title='Count',
+        paper_bgcolor='#0F172A',
+        plot_bgcolor='#0F172A',
+        font={'color': '#F1F5F9', 'family': 'Inter'},
+        height=350
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def resource_bar(resources, values, title, axis_title):
+    fig = go.Figure(data=[go.Bar(
+        x=resources,
+        y=values,
+        marker_color='#FF6B6B',
+        text=[f'{e}%' for e in values],
+        textposition='auto'
+    )])
+    
+    fig.update_layout(
+        title={'text': title, 'font': {'size': 18}},
+        xaxis_title='',
+        yaxis_title=axis_title,
+        paper_bgcolor='#0F172A',
+        plot_bgcolor='#0F172A',
+        font={'color': '#F1F5F9', 'family': 'Inter'},
+        height=350,
+        yaxis={'range': [0, 100]}
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def county_bar(names, band_counts):
+    """Stacked incidents per county; ``band_counts`` is ((band, counts per county), ...)."""
+    colors = {"Minor": '#10B981', "Moderate": '#F59E0B', "Severe": '#EF4444'}
+    fig = go.Figure(data=[
+        go.Bar(name=band, x=names, y=counts, marker_color=colors[band])
+        for band, counts in band_counts
+    ])
+    
+    fig.update_layout(
+        barmode='stack',
+        title={'text': 'Incidents by County', 'font': {'size': 18}},
+        xaxis_title='',
+        yaxis_title='Incidents',
+        paper_bgcolor='#0F172A',
+        plot_bgcolor='#0F172A',
+        font={'color': '#F1F5F9', 'family': 'Inter'},
+        height=350
+    )
+    return fig
+
+
+def render(predictor):
+    st.markdown("<h1 style='text-align: center;'>Analytics Dashboard</h1>", unsafe_allow_html=True)
+    st.markdown("<div class='accent-line'></div>", unsafe_allow_html=True)
+    st.markdown("<p style='text-align: center; font-size: 16px;'>Historical trends and performance insights</p>", unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    aggregates = load_aggregates(_store_stamp())
+    
+    if aggregates is not None:
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.caption(f"California_Fire_Incidents: {aggregates['rows']:,} incidents • updated {aggregates['updated']}")
+        with col2:
+            # Reads only rows appended to the source CSV since the last ingest
+            if st.button("🔄 Refresh Data", use_container_width=True):
+                try:
+                    refresh()
+                except FileNotFoundError as e:
+                    st.error(f"❌ {e}")
+                else:
+                    st.rerun()
+    else:
+        st.info("💡 Showing sample data. Build the analytics store from the training dataset with `python -m wildfire.analytics ingest California_Fire_Incidents.csv`.")
+    
+    # Severity distribution
+    severity_categories = ['Minor\n(0-10K acres)', 'Moderate\n(10K-100K acres)', 'Severe\n(>100K acres)']
+    if aggregates is not None:
+        fire_counts = [aggregates["severity"][band] for band in ("Minor", "Moderate", "Severe")]
+    else:
+        fire_counts = SAMPLE_FIRE_COUNTS
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Pie chart
+        with timed(FIGURE_BUILD):
+            fig1 = severity_pie(tuple(severity_categories), tuple(fire_counts))
+        
+        with timed(FIGURE_RENDER):
+            st.plotly_chart(fig1, use_container_width=True)
+    
+    with col2:
+        # Bar chart
+        with timed(FIGURE_BUILD):
+            fig2 = severity_bar(tuple(severity_categories), tuple(fire_counts))
+        
+        with timed(FIGURE_RENDER):
+            st.plotly_chart(fig2, use_container_width=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    resources = ['Personnel', 'Engines', 'Helicopters', 'Dozers', 'Water Tenders']
+    
+    if aggregates is not None:
+        # Share of incidents that deployed each resource
+        st.markdown("### Resource Deployment")
+        rows = max(aggregates["rows"], 1)
+        effectiveness = [round(100 * aggregates["resources"][col]["deployed"] / rows) for col in RESOURCE_COLUMNS]
+        chart_title = 'Incidents Deploying Each Resource'
+        axis_title = 'Incidents (%)'
+    else:
+        st.markdown("### Resource Effectiveness")
+        effectiveness = SAMPLE_EFFECTIVENESS
+        chart_title = 'Resource Effectiveness Scores'
+        axis_title = 'Effectiveness (%)'
+    
+    with timed(FIGURE_BUILD):
+        fig3 = resource_bar(tuple(resources), tuple(effectiveness), chart_title, axis_title)
+    
+    with timed(FIGURE_RENDER):
+        st.plotly_chart(fig3, use_container_width=True)
+    
+    # Counties with the most incidents, split by severity
+    if aggregates is not None and aggregates["counties"]:
+        st.markdown("### Top Counties")
+        
+        top = sorted(aggregates["counties"].items(), key=lambda item: item[1]["incidents"], reverse=True)[:10]
+        
+        with timed(FIGURE_BUILD):
+            fig4 = county_bar(tuple(name for name, _ in top), tuple(
+                (band, tuple(stats[band] for _, stats in top)) for band in ("Minor", "Moderate", "Severe")
+            ))
+        
+        with timed(FIGURE_RENDER):
+            st.plotly_chart(fig4, use_container_width=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Key Insights
+    st.markdown("### Key Insights")
+    
+    if aggregates is not None:
+        top_resource = max(range(len(resources)), key=lambda i: effectiveness[i])
+        resource_title = "Most Deployed Resource"
+        resource_text = f"{resources[top_resource]} were deployed on {effectiveness[top_resource]}% of recorded incidents"
+        minor_share = fire_counts[0] / max(sum(fire_counts), 1)
+        distribution_text = f"{minor_share:.0%} of {sum(fire_counts):,} incidents stayed minor (10,000 acres or less)"
+    else:
+        resource_title = "Most Effective Resource"
+        resource_text = "Helicopters demonstrate 92% effectiveness in containment operations"
+        distribution_text = "55% of incidents classified as minor with rapid containment"
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(f"""
+            <div class='info-card'>
+                <h4 style='font-size: 16px; font-weight: 600;'>{resource_title}</h4>
+                <p style='font-size: 14px;'>{resource_text}</p>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+            <div class='info-card'>
+                <h4 style='font-size: 16px; font-weight: 600;'>Fire Distribution</h4>
+                <p style='font-size: 14px;'>{distribution_text}</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+            <div class='info-card'>
+                <h4 style='font-size: 16px; font-weight: 600;'>Response Time</h4>
+                <p style='font-size: 14px;'>Average 72-hour containment with proper resource allocation</p>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+            <div class='info-card'>
+                <h4 style='font-size: 16px; font-weight: 600;'>Critical Success Factor</h4>
+                <p style='font-size: 14px;'>Early detection reduces acres burned by 65%</p>
+            </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,33 @@
+"""🩺 Sidebar diagnostics: per-stage timings of this rerun and rolling histograms."""
+import streamlit as st
+
+from wildfire.instrumentation import timings
+
+# Width of the widest histogram bar, in characters
+BAR_WIDTH = 20
+
+
+def render(last_run):
+    """Draw the panel into the current container; ``last_run`` is end_run()'s entry."""
+    summary = timings.summary()
+    if not summary:
+        st.caption("No timings recorded yet")
+        return
+
+    stages_ms = (last_run or {}).get("stages_ms", {})
+
+    rows = ["| Stage | This run | p50 | p99 | n |", "|---|---:|---:|---:|---:|"]
+    for stage, stats in summary.items():
+        this_run = stages_ms.get(stage)
+        this_run = f"{this_run:.2f}" if this_run is not None else "–"
+        rows.append(f"| {stage} | {this_run} | {stats['p50_ms']:.2f} | "
+                    f"{stats['p99_ms']:.2f} | {stats['count']:,} |")
+    st.markdown("\n".join(rows))
+    st.caption("Times in ms; p50/p99 over the last 1,000 samples per stage")
+
+    stage = st.selectbox("Histogram", list(summary), key="diagnostics_stage")
+    buckets = [(label, count) for label, count in summary[stage]["histogram"] if count]
+    peak = max(count for _, count in buckets)
+    lines = [f"{label:>7} ms {'█' * max(1, round(count / peak * BAR_WIDTH)):<{BAR_WIDTH}} {count}"
+             for label, count in buckets]
+    st.code("\n".join(lines), language=None)
@@ -0,0 +1,27 @@
+"""Plotly figures built once and reused by every rerun and session.
+
+Charts whose inputs have not changed are cached with ``st.cache_resource``
+instead of being rebuilt trace by trace on every rerun. The Analytics
+charts are cached as built ``go.Figure`` objects and passed straight to
+``st.plotly_chart``, which only reads them (``to_dict`` copies the
+figure before it is serialized). They are shared between sessions, so
+they are never modified after they are cached.
+
+A chart that varies (the Prediction gauge) is cached as a plain dict
+(``to_spec``) and each render edits its own deep copy. The spec leaves
+out the default template, which is most of a figure's properties;
+``go.Figure`` applies it again, so the figure is the same but there is
+far less to validate.
+
+``st.plotly_chart`` always serializes the figure itself, so the JSON
+sent to the browser is not cached here.
+"""
+import plotly.io as pio
+
+
+def to_spec(fig):
+    """The plain dict form of ``fig``, for caching."""
+    spec = fig.to_plotly_json()
+    if pio.templates.default and fig.layout.template == pio.templates[pio.templates.default]:
+        spec["layout"].pop("template", None)
+    return spec
@@ -0,0 +1,114 @@
+"""🏠 Home page."""
+import streamlit as st
+
+
+def render(predictor):
+    # Hero Section
+    st.markdown("<h1 style='text-align: center; font-size: 56px; margin-bottom: 0;'>Wildfire Severity Prediction</h1>", unsafe_allow_html=True)
+    st.markdown("<div class='accent-line'></div>", unsafe_allow_html=True)
+    st.markdown("<p style='text-align: center; font-size: 18px; color: #94A3B8; margin-top: 8px;'>AI-powered predictive analytics for intelligent fire management</p>", unsafe_allow_html=True)
+    
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    
+    # Key Metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("""
+            <div class='stat-box'>
+                <div class='stat-number'>95%</div>
+                <div class='stat-label'>Accuracy</div>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+            <div class='stat-box'>
+                <div class='stat-number'>10</div>
+                <div class='stat-label'>Features</div>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+            <div class='stat-box'>
+                <div class='stat-number'>3</div>
+                <div class='stat-label'>Severity Levels</div>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown("""
+            <div class='stat-box'>
+                <div class='stat-number'>&lt;1s</div>
+                <div class='stat-label'>Response Time</div>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    
+    # Features Grid
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+            <div class='modern-card'>
+                <h3 style='font-size: 20px; margin-bottom: 12px;'>🎯 Accurate Predictions</h3>
+                <p style='font-size: 14px;'>Advanced ML algorithms trained on historical data for precise wildfire severity forecasting.</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+            <div class='modern-card'>
+                <h3 style='font-size: 20px; margin-bottom: 12px;'>⚡ Real-Time Analysis</h3>
+                <p style='font-size: 14px;'>Instant predictions based on current incident parameters and resource deployment data.</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+            <div class='modern-card'>
+                <h3 style='font-size: 20px; margin-bottom: 12px;'>📊 Data-Driven</h3>
+                <p style='font-size: 14px;'>Intelligent insights for optimal resource allocation and emergency response planning.</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Process Section
+    st.markdown("<h2 style='text-align: center; margin-top: 40px;'>How It Works</h2>", unsafe_allow_html=True)
+    st.markdown("<div class='accent-line'></div>", unsafe_allow_html=True)
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+            <div class='info-card'>
+                <h4 style='font-size: 16px; font-weight: 600;'>1. Input Parameters</h4>
+                <p style='font-size: 14px;'>Enter location, containment status, and deployed resources</p>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+            <div class='info-card'>
+                <h4 style='font-size: 16px; font-weight: 600;'>3. Get Results</h4>
+                <p style='font-size: 14px;'>Receive severity classification and recommended actions</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+            <div class='info-card'>
+                <h4 style='font-size: 16px; font-weight: 600;'>2. AI Processing</h4>
+                <p style='font-size: 14px;'>XGBoost model analyzes data using trained algorithms</p>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+            <div class='info-card'>
+                <h4 style='font-size: 16px; font-weight: 600;'>4. Take Action</h4>
+                <p style='font-size: 14px;'>Implement strategies based on severity predictions</p>
+            </div>
+        """, unsafe_allow_html=True)
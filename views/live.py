@@ -0,0 +1,99 @@
+"""📡 Live Incidents page: predictions re-scored as incident updates stream in."""
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from wildfire.batch import PREDICTION_COLUMN, SEVERITY_COLUMN
+from wildfire.instrumentation import timed_fragment
+from wildfire.stream import STREAM_ENV_VAR, shared_stream
+
+# Seconds between dashboard refreshes; only the fragment below reruns
+LIVE_REFRESH_SECONDS = 2
+
+# Largest incidents shown in the table
+LIVE_TABLE_ROWS = 200
+
+# Most recent severity band changes listed
+LIVE_BAND_CHANGES = 20
+
+
+def _merged_frame(stream):
+    """This session's incident table, updated with only the rows re-scored since the last refresh."""
+    changed = stream.frame(since=st.session_state.get("live_sequence", 0))
+    frame = st.session_state.get("live_frame")
+    if len(changed):
+        if frame is None:
+            frame = changed
+        else:
+            frame = pd.concat([frame.drop(changed.index, errors="ignore"), changed])
+        st.session_state.live_frame = frame
+        st.session_state.live_sequence = int(changed["Sequence"].max())
+    return frame, len(changed)
+
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+@timed_fragment
+def live_panel(stream):
+    stats = stream.stream.stats()
+    frame, changed = _merged_frame(stream.stream)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Incidents", f"{stats['incidents']:,}")
+    col2.metric("Updates / s", f"{stats['updates_per_second']:,.0f}")
+    col3.metric("Re-scored", f"{stats['rescored']:,}", delta=f"{changed:,} this refresh" if changed else None)
+    col4.metric("Unchanged (skipped)", f"{stats['unchanged']:,}")
+    
+    if frame is None:
+        st.info("Waiting for the first complete incident update…")
+        return
+    
+    bands = frame[SEVERITY_COLUMN].value_counts()
+    st.caption(f"{bands.get('Severe', 0):,} Severe • {bands.get('Moderate', 0):,} Moderate • "
+               f"{bands.get('Minor', 0):,} Minor • {stats['invalid']:,} invalid updates • "
+               f"model {stats['version']} • {stats['mean_score_ms']:.2f} ms per re-score batch")
+    
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        st.markdown("### 🔥 Largest Predicted Fires")
+        st.dataframe(
+            frame.nlargest(LIVE_TABLE_ROWS, PREDICTION_COLUMN)[
+                [PREDICTION_COLUMN, SEVERITY_COLUMN, "PercentContained", "PersonnelInvolved",
+                 "Engines", "Helicopters", "Updated"]
+            ],
+            use_container_width=True,
+            column_config={PREDICTION_COLUMN: st.column_config.NumberColumn("Predicted Acres", format="%.0f")}
+        )
+    with col2:
+        st.markdown("### 🚦 Band Changes")
+        changes = list(stream.stream.band_changes)[-LIVE_BAND_CHANGES:][::-1]
+        if changes:
+            st.dataframe(
+                pd.DataFrame([{
+                    "Time": datetime.fromtimestamp(change["time"]).strftime("%H:%M:%S"),
+                    "Incident": change["incident_id"],
+                    "Change": f"{change['from']} → {change['to']}",
+                    "Acres": round(change["acres"]),
+                } for change in changes]),
+                hide_index=True,
+                use_container_width=True
+            )
+        else:
+            st.caption("No incident has changed severity band yet")
+
+
+def render(predictor):
+    st.markdown("<h1 style='text-align: center;'>Live Incidents</h1>", unsafe_allow_html=True)
+    st.markdown("<div class='accent-line'></div>", unsafe_allow_html=True)
+    st.markdown("<p style='text-align: center; font-size: 16px;'>Predictions re-scored as incident status updates arrive</p>", unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    stream = shared_stream()
+    if stream is None:
+        st.info(f"💡 No incident stream configured. Set `{STREAM_ENV_VAR}` to a JSONL file to follow "
+                f"or `tcp://127.0.0.1:8766` to accept updates on a local socket, then restart the app. "
+                f"Try it headless with `python -m wildfire.stream --jsonl updates.jsonl`.")
+        return
+    
+    live_panel(stream)
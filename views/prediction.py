@@ -0,0 +1,814 @@
+"""📊 Prediction page: incident form, demo scenarios, what-if, optimizer and batch scoring."""
+import copy
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from views.figures import to_spec
+from wildfire import attributions
+from wildfire.batch import DEFAULT_CHUNK_ROWS, score_file
+from wildfire.executor import InferenceTimeout, Overloaded, long_running
+from wildfire.features import FEATURE_COLUMNS, severity_band
+from wildfire.instrumentation import FIGURE_BUILD, FIGURE_RENDER, INPUT_FRAME, timed, timed_fragment
+from wildfire.optimizer import BAND_LIMITS, DEFAULT_UNIT_COSTS, RESOURCE_FEATURES, default_caps, optimize
+from wildfire.scenarios import DEMO_SCENARIOS
+from wildfire.shadow import shared_shadow
+from wildfire.whatif import DEFAULT_POINTS, SWEEP_FEATURES, cached_sweep
+
+
+def _severity_style(prediction):
+    """(severity level, colour, icon, message, recommendation) for a predicted acreage."""
+    if prediction > 100000:
+        severity_level = "Severe"
+        color = "#EF4444"
+        icon = "🚨"
+        message = "Critical situation requiring immediate response"
+        recommendation = """
+        **Immediate Actions:**
+        - Deploy maximum available resources
+        - Initiate evacuation procedures
+        - Request external support
+        - Establish incident command
+        """
+    elif prediction > 10000:
+        severity_level = "Moderate"
+        color = "#F59E0B"
+        icon = "⚠️"
+        message = "Significant fire requiring close monitoring"
+        recommendation = """
+        **Recommended Actions:**
+        - Monitor fire progression closely
+        - Scale up resource allocation
+        - Prepare evacuation routes
+        - Coordinate with agencies
+        """
+    else:
+        severity_level = "Minor"
+        color = "#10B981"
+        icon = "✓"
+        message = "Situation manageable with current resources"
+        recommendation = """
+        **Standard Actions:**
+        - Continue monitoring
+        - Maintain resource levels
+        - Regular status updates
+        - Plan containment strategy
+        """
+    return severity_level, color, icon, message, recommendation
+
+
+@st.cache_resource(show_spinner=False)
+def gauge_template():
+    """The gauge figure, built and validated once; ``gauge_figure`` fills in each prediction."""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=0,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Acres Burned", 'font': {'size': 24, 'color': 'white'}},
+        delta={'reference': 50000, 'increasing': {'color': "red"}},
+        gauge={
+            'axis': {'range': [None, 200000], 'tickcolor': 'white'},
+            'bar': {'color': 'white'},
+            'bgcolor': 'rgba(255, 255, 255, 0.1)',
+            'borderwidth': 2,
+            'bordercolor': 'white',
+            'steps': [
+                {'range': [0, 10000], 'color': 'rgba(16, 185, 129, 0.3)'},
+                {'range': [10000, 100000], 'color': 'rgba(245, 158, 11, 0.3)'},
+                {'range': [100000, 200000], 'color': 'rgba(220, 38, 38, 0.3)'}
+            ],
+            'threshold': {
+                'line': {'color': "white", 'width': 4},
+                'thickness': 0.75,
+                'value': 0
+            }
+        }
+    ))
+    
+    fig.update_layout(
+        paper_bgcolor='#0F172A',
+        plot_bgcolor='#0F172A',
+        font={'color': '#F1F5F9', 'family': 'Inter'},
+        height=350
+    )
+    return to_spec(fig)
+
+
+def gauge_figure(prediction, color, interval=None):
+    """The cached gauge with this prediction's value, bar colour and threshold (and interval band)."""
+    # A copy of its own: the template is shared by every session
+    spec = copy.deepcopy(gauge_template())
+    gauge = spec["data"][0]["gauge"]
+    spec["data"][0]["value"] = float(prediction)
+    gauge["bar"]["color"] = color
+    gauge["threshold"]["value"] = float(prediction)
+    if interval is not None:
+        gauge["steps"].append({'range': [float(interval[0]), float(interval[1])], 'color': 'rgba(255, 255, 255, 0.35)', 'thickness': 0.35})
+    return go.Figure(spec)
+
+
+@st.fragment
+@timed_fragment
+def gauge_panel(prediction, color, interval):
+    """Gauge for one prediction; its interval toggle reruns only this fragment."""
+    shade = interval is not None and st.toggle("Shade the prediction interval", value=True, key="gauge_interval")
+    
+    with timed(FIGURE_BUILD):
+        fig = gauge_figure(prediction, color, interval if shade else None)
+    
+    with timed(FIGURE_RENDER):
+        st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+@timed_fragment
+def prediction_result(predictor, input_features):
+    """Predict button and result; reruns alone on a click, and with the inputs when they change."""
+    # Center the button
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col2:
+        predict_button = st.button("Predict Severity", use_container_width=True)
+    
+    # Prediction
+    if predict_button:
+        if predictor is not None:
+            try:
+                with st.spinner("Analyzing..."):
+                    # Scale input and make prediction
+                    prediction = predictor.predict_one(input_features)
+                    
+                    # Queue the same input for the candidate model, if one is shadowing
+                    shadow = shared_shadow()
+                    if shadow is not None:
+                        shadow.submit([[input_features[col] for col in FEATURE_COLUMNS]], [prediction])
+                    
+                    # Uncertainty: per-tree spread for forests, or the quantile model
+                    interval = None
+                    if predictor.interval_method is not None:
+                        _, lower, upper = predictor.predict_interval([[input_features[col] for col in FEATURE_COLUMNS]])
+                        interval = (float(lower[0]), float(upper[0]))
+            except (Overloaded, InferenceTimeout) as e:
+                st.warning(f"⏳ {e}. The model is busy with other sessions; please try again.")
+            else:
+                # Kept until the inputs change, so other fragments' reruns leave it on screen
+                st.session_state.prediction_result = {
+                    "features": dict(input_features),
+                    "version": predictor.version,
+                    "prediction": prediction,
+                    "interval": interval
+                }
+        else:
+            st.error("Model not available. Please check configuration.")
+    
+    result = st.session_state.get("prediction_result")
+    if predictor is None or result is None or result["features"] != input_features or result["version"] != predictor.version:
+        return
+    
+    prediction, interval = result["prediction"], result["interval"]
+    severity_level, color, icon, message, recommendation = _severity_style(prediction)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Display prediction
+    st.markdown(f"""
+        <div class='prediction-box'>
+            {prediction:,.0f} Acres Predicted
+        </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown(f"""
+        <div class='modern-card' style='border-left: 4px solid {color}; text-align: center;'>
+            <h2 style='color: {color}; margin-bottom: 8px;'>{icon} {severity_level} Fire</h2>
+            <p style='font-size: 15px;'>{message}</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Display gauge chart
+    gauge_panel(prediction, color, interval)
+    
+    if interval is not None:
+        source = "spread of the forest's trees" if predictor.interval_method == "trees" else "quantile model"
+        st.caption(f"{predictor.interval_coverage:.0%} interval: {interval[0]:,.0f} – {interval[1]:,.0f} acres ({source}), shaded on the gauge")
+        low_band, high_band = severity_band(interval[0]), severity_band(interval[1])
+        if low_band != high_band:
+            st.warning(f"⚠️ The interval spans {low_band} to {high_band}: treat the severity call as uncertain")
+    
+    # Why this prediction: per-feature contributions (cached per input)
+    explanation = None
+    if attributions.method(predictor) is not None:
+        start = time.perf_counter()
+        try:
+            explanation = attributions.cached_contributions(predictor, input_features)
+        except (Overloaded, InferenceTimeout) as e:
+            st.warning(f"⏳ {e}. The model is busy with other sessions; please try again.")
+        explain_ms = (time.perf_counter() - start) * 1000
+    
+    if explanation is not None:
+        st.markdown("### 🔍 Why This Prediction")
+        
+        ranked = sorted(explanation["contributions"].items(), key=lambda item: abs(item[1]))
+        
+        with timed(FIGURE_BUILD):
+            contrib_fig = go.Figure(go.Bar(
+                x=[value for _, value in ranked],
+                y=[feature for feature, _ in ranked],
+                orientation='h',
+                marker_color=['#EF4444' if value > 0 else '#10B981' for _, value in ranked],
+                hovertemplate="%{y}: %{x:+,.0f} acres<extra></extra>"
+            ))
+            contrib_fig.update_layout(
+                xaxis_title='Acres added (red) or removed (green)',
+                paper_bgcolor='#0F172A',
+                plot_bgcolor='#0F172A',
+                font={'color': '#F1F5F9', 'family': 'Inter'},
+                height=380,
+                margin={'t': 20}
+            )
+        
+        with timed(FIGURE_RENDER):
+            st.plotly_chart(contrib_fig, use_container_width=True)
+        
+        labels = {"treeshap": "TreeSHAP", "saabas": "tree path contributions", "linear": "linear terms"}
+        st.caption(f"Baseline {explanation['bias']:,.0f} acres plus these contributions gives {prediction:,.0f} acres • {labels[attributions.method(predictor)]} • {explain_ms:.1f} ms")
+    
+    # Recommendations
+    st.markdown("### Recommended Actions")
+    st.markdown(recommendation)
+
+
+@st.fragment
+@timed_fragment
+def whatif_panel(predictor, input_features):
+    """What-If Explorer; its own widgets rerun only this fragment."""
+    # What-If Explorer
+    st.markdown("### 🔀 What-If Explorer")
+    
+    explore = st.toggle(
+        "Sweep resources around the current inputs",
+        key="whatif_enabled",
+        help="Scores a grid of alternatives to the inputs above in one batch"
+    )
+    
+    if explore:
+        if predictor is not None:
+            col1, col2 = st.columns([2, 1])
+            with col1:
+                sweep_features = st.multiselect(
+                    "Inputs to vary (one or two)",
+                    SWEEP_FEATURES,
+                    default=["Helicopters"],
+                    max_selections=2,
+                    key="whatif_features"
+                )
+            with col2:
+                points = st.slider(
+                    "Grid points per input",
+                    min_value=10,
+                    max_value=200,
+                    value=DEFAULT_POINTS,
+                    step=10,
+                    key="whatif_points"
+                )
+            
+            if sweep_features:
+                x_feature = sweep_features[0]
+                y_feature = sweep_features[1] if len(sweep_features) > 1 else None
+                
+                start = time.perf_counter()
+                try:
+                    result = cached_sweep(predictor, input_features, x_feature, y_feature, points)
+                except (Overloaded, InferenceTimeout) as e:
+                    st.warning(f"⏳ {e}. The model is busy with other sessions; please try again.")
+                    return
+                sweep_ms = (time.perf_counter() - start) * 1000
+                
+                with timed(FIGURE_BUILD):
+                    if y_feature is None:
+                        fig = go.Figure(go.Scatter(
+                            x=result["x"],
+                            y=result["acres"],
+                            mode="lines",
+                            line={'color': '#FF6B6B', 'width': 3},
+                            hovertemplate=f"{x_feature}: %{{x:,.0f}}<br>%{{y:,.0f}} acres<extra></extra>"
+                        ))
+                        fig.add_hline(y=10000, line_dash="dot", line_color="#F59E0B", annotation_text="Moderate")
+                        fig.add_hline(y=100000, line_dash="dot", line_color="#EF4444", annotation_text="Severe")
+                        fig.add_vline(x=input_features[x_feature], line_color="white", annotation_text="Current")
+                        fig.update_layout(xaxis_title=x_feature, yaxis_title="Predicted Acres")
+                    else:
+                        fig = go.Figure(go.Heatmap(
+                            x=result["x"],
+                            y=result["y"],
+                            z=result["acres"],
+                            colorscale="YlOrRd",
+                            colorbar={'title': 'Acres'},
+                            hovertemplate=f"{x_feature}: %{{x:,.0f}}<br>{y_feature}: %{{y:,.0f}}<br>%{{z:,.0f}} acres<extra></extra>"
+                        ))
+                        fig.add_trace(go.Scatter(
+                            x=[input_features[x_feature]],
+                            y=[input_features[y_feature]],
+                            mode="markers",
+                            marker={'color': 'white', 'size': 12, 'symbol': 'x'},
+                            name="Current",
+                            hoverinfo="skip"
+                        ))
+                        fig.update_layout(xaxis_title=x_feature, yaxis_title=y_feature)
+                    
+                    fig.update_layout(
+                        paper_bgcolor='#0F172A',
+                        plot_bgcolor='#0F172A',
+                        font={'color': '#F1F5F9', 'family': 'Inter'},
+                        height=420,
+                        showlegend=False
+                    )
+                
+                with timed(FIGURE_RENDER):
+                    st.plotly_chart(fig, use_container_width=True)
+                st.caption(f"{result['acres'].size:,} scenarios scored in {sweep_ms:.1f} ms")
+            else:
+                st.info("Choose at least one input to vary")
+        else:
+            st.error("Model not available. Please check configuration.")
+
+
+@st.fragment
+@timed_fragment
+def optimizer_panel(predictor, input_features):
+    """Resource Optimizer; its own widgets rerun only this fragment."""
+    # Resource Optimizer
+    st.markdown("### 🧮 Resource Optimizer")
+    
+    with st.expander("Find the cheapest resource mix for a target severity", expanded=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            target_band = st.selectbox(
+                "Keep the fire at or below",
+                list(BAND_LIMITS),
+                key="optimizer_band"
+            )
+        with col2:
+            st.markdown("<br>", unsafe_allow_html=True)
+            keep_current = st.checkbox(
+                "Keep at least the resources entered above",
+                value=True,
+                key="optimizer_keep_current",
+                help="Only suggest additions to resources already committed"
+            )
+        
+        caps = default_caps()
+        unit_costs, unit_caps = {}, {}
+        columns = st.columns(len(RESOURCE_FEATURES))
+        for column, feature in zip(columns, RESOURCE_FEATURES):
+            with column:
+                unit_costs[feature] = st.number_input(
+                    f"{feature} cost",
+                    min_value=0,
+                    value=DEFAULT_UNIT_COSTS[feature],
+                    step=100,
+                    key=f"optimizer_cost_{feature}"
+                )
+                unit_caps[feature] = st.number_input(
+                    f"{feature} available",
+                    min_value=0,
+                    value=max(caps[feature], int(input_features[feature])),
+                    step=1,
+                    key=f"optimizer_cap_{feature}"
+                )
+        
+        if st.button("Find Cheapest Mix", key="optimizer_run"):
+            if predictor is not None:
+                minimums = None
+                if keep_current:
+                    minimums = {feature: int(input_features[feature]) for feature in RESOURCE_FEATURES}
+                try:
+                    with st.spinner("Searching..."):
+                        # The search scores many mixes, so it may wait past the usual timeout
+                        result = optimize(
+                            long_running(predictor),
+                            input_features,
+                            band=target_band,
+                            costs=unit_costs,
+                            caps=unit_caps,
+                            minimums=minimums
+                        )
+                except ValueError as e:
+                    st.error(f"❌ {e}")
+                except (Overloaded, InferenceTimeout) as e:
+                    st.warning(f"⏳ {e}. The model is busy with other sessions; please try again.")
+                else:
+                    if result["feasible"]:
+                        st.success(f"✅ Cheapest mix keeping the fire {target_band}: cost {result['cost']:,.0f}")
+                    else:
+                        st.warning(f"⚠️ No mix within the caps keeps the fire {target_band}. Showing the mix with the lowest prediction.")
+                    
+                    columns = st.columns(len(RESOURCE_FEATURES) + 1)
+                    for column, (feature, count) in zip(columns, result["allocation"].items()):
+                        delta = count - int(input_features[feature])
+                        column.metric(feature, f"{count:,}", delta=f"{delta:+,}" if delta else None)
+                    columns[-1].metric("Predicted Acres", f"{result['predicted_acres']:,.0f}", delta=result["severity"], delta_color="off")
+                    st.caption(f"Scored {result['evaluated']:,} of {result['candidates']:,} candidate mixes in {result['elapsed_s']:.2f} s")
+            else:
+                st.error("Model not available. Please check configuration.")
+
+
+@st.fragment
+@timed_fragment
+def incident_panel(predictor):
+    """Demo scenarios and incident inputs, with the sections that depend on them nested.
+
+    Editing an input reruns this fragment (and the nested ones) instead of
+    the whole app: the CSS, sidebar and page header are left alone.
+    """
+    demo_scenarios = DEMO_SCENARIOS
+    
+    # Initialize session state for demo selection
+    if 'selected_demo' not in st.session_state:
+        st.session_state.selected_demo = "Custom Input"
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        selected_demo = st.selectbox(
+            "Load Demo Values",
+            options=list(demo_scenarios.keys()),
+            index=list(demo_scenarios.keys()).index(st.session_state.selected_demo),
+            help="Select a preset scenario to see different prediction outcomes",
+            key="demo_selector",
+            # Update session state before the rerun, so no second rerun is needed
+            on_change=lambda: st.session_state.update(selected_demo=st.session_state.demo_selector)
+        )
+    
+    with col2:
+        # Show expected outcome hint
+        if selected_demo == "Minor Fire (Small Scale)":
+            st.markdown("<div class='modern-card' style='padding: 12px; background: #1E293B; border-left: 3px solid #10B981;'><p style='margin: 0; font-size: 13px; color: #10B981;'>Expected: Minor</p></div>", unsafe_allow_html=True)
+        elif selected_demo == "Moderate Fire (Growing)":
+            st.markdown("<div class='modern-card' style='padding: 12px; background: #1E293B; border-left: 3px solid #F59E0B;'><p style='margin: 0; font-size: 13px; color: #F59E0B;'>Expected: Moderate</p></div>", unsafe_allow_html=True)
+        elif selected_demo == "Severe Fire (Critical)":
+            st.markdown("<div class='modern-card' style='padding: 12px; background: #1E293B; border-left: 3px solid #EF4444;'><p style='margin: 0; font-size: 13px; color: #EF4444;'>Expected: Severe</p></div>", unsafe_allow_html=True)
+        elif selected_demo == "Contained Fire (Nearly Out)":
+            st.markdown("<div class='modern-card' style='padding: 12px; background: #1E293B; border-left: 3px solid #10B981;'><p style='margin: 0; font-size: 13px; color: #10B981;'>Expected: Minor</p></div>", unsafe_allow_html=True)
+        else:
+            st.markdown("<div class='modern-card' style='padding: 12px; background: #1E293B;'><p style='margin: 0; font-size: 13px; color: #94A3B8;'>Custom values</p></div>", unsafe_allow_html=True)
+        
+        # Scenario results are precomputed during model warm-up
+        if predictor is not None and selected_demo in predictor.scenario_predictions:
+            st.caption(f"Precomputed: {predictor.scenario_predictions[selected_demo]:,.0f} acres")
+    
+    demo_data = demo_scenarios[selected_demo]
+    
+    # Show current scenario details
+    if selected_demo != "Custom Input":
+        st.markdown("#### 📊 Current Scenario Values:")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown(f"""
+                <div class='info-card' style='padding: 12px;'>
+                    <p style='margin: 0; font-size: 13px; color: #94A3B8;'>Location</p>
+                    <p style='margin: 4px 0 0 0; font-size: 14px; color: #F1F5F9;'>
+                        County: {demo_data['county']}<br>
+                        Lat: {demo_data['latitude']}<br>
+                        Long: {demo_data['longitude']}
+                    </p>
+                </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown(f"""
+                <div class='info-card' style='padding: 12px;'>
+                    <p style='margin: 0; font-size: 13px; color: #94A3B8;'>Fire Status</p>
+                    <p style='margin: 4px 0 0 0; font-size: 14px; color: #F1F5F9;'>
+                        Containment: {demo_data['percent_contained']}%<br>
+                        Major Incident: {demo_data['major_incident']}
+                    </p>
+                </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown(f"""
+                <div class='info-card' style='padding: 12px;'>
+                    <p style='margin: 0; font-size: 13px; color: #94A3B8;'>Resources</p>
+                    <p style='margin: 4px 0 0 0; font-size: 14px; color: #F1F5F9;'>
+                        Personnel: {demo_data['personnel']} | Engines: {demo_data['engines']}<br>
+                        Helicopters: {demo_data['helicopters']} | Dozers: {demo_data['dozers']}<br>
+                        Water Tenders: {demo_data['water_tenders']}
+                    </p>
+                </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Location Section
+    st.markdown("### 📍 Location")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        county = st.number_input(
+            "County Code",
+            min_value=0,
+            max_value=60,
+            value=demo_data["county"],
+            key="county",
+            help="Encoded county identifier"
+        )
+    
+    with col2:
+        latitude = st.number_input(
+            "Latitude",
+            value=demo_data["latitude"],
+            key="latitude",
+            format="%.4f"
+        )
+    
+    with col3:
+        longitude = st.number_input(
+            "Longitude",
+            value=demo_data["longitude"],
+            key="longitude",
+            format="%.4f"
+        )
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Fire Status
+    st.markdown("### 🔥 Fire Status")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        percent_contained = st.slider(
+            "Containment (%)",
+            min_value=0.0,
+            max_value=100.0,
+            value=demo_data["percent_contained"],
+            key="containment",
+            step=5.0
+        )
+    
+    with col2:
+        major_incident = st.selectbox(
+            "Major Incident",
+            ["No", "Yes"],
+            index=0 if demo_data["major_incident"] == "No" else 1,
+            key="major"
+        )
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Resources
+    st.markdown("### 🚁 Deployed Resources")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        personnel = st.number_input(
+            "Personnel",
+            min_value=0,
+            value=demo_data["personnel"],
+            key="personnel",
+            step=5
+        )
+        
+        engines = st.number_input(
+            "Fire Engines",
+            min_value=0,
+            value=demo_data["engines"],
+            key="engines",
+            step=1
+        )
+    
+    with col2:
+        helicopters = st.number_input(
+            "Helicopters",
+            min_value=0,
+            value=demo_data["helicopters"],
+            key="helicopters",
+            step=1
+        )
+        
+        dozers = st.number_input(
+            "Bulldozers",
+            min_value=0,
+            value=demo_data["dozers"],
+            key="dozers",
+            step=1
+        )
+    
+    with col3:
+        water_tenders = st.number_input(
+            "Water Tenders",
+            min_value=0,
+            value=demo_data["water_tenders"],
+            key="water_tenders",
+            step=1
+        )
+    
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    
+    # Collect model inputs
+    with timed(INPUT_FRAME):
+        input_features = {
+            "Counties": county,
+            "Latitude": latitude,
+            "Longitude": longitude,
+            "PercentContained": percent_contained,
+            "PersonnelInvolved": personnel,
+            "Engines": engines,
+            "Helicopters": helicopters,
+            "Dozers": dozers,
+            "WaterTenders": water_tenders,
+            "MajorIncident": 1 if major_incident == "Yes" else 0
+        }
+    
+    prediction_result(predictor, input_features)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    whatif_panel(predictor, input_features)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    optimizer_panel(predictor, input_features)
+
+
+def _replace_batch_result(result=None):
+    """Store a new batch result, closing (and so deleting) the previous scored file."""
+    previous = st.session_state.pop("batch_result", None)
+    if previous is not None:
+        previous["file"].close()
+    if result is not None:
+        st.session_state.batch_result = result
+
+
+@st.fragment
+@timed_fragment
+def batch_panel(predictor):
+    """Batch Scoring; uploads and clicks rerun only this fragment."""
+    # Batch Scoring
+    st.markdown("### 📁 Batch Scoring")
+    
+    with st.expander("Score a CSV / Parquet incident file", expanded=False):
+        st.markdown(
+            "Upload a file with the ten model columns: `Counties`, `Latitude`, `Longitude`, "
+            "`PercentContained`, `PersonnelInvolved`, `Engines`, `Helicopters`, `Dozers`, "
+            "`WaterTenders`, `MajorIncident`. Extra columns are kept in the output."
+        )
+        
+        uploaded_file = st.file_uploader(
+            "Incident file",
+            type=["csv", "parquet", "pq"],
+            key="batch_file"
+        )
+        
+        chunk_rows = st.number_input(
+            "Rows per chunk",
+            min_value=1000,
+            max_value=500000,
+            value=DEFAULT_CHUNK_ROWS,
+            step=10000,
+            key="batch_chunk_rows",
+            help="Rows scored per vectorized model call"
+        )
+        
+        explain_rows = st.checkbox(
+            "Add per-feature contributions",
+            key="batch_contributions",
+            help="Ten extra columns with the acres each input added or removed"
+        )
+        
+        score_button = st.button("Score File", disabled=uploaded_file is None)
+        
+        if score_button and uploaded_file is not None:
+            if predictor is not None:
+                # Large chunks may take longer than the usual per-call timeout
+                predictor = long_running(predictor)
+                progress_bar = st.progress(0.0, text="Scoring...")
+                # Bounds are added to the output when the model provides intervals
+                use_intervals = predictor.interval_method is not None
+                predict_fn = predictor.predict_interval if use_intervals else predictor.predict_batch
+                shadow = shared_shadow()
+                if shadow is not None:
+                    predict_fn = shadow.wrap(predict_fn)
+                
+                # Scored chunks go straight to a temp file, not to a growing DataFrame.
+                # The file stays on disk for the download and is deleted when the
+                # result is replaced or the session's state is dropped
+                out = tempfile.NamedTemporaryFile(mode="w+", newline="", encoding="utf-8", suffix=".csv")
+                try:
+                    summary = None
+                    for summary in score_file(
+                        uploaded_file,
+                        uploaded_file.name,
+                        predict_fn,
+                        out,
+                        chunk_rows=int(chunk_rows),
+                        intervals=use_intervals,
+                        explain_fn=(lambda X: predictor.predict_contributions(X)[0])
+                        if explain_rows and attributions.method(predictor) is not None else None
+                    ):
+                        progress_bar.progress(
+                            summary["fraction"],
+                            text=f"Scored {summary['rows']:,} rows"
+                        )
+                    out.flush()
+                    _replace_batch_result({
+                        "file_name": uploaded_file.name.rsplit(".", 1)[0] + "_scored.csv",
+                        "file": out,
+                        "summary": summary
+                    })
+                except (ValueError, ImportError) as e:
+                    out.close()
+                    _replace_batch_result()
+                    st.error(f"❌ {e}")
+                except (Overloaded, InferenceTimeout) as e:
+                    out.close()
+                    _replace_batch_result()
+                    st.warning(f"⏳ {e}. The model is busy with other sessions; please try again.")
+                progress_bar.empty()
+            else:
+                st.error("Model not available. Please check configuration.")
+        
+        # Keep the last result across reruns so the download survives the click
+        batch_result = st.session_state.get("batch_result")
+        if batch_result is not None:
+            summary = batch_result["summary"]
+            
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Rows Scored", f"{summary['rows'] - summary['invalid']:,}")
+            col2.metric("Minor", f"{summary['severity']['Minor']:,}")
+            col3.metric("Moderate", f"{summary['severity']['Moderate']:,}")
+            col4.metric("Severe", f"{summary['severity']['Severe']:,}")
+            
+            if summary["uncertain"]:
+                st.caption(f"{summary['uncertain']:,} rows have a prediction interval spanning more than one severity band")
+            
+            if summary["invalid"]:
+                st.warning(f"⚠️ {summary['invalid']:,} rows had missing or non-numeric feature values and were not scored")
+            
+            st.download_button(
+                "Download Scored CSV",
+                # Read from disk only when the button is clicked
+                data=Path(batch_result["file"].name).read_bytes,
+                file_name=batch_result["file_name"],
+                mime="text/csv",
+                use_container_width=True
+            )
+
+
+def render(predictor):
+    st.markdown("<h1 style='text-align: center;'>Wildfire Severity Predictor</h1>", unsafe_allow_html=True)
+    st.markdown("<div class='accent-line'></div>", unsafe_allow_html=True)
+    st.markdown("<p style='text-align: center; font-size: 16px;'>Enter fire incident parameters for accurate severity prediction</p>", unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Quick demo overview
+    st.info("💡 **Quick Start:** Select a demo scenario below to automatically populate all input fields with realistic fire incident data. Each scenario demonstrates different severity levels.")
+    
+    # Demo Scenarios Section
+    st.markdown("### 🎬 Demo Scenarios")
+    
+    # Info box
+    with st.expander("📋 View All Demo Scenarios & Values", expanded=False):
+        st.markdown("**Compare all preset scenarios:**")
+        
+        # Create a comparison table
+        comparison_data = {
+            "Scenario": ["Minor Fire", "Moderate Fire", "Severe Fire", "Contained Fire"],
+            "Containment": ["75%", "30%", "10%", "95%"],
+            "Personnel": ["25", "150", "500", "100"],
+            "Engines": ["5", "25", "75", "15"],
+            "Helicopters": ["1", "5", "15", "3"],
+            "Dozers": ["0", "3", "10", "2"],
+            "Water Tenders": ["1", "8", "20", "5"],
+            "Major Incident": ["No", "Yes", "Yes", "No"],
+            "Expected Output": ["Minor", "Moderate", "Severe", "Minor"]
+        }
+        
+        df_comparison = pd.DataFrame(comparison_data)
+        
+        # Style the dataframe
+        st.dataframe(
+            df_comparison,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "Expected Output": st.column_config.TextColumn(
+                    "Expected Output",
+                    help="Expected severity classification"
+                )
+            }
+        )
+    
+    # Each section below is an st.fragment: a widget edit reruns only the
+    # fragment holding it, not app.py (see benchmarks/bench_reruns.py)
+    incident_panel(predictor)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    batch_panel(predictor)
@@ -0,0 +1,152 @@
+"""🗺️ Risk Map page: predicted acres across California for one incident profile."""
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from wildfire.executor import InferenceTimeout, Overloaded
+from wildfire.features import MINOR_MAX_ACRES, MODERATE_MAX_ACRES
+from wildfire.instrumentation import FIGURE_BUILD, FIGURE_RENDER, timed
+from wildfire.riskgrid import CALIFORNIA_BOUNDS, DEFAULT_RESOLUTION, RiskGrid
+from wildfire.scenarios import DEMO_SCENARIOS, scenario_features
+
+# Newly computed tiles between progressive redraws
+REDRAW_EVERY = 40
+
+# Colour scale in log10(acres): 1 acre to 1M acres
+LOG_RANGE = (0, 6)
+
+
+def _figure(lats, lons, acres):
+    log_acres = np.log10(np.clip(acres, 1, None))
+    fig = go.Figure(go.Heatmap(
+        x=lons,
+        y=lats,
+        z=log_acres,
+        customdata=acres,
+        zmin=LOG_RANGE[0],
+        zmax=LOG_RANGE[1],
+        colorscale=[[0, '#10B981'], [4 / 6, '#F59E0B'], [5 / 6, '#EF4444'], [1, '#7F1D1D']],
+        colorbar={
+            'title': 'Acres',
+            'tickvals': list(range(LOG_RANGE[0], LOG_RANGE[1] + 1)),
+            'ticktext': ['1', '10', '100', '1K', '10K', '100K', '1M']
+        },
+        hovertemplate="%{y:.2f}°N, %{x:.2f}°<br>%{customdata:,.0f} acres<extra></extra>"
+    ))
+    fig.update_layout(
+        xaxis_title='Longitude',
+        yaxis_title='Latitude',
+        # One degree of longitude is ~0.8 of a degree of latitude at 37°N
+        yaxis={'scaleanchor': 'x', 'scaleratio': 1 / np.cos(np.radians(37))},
+        paper_bgcolor='#0F172A',
+        plot_bgcolor='#0F172A',
+        font={'color': '#F1F5F9', 'family': 'Inter'},
+        height=650,
+        margin={'t': 20}
+    )
+    return fig
+
+
+def render(predictor):
+    st.markdown("<h1 style='text-align: center;'>Statewide Risk Map</h1>", unsafe_allow_html=True)
+    st.markdown("<div class='accent-line'></div>", unsafe_allow_html=True)
+    st.markdown("<p style='text-align: center; font-size: 16px;'>Predicted acres burned for the same incident anywhere in California</p>", unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    if predictor is None:
+        st.error("Model not available. Please check configuration.")
+        return
+    
+    # Incident profile (everything except location)
+    st.markdown("### 🧯 Incident Profile")
+    
+    scenario = st.selectbox("Start from", list(DEMO_SCENARIOS), index=2, key="riskmap_scenario")
+    defaults = scenario_features(DEMO_SCENARIOS[scenario])
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        county = st.number_input("County Code", min_value=0, max_value=60, value=int(defaults["Counties"]), key=f"riskmap_county_{scenario}")
+        personnel = st.number_input("Personnel", min_value=0, value=int(defaults["PersonnelInvolved"]), key=f"riskmap_personnel_{scenario}")
+    with col2:
+        percent_contained = st.slider("Containment %", 0.0, 100.0, float(defaults["PercentContained"]), key=f"riskmap_contained_{scenario}")
+        engines = st.number_input("Engines", min_value=0, value=int(defaults["Engines"]), key=f"riskmap_engines_{scenario}")
+    with col3:
+        helicopters = st.number_input("Helicopters", min_value=0, value=int(defaults["Helicopters"]), key=f"riskmap_helicopters_{scenario}")
+        dozers = st.number_input("Dozers", min_value=0, value=int(defaults["Dozers"]), key=f"riskmap_dozers_{scenario}")
+    with col4:
+        water_tenders = st.number_input("Water Tenders", min_value=0, value=int(defaults["WaterTenders"]), key=f"riskmap_water_{scenario}")
+        major_incident = st.selectbox("Major Incident", ["No", "Yes"], index=int(defaults["MajorIncident"]), key=f"riskmap_major_{scenario}")
+    
+    profile = {
+        "Counties": county,
+        "PercentContained": percent_contained,
+        "PersonnelInvolved": personnel,
+        "Engines": engines,
+        "Helicopters": helicopters,
+        "Dozers": dozers,
+        "WaterTenders": water_tenders,
+        "MajorIncident": 1 if major_incident == "Yes" else 0
+    }
+    
+    # View (zoom and pan); only tiles not yet cached for this profile are computed
+    st.markdown("### 🔎 View")
+    south, north, west, east = CALIFORNIA_BOUNDS
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        lat_range = st.slider("Latitude", south, north, (south, north), step=0.5, key="riskmap_lat")
+    with col2:
+        lon_range = st.slider("Longitude", west, east, (west, east), step=0.5, key="riskmap_lon")
+    with col3:
+        resolution = st.selectbox("Cells per tile side", [8, 16, 32], index=[8, 16, 32].index(DEFAULT_RESOLUTION), key="riskmap_resolution")
+    
+    grid = RiskGrid(predictor, profile, resolution=resolution)
+    view = (lat_range[0], lat_range[1], lon_range[0], lon_range[1])
+    
+    # Progressive rendering: cached tiles first, then redraw as new tiles land
+    chart = st.empty()
+    progress = st.empty()
+    tiles = {}
+    computed = 0
+    total = len(grid.tiles_in_view(view))
+    if total == 0:
+        st.info("The view is empty. Widen the Latitude or Longitude range to map it.")
+        return
+    start = time.perf_counter()
+    
+    def redraw():
+        with timed(FIGURE_BUILD):
+            fig = _figure(*grid.mosaic(tiles))
+        with timed(FIGURE_RENDER):
+            chart.plotly_chart(fig, use_container_width=True)
+    
+    try:
+        for row, col, acres, from_cache in grid.iter_tiles(view):
+            if not from_cache and computed == 0 and tiles:
+                redraw()
+            tiles[(row, col)] = acres
+            if not from_cache:
+                computed += 1
+                progress.progress(len(tiles) / total, text=f"Scoring tiles... {len(tiles)}/{total}")
+                if computed % REDRAW_EVERY == 0:
+                    redraw()
+    except (Overloaded, InferenceTimeout) as e:
+        # Tiles scored so far are on disk; a retry only computes the rest
+        progress.empty()
+        st.warning(f"⏳ {e}. The model is busy with other sessions; please try again.")
+        return
+    
+    elapsed = time.perf_counter() - start
+    progress.empty()
+    redraw()
+    
+    # Share of the view in each severity band
+    values = np.concatenate([acres.ravel() for acres in tiles.values()])
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Minor", f"{np.mean(values <= MINOR_MAX_ACRES):.0%}")
+    col2.metric("Moderate", f"{np.mean((values > MINOR_MAX_ACRES) & (values <= MODERATE_MAX_ACRES)):.0%}")
+    col3.metric("Severe", f"{np.mean(values > MODERATE_MAX_ACRES):.0%}")
+    col4.metric("Tiles Computed", f"{computed}/{total}")
+    st.caption(f"{values.size:,} locations • {elapsed * 1000:.0f} ms • County code and all other inputs are held fixed across the map")
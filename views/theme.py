@@ -0,0 +1,208 @@
+"""Global stylesheet injected at the top of every rerun."""
+import streamlit as st
+
+# Custom CSS for modern minimalistic design
+CSS = """
+    <style>
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+    
+    * {
+        font-family: 'Inter', sans-serif;
+    }
+    
+    .stApp {
+        background: #0F172A;
+    }
+    
+    .main {
+        background: #0F172A;
+    }
+    
+    /* Modern Card Design */
+    .modern-card {
+        background: #1E293B;
+        border-radius: 16px;
+        padding: 24px;
+        border: 1px solid #334155;
+        transition: all 0.3s ease;
+        margin: 16px 0;
+    }
+    
+    .modern-card:hover {
+        border-color: #FF6B6B;
+        box-shadow: 0 8px 30px rgba(255, 107, 107, 0.15);
+    }
+    
+    /* Prediction Result Box */
+    .prediction-box {
+        background: linear-gradient(135deg, #FF6B6B 0%, #FF8E53 100%);
+        padding: 32px;
+        border-radius: 20px;
+        text-align: center;
+        color: white;
+        font-size: 28px;
+        font-weight: 600;
+        margin: 24px 0;
+        box-shadow: 0 10px 40px rgba(255, 107, 107, 0.3);
+        letter-spacing: 0.5px;
+    }
+    
+    /* Stat Cards */
+    .stat-box {
+        background: #1E293B;
+        padding: 24px;
+        border-radius: 16px;
+        border: 1px solid #334155;
+        text-align: center;
+        transition: all 0.3s ease;
+    }
+    
+    .stat-box:hover {
+        transform: translateY(-4px);
+        border-color: #FF6B6B;
+        box-shadow: 0 8px 30px rgba(255, 107, 107, 0.2);
+    }
+    
+    .stat-number {
+        font-size: 42px;
+        font-weight: 700;
+        background: linear-gradient(135deg, #FF6B6B 0%, #FF8E53 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        margin-bottom: 8px;
+    }
+    
+    .stat-label {
+        font-size: 14px;
+        color: #94A3B8;
+        font-weight: 400;
+        letter-spacing: 0.5px;
+        text-transform: uppercase;
+    }
+    
+    /* Typography */
+    h1 {
+        color: #F1F5F9 !important;
+        font-weight: 700 !important;
+        letter-spacing: -1px !important;
+        margin-bottom: 8px !important;
+    }
+    
+    h2 {
+        color: #E2E8F0 !important;
+        font-weight: 600 !important;
+        letter-spacing: -0.5px !important;
+    }
+    
+    h3 {
+        color: #CBD5E1 !important;
+        font-weight: 500 !important;
+    }
+    
+    p {
+        color: #94A3B8 !important;
+        line-height: 1.6 !important;
+    }
+    
+    /* Button Styling */
+    .stButton>button {
+        background: linear-gradient(135deg, #FF6B6B 0%, #FF8E53 100%);
+        color: white;
+        font-size: 16px;
+        font-weight: 600;
+        padding: 16px 48px;
+        border-radius: 12px;
+        border: none;
+        box-shadow: 0 4px 20px rgba(255, 107, 107, 0.3);
+        transition: all 0.3s ease;
+        letter-spacing: 0.5px;
+        text-transform: uppercase;
+    }
+    
+    .stButton>button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 30px rgba(255, 107, 107, 0.4);
+    }
+    
+    /* Info Cards */
+    .info-card {
+        background: #1E293B;
+        padding: 20px;
+        border-radius: 12px;
+        border-left: 3px solid #FF6B6B;
+        margin: 12px 0;
+        transition: all 0.3s ease;
+    }
+    
+    .info-card:hover {
+        background: #252F3F;
+        border-left-width: 4px;
+    }
+    
+    .info-card h3, .info-card h4 {
+        color: #F1F5F9 !important;
+        margin-bottom: 8px;
+    }
+    
+    .info-card p {
+        color: #94A3B8 !important;
+        margin: 0;
+    }
+    
+    /* Sidebar Styling */
+    [data-testid="stSidebar"] {
+        background: #1E293B;
+        border-right: 1px solid #334155;
+    }
+    
+    [data-testid="stSidebar"] h1, 
+    [data-testid="stSidebar"] h2, 
+    [data-testid="stSidebar"] h3 {
+        color: #F1F5F9 !important;
+    }
+    
+    /* Input Fields */
+    .stNumberInput>div>div>input,
+    .stSelectbox>div>div>div {
+        background: #1E293B !important;
+        color: #F1F5F9 !important;
+        border: 1px solid #334155 !important;
+        border-radius: 8px !important;
+    }
+    
+    .stSlider>div>div>div>div {
+        background: #FF6B6B !important;
+    }
+    
+    /* Alert Boxes */
+    .stAlert {
+        background: #1E293B;
+        border-radius: 12px;
+        border: 1px solid #334155;
+    }
+    
+    /* Remove default margins */
+    .block-container {
+        padding-top: 2rem;
+    }
+    
+    /* Section Divider */
+    hr {
+        border-color: #334155 !important;
+        margin: 32px 0 !important;
+    }
+    
+    /* Custom accent line */
+    .accent-line {
+        width: 60px;
+        height: 4px;
+        background: linear-gradient(90deg, #FF6B6B 0%, #FF8E53 100%);
+        border-radius: 2px;
+        margin: 16px auto;
+    }
+    </style>
+"""
+
+
+def inject_css():
+    st.markdown(CSS, unsafe_allow_html=True)
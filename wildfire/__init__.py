@@ -0,0 +1,3 @@
+"""Headless helpers for the Wildfire Severity Predictor app."""
+
+from .features import FEATURE_COLUMNS, severity_band
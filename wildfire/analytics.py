@@ -0,0 +1,299 @@
+"""Columnar store and running aggregates for the historical incident data.
+
+    python -m wildfire.analytics ingest California_Fire_Incidents.csv
+    python -m wildfire.analytics refresh      # append rows added to the CSV since
+    python -m wildfire.analytics info
+
+The raw CSV is read once. Each ingest keeps only the training notebook's
+columns and fills missing values with 0, as the notebook does. Each chunk
+is stored as one ``.npy`` file per column, using the narrowest dtype that
+holds its values. County names become uint16 codes plus a dictionary.
+
+``meta.json`` records the parts and how many bytes of the source file
+have been consumed. It also holds the aggregates the Analytics page draws:
+severity-band counts, per-county totals and per-resource deployment
+stats. Every aggregate is a sum, so ``refresh`` only reads rows appended
+to the CSV and adds their totals; the page reads ``meta.json`` and never
+touches the CSV. Appended rows must be whole lines under the same header.
+"""
+import argparse
+import io
+import json
+import os
+import time
+from pathlib import Path
+
+from .features import FEATURE_COLUMNS
+
+DATASET_FILE = "California_Fire_Incidents.csv"
+TARGET_COLUMN = "AcresBurned"
+STORE_ENV_VAR = "WILDFIRE_ANALYTICS_STORE"
+META_FILE = "meta.json"
+STORE_VERSION = 1
+
+# The notebook's selected_columns
+DATASET_COLUMNS = [TARGET_COLUMN] + FEATURE_COLUMNS
+
+RESOURCE_COLUMNS = ["PersonnelInvolved", "Engines", "Helicopters", "Dozers", "WaterTenders"]
+
+# Rows per stored part (and per CSV read)
+PART_ROWS = 100000
+
+BANDS = ("Minor", "Moderate", "Severe")
+
+
+def default_store_dir():
+    from .predictor import DEFAULT_MODEL_DIR
+
+    return Path(os.environ.get(STORE_ENV_VAR) or DEFAULT_MODEL_DIR / ".analytics_store")
+
+
+def _downcast(values):
+    """Return ``values`` in the narrowest int type if integral, else float32."""
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) and np.all(values == np.round(values)):
+        low, high = values.min(), values.max()
+        for dtype in (np.uint8, np.uint16, np.uint32, np.int16, np.int32, np.int64):
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return values.astype(dtype)
+    return values.astype(np.float32)
+
+
+def _empty_aggregates():
+    return {
+        "rows": 0,
+        "acres": 0.0,
+        "severity": {band: 0 for band in BANDS},
+        "counties": {},
+        "resources": {col: {"deployed": 0, "units": 0.0, "acres_deployed": 0.0,
+                            "acres_not_deployed": 0.0} for col in RESOURCE_COLUMNS},
+    }
+
+
+def _chunk_aggregates(frame, bands):
+    """Aggregate one cleaned chunk; every value is additive across chunks."""
+    aggregates = _empty_aggregates()
+    acres = frame[TARGET_COLUMN]
+    aggregates["rows"] = len(frame)
+    aggregates["acres"] = float(acres.sum())
+    for band in BANDS:
+        aggregates["severity"][band] = int((bands == band).sum())
+
+    grouped = frame.assign(Band=bands).groupby("Counties", sort=False)
+    for county, group in grouped:
+        counts = group["Band"].value_counts()
+        aggregates["counties"][str(county)] = {
+            "incidents": len(group),
+            "acres": float(group[TARGET_COLUMN].sum()),
+            "max_acres": float(group[TARGET_COLUMN].max()),
+            **{band: int(counts.get(band, 0)) for band in BANDS},
+        }
+
+    for col in RESOURCE_COLUMNS:
+        deployed = frame[col] > 0
+        aggregates["resources"][col] = {
+            "deployed": int(deployed.sum()),
+            "units": float(frame[col].sum()),
+            "acres_deployed": float(acres[deployed].sum()),
+            "acres_not_deployed": float(acres[~deployed].sum()),
+        }
+    return aggregates
+
+
+def merge_aggregates(total, extra):
+    """Add ``extra`` into ``total`` in place and return it."""
+    total["rows"] += extra["rows"]
+    total["acres"] += extra["acres"]
+    for band in BANDS:
+        total["severity"][band] += extra["severity"][band]
+    for county, stats in extra["counties"].items():
+        current = total["counties"].get(county)
+        if current is None:
+            total["counties"][county] = dict(stats)
+            continue
+        for key, value in stats.items():
+            current[key] = max(current[key], value) if key == "max_acres" else current[key] + value
+    for col, stats in extra["resources"].items():
+        for key, value in stats.items():
+            total["resources"][col][key] += value
+    return total
+
+
+def _clean(frame):
+    """Apply the notebook's preprocessing (minus label encoding) to a raw chunk."""
+    import pandas as pd
+
+    missing = [col for col in DATASET_COLUMNS if col not in frame.columns]
+    if missing:
+        raise ValueError(f"Dataset is missing column(s): {', '.join(missing)}")
+    frame = frame[DATASET_COLUMNS].copy()
+    frame["Counties"] = frame["Counties"].fillna("Unknown").astype(str)
+    major = frame["MajorIncident"]
+    if not pd.api.types.is_bool_dtype(major) and not pd.api.types.is_numeric_dtype(major):
+        major = major.astype(str).str.strip().str.lower().map({"true": 1, "false": 0})
+    frame["MajorIncident"] = major.fillna(0).astype(int)
+    for col in DATASET_COLUMNS:
+        if col not in ("Counties", "MajorIncident"):
+            frame[col] = pd.to_numeric(frame[col], errors="coerce").fillna(0)
+    return frame
+
+
+def read_meta(store_dir=None):
+    """Return the store's metadata, or None if nothing has been ingested."""
+    path = Path(store_dir or default_store_dir()) / META_FILE
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+
+
+def _write_meta(store_dir, meta):
+    path = store_dir / META_FILE
+    tmp = path.with_name(f".{META_FILE}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(meta, indent=1))
+    os.replace(tmp, path)
+
+
+def _write_part(store_dir, index, frame, county_codes):
+    import numpy as np
+
+    from .batch import severity_bands
+
+    part_dir = store_dir / "parts" / f"{index:05d}"
+    part_dir.mkdir(parents=True, exist_ok=True)
+    for name in frame["Counties"].unique():
+        county_codes.setdefault(name, len(county_codes))
+    columns = {
+        "Counties": frame["Counties"].map(county_codes).to_numpy(dtype=np.uint16),
+        "MajorIncident": frame["MajorIncident"].to_numpy(dtype=bool),
+    }
+    for col in DATASET_COLUMNS:
+        if col not in columns:
+            columns[col] = _downcast(frame[col].to_numpy())
+    for col, values in columns.items():
+        np.save(part_dir / f"{col}.npy", values)
+
+    bands = severity_bands(frame[TARGET_COLUMN].to_numpy())
+    return {"name": part_dir.name, "rows": len(frame),
+            "dtypes": {col: values.dtype.str for col, values in columns.items()}}, \
+        _chunk_aggregates(frame, bands)
+
+
+def ingest(csv_path=None, store_dir=None, rebuild=False):
+    """Load new rows of ``csv_path`` into the store and update the aggregates.
+
+    The first call (or ``rebuild``) reads the whole file. Later calls read
+    only the bytes appended since the previous one. A file that shrank or
+    changed its header is rebuilt from scratch. Returns the metadata.
+    """
+    import shutil
+
+    import pandas as pd
+
+    from .predictor import DEFAULT_MODEL_DIR
+
+    csv_path = Path(csv_path or DEFAULT_MODEL_DIR / DATASET_FILE)
+    store_dir = Path(store_dir or default_store_dir())
+    size = csv_path.stat().st_size
+    with open(csv_path, "rb") as f:
+        header_line = f.readline()
+    header = pd.read_csv(io.BytesIO(header_line), nrows=0).columns.tolist()
+
+    meta = None if rebuild else read_meta(store_dir)
+    if meta is not None and (meta.get("store_version") != STORE_VERSION
+                             or meta["source"]["header"] != header
+                             or size < meta["source"]["bytes"]):
+        meta = None
+    if meta is None:
+        shutil.rmtree(store_dir / "parts", ignore_errors=True)
+        store_dir.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "store_version": STORE_VERSION,
+            "source": {"path": str(csv_path.resolve()), "header": header, "bytes": 0},
+            "counties": [],
+            "parts": [],
+            "aggregates": _empty_aggregates(),
+        }
+    if size == meta["source"]["bytes"]:
+        meta["last_ingest"] = {"rows": 0, "seconds": 0.0}
+        return meta
+
+    county_codes = {name: code for code, name in enumerate(meta["counties"])}
+    start = time.perf_counter()
+    with open(csv_path, "rb") as f:
+        if meta["source"]["bytes"]:
+            f.seek(meta["source"]["bytes"])
+            reader = pd.read_csv(f, names=header, header=None, chunksize=PART_ROWS)
+        else:
+            reader = pd.read_csv(f, chunksize=PART_ROWS)
+        new_rows = 0
+        for chunk in reader:
+            part, aggregates = _write_part(store_dir, len(meta["parts"]), _clean(chunk), county_codes)
+            meta["parts"].append(part)
+            merge_aggregates(meta["aggregates"], aggregates)
+            new_rows += part["rows"]
+
+    meta["counties"] = list(county_codes)
+    meta["source"]["bytes"] = size
+    meta["updated"] = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    meta["last_ingest"] = {"rows": new_rows, "seconds": time.perf_counter() - start}
+    _write_meta(store_dir, meta)
+    return meta
+
+
+def refresh(store_dir=None):
+    """Ingest rows appended to the store's source CSV since the last run."""
+    meta = read_meta(store_dir)
+    if meta is None:
+        raise FileNotFoundError("No analytics store yet; run `python -m wildfire.analytics ingest CSV` first")
+    return ingest(meta["source"]["path"], store_dir)
+
+
+def read_column(column, store_dir=None):
+    """Return one stored column across all parts (memory-mapped per part)."""
+    import numpy as np
+
+    store_dir = Path(store_dir or default_store_dir())
+    meta = read_meta(store_dir)
+    if meta is None:
+        raise FileNotFoundError(f"No analytics store at {store_dir}")
+    parts = [np.load(store_dir / "parts" / part["name"] / f"{column}.npy", mmap_mode="r")
+             for part in meta["parts"]]
+    return np.concatenate(parts) if parts else np.empty(0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and update the analytics store")
+    parser.add_argument("--store", default=None, help=f"Store directory (default: ${STORE_ENV_VAR} or .analytics_store)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest_cmd = commands.add_parser("ingest", help="Ingest a CSV (only new rows after the first run)")
+    ingest_cmd.add_argument("csv", nargs="?", default=None, help=f"Dataset CSV (default: {DATASET_FILE})")
+    ingest_cmd.add_argument("--rebuild", action="store_true", help="Discard the store and read the whole file")
+    commands.add_parser("refresh", help="Ingest rows appended to the source CSV")
+    commands.add_parser("info", help="Print store metadata and aggregates")
+    args = parser.parse_args(argv)
+
+    if args.command == "ingest":
+        meta = ingest(args.csv, args.store, rebuild=args.rebuild)
+    elif args.command == "refresh":
+        meta = refresh(args.store)
+    else:
+        meta = read_meta(args.store)
+        if meta is None:
+            raise SystemExit("No analytics store yet")
+        print(json.dumps({key: value for key, value in meta.items() if key != "parts"}, indent=2))
+        return
+
+    store_dir = Path(args.store or default_store_dir())
+    stored = sum(path.stat().st_size for path in (store_dir / "parts").rglob("*.npy"))
+    last = meta.get("last_ingest") or {"rows": 0, "seconds": 0.0}
+    print(f"{meta['aggregates']['rows']:,} rows in {len(meta['parts'])} part(s), "
+          f"{stored / 1024:,.0f} KB on disk; added {last['rows']:,} rows in {last['seconds']:.2f} s")
+    print("Severity:", ", ".join(f"{band} {count:,}" for band, count in meta["aggregates"]["severity"].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Flat, memory-mappable model artifact (``.wfm``).
+
+    python -m wildfire.artifact export [--model-dir DIR] [--out best_fire_model.wfm]
+    python -m wildfire.artifact info best_fire_model.wfm
+
+The pickles need xgboost/sklearn and a full unpickle in every process. A
+``.wfm`` file holds the scaler-folded model from ``wildfire.fused`` as
+plain arrays, together with the scaler parameters, feature order and
+metadata. Loading it maps the file read-only and wraps the arrays in place,
+so nothing is unpickled and every process scoring with the same file
+shares the same page-cache pages.
+
+Layout (all integers little-endian)::
+
+    0   magic  b"WFMA"
+    4   uint32 format version
+    8   uint64 header length N
+    16  N bytes of UTF-8 JSON header
+    ... arrays, each starting on a 64-byte boundary
+
+The header records every array's dtype, shape and byte offset, plus the
+FusedTrees/FusedLinear parameters and free-form ``metadata``.
+"""
+import argparse
+import json
+import mmap
+import struct
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .features import FEATURE_COLUMNS
+from .fused import FusedLinear, FusedTrees, _scaler_params
+
+MAGIC = b"WFMA"
+FORMAT_VERSION = 1
+ARTIFACT_FILE = "best_fire_model.wfm"
+
+_PREAMBLE = struct.Struct("<4sIQ")
+_ALIGN = 64
+
+_TREE_ARRAYS = ("feature", "threshold", "children", "default_left", "value", "roots")
+
+
+def _aligned(offset):
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def export_artifact(predictor, path, metadata=None):
+    """Write ``predictor``'s fused model to ``path`` and return the header."""
+    fused = predictor.fused
+    if fused is None:
+        raise ValueError("Predictor has no fused model to export (see Predictor.compile)")
+
+    if isinstance(fused, FusedTrees):
+        kind = "trees"
+        arrays = {name: getattr(fused, name) for name in _TREE_ARRAYS}
+        # Store indices as int64 so they map back as numpy's native index type
+        for name in ("feature", "children", "roots"):
+            arrays[name] = arrays[name].astype("<i8")
+        params = {"depth": fused.depth, "base": fused.base, "average": fused.average,
+                  "node_values": fused.node_values}
+    else:
+        kind = "linear"
+        arrays = {"coef": fused.coef}
+        params = {"intercept": fused.intercept}
+
+    if predictor.scaler is not None:
+        # The mean and scale the scaler actually applies (see _scaler_params)
+        mean, scale = _scaler_params(predictor.scaler, len(FEATURE_COLUMNS))
+        arrays["scaler_mean"] = mean.astype("<f8")
+        arrays["scaler_scale"] = scale.astype("<f8")
+
+    model = predictor.model
+    header = {
+        "format_version": FORMAT_VERSION,
+        "kind": kind,
+        "feature_columns": list(FEATURE_COLUMNS),
+        "params": params,
+        "metadata": {
+            "source_version": predictor.version,
+            "model_type": type(model).__name__ if model is not None else None,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            **(metadata or {}),
+        },
+        "arrays": {},
+    }
+
+    # Offsets depend on the header size, so lay the arrays out relative to 0
+    # first and shift them once the header is serialized
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        layout[name] = (array, offset)
+        offset = _aligned(offset + array.nbytes)
+
+    def encode(data_start):
+        header["arrays"] = {
+            name: {"dtype": array.dtype.str, "shape": list(array.shape),
+                   "offset": data_start + rel}
+            for name, (array, rel) in layout.items()
+        }
+        return json.dumps(header).encode()
+
+    data_start = _aligned(_PREAMBLE.size + len(encode(0)))
+    encoded = encode(data_start)
+    # Offsets may have gained digits; re-pad until the header fits
+    while _PREAMBLE.size + len(encoded) > data_start:
+        data_start = _aligned(_PREAMBLE.size + len(encoded))
+        encoded = encode(data_start)
+
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(encoded)))
+        f.write(encoded)
+        for name, (array, rel) in layout.items():
+            f.seek(data_start + rel)
+            f.write(array.tobytes())
+    tmp.replace(path)
+    return header
+
+
+def read_header(path):
+    """Return the JSON header of a ``.wfm`` file without mapping its arrays."""
+    with open(path, "rb") as f:
+        magic, version, length = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a wildfire model artifact")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported artifact format version {version} in {path}")
+        return json.loads(f.read(length))
+
+
+class MappedScaler:
+    """The fitted ``mean_`` and ``scale_`` of the scaler a ``.wfm`` was exported with."""
+
+    def __init__(self, mean, scale):
+        self.mean_ = mean
+        self.scale_ = scale
+
+    def transform(self, X):
+        return (np.asarray(X, dtype=np.float64) - self.mean_) / self.scale_
+
+
+def load_artifact(path):
+    """Map a ``.wfm`` file and return (fused_model, scaler, header).
+
+    ``scaler`` is a MappedScaler, or None when the file stores no scaler.
+    The returned arrays are read-only views of the shared mapping, which
+    stays open for as long as any of them is referenced.
+    """
+    header = read_header(path)
+    if header["feature_columns"] != FEATURE_COLUMNS:
+        raise ValueError(f"Artifact {path} was built for different feature columns")
+
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        arrays[name] = np.frombuffer(mapping, dtype=dtype, count=count,
+                                     offset=spec["offset"]).reshape(spec["shape"])
+
+    params = dict(header["params"])
+    if header["kind"] == "trees":
+        # Files written before node_values was recorded: do not trust them
+        params.setdefault("node_values", False)
+        fused = FusedTrees(**{name: arrays[name] for name in _TREE_ARRAYS}, **params)
+    elif header["kind"] == "linear":
+        fused = FusedLinear(arrays["coef"], params["intercept"])
+    else:
+        raise ValueError(f"Unknown artifact kind: {header['kind']}")
+    scaler = None
+    if "scaler_mean" in arrays:
+        scaler = MappedScaler(arrays["scaler_mean"], arrays["scaler_scale"])
+    return fused, scaler, header
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export or inspect memory-mappable model artifacts")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Write a .wfm file from the model pickles")
+    export.add_argument("--model-dir", default=None,
+                        help="Directory holding best_fire_model.pkl and scaler.pkl")
+    export.add_argument("--out", default=None, help=f"Output path (default: <model-dir>/{ARTIFACT_FILE})")
+
+    info = commands.add_parser("info", help="Print an artifact header")
+    info.add_argument("path")
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        from .predictor import DEFAULT_MODEL_DIR, Predictor
+
+        predictor = Predictor.load(args.model_dir)
+        out = Path(args.out) if args.out else Path(args.model_dir or DEFAULT_MODEL_DIR) / ARTIFACT_FILE
+        header = export_artifact(predictor, out)
+        print(f"Wrote {out} ({out.stat().st_size:,} bytes, {header['kind']}, "
+              f"source version {header['metadata']['source_version']})")
+    else:
+        header = read_header(args.path)
+        print(json.dumps({key: value for key, value in header.items() if key != "arrays"}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Per-feature contributions to a prediction ("why this many acres?").
+
+``contributions(predictor, X)`` returns, for each row, how many acres
+each of the ten inputs added to or removed from a bias term. The bias
+plus the row's contributions equals the prediction. The method depends on
+the model:
+
+* ``"treeshap"``: XGBoost, exact TreeSHAP values from the booster's
+  native ``pred_contribs`` path. A model loaded from a ``.wfm`` has no
+  booster and no attributions.
+* ``"saabas"``: scikit-learn trees and forests. Each split on a row's path
+  credits its feature with the change in node value, computed in one
+  vectorized pass over the fused trees.
+* ``"linear"``: linear models, coefficient times the input's distance
+  from the training mean. This is exact.
+
+Contributions are in the model's raw feature space. The scaler is an
+affine map of each feature on its own, so it does not move credit
+between features. ``cached_contributions`` keeps single-row results in a
+small LRU keyed by input vector and model version; it computes misses
+through ``predictor.predict_contributions``, so an executor-bound
+predictor (``wildfire.executor``) computes them on its workers.
+"""
+import threading
+
+from .cache import PredictionCache, feature_key
+from .features import FEATURE_COLUMNS
+
+ATTRIBUTION_CACHE_SIZE = 1024
+
+_attribution_cache = None
+_attribution_lock = threading.Lock()
+
+
+def method(predictor):
+    """"treeshap", "saabas", "linear" or None for ``predictor``."""
+    from .fused import FusedLinear, FusedTrees
+
+    if predictor.model is not None and hasattr(predictor.model, "get_booster"):
+        return "treeshap"
+    # Without node values (XGBoost loaded from a .wfm) path credits would be wrong
+    if isinstance(predictor.fused, FusedTrees) and predictor.fused.node_values:
+        return "saabas"
+    if isinstance(predictor.fused, FusedLinear):
+        return "linear"
+    return None
+
+
+def contributions(predictor, X):
+    """Return (contributions (n, 10), bias (n,)) for a DataFrame or (n, 10) array.
+
+    Raises ValueError when the model supports none of the methods.
+    """
+    import numpy as np
+
+    X = predictor._array(X)
+    kind = method(predictor)
+    if kind == "treeshap":
+        from xgboost import DMatrix
+
+        from .fused import _scaler_params
+
+        mean, scale = _scaler_params(predictor.scaler, X.shape[1])
+        values = predictor.model.get_booster().predict(DMatrix((X - mean) / scale), pred_contribs=True)
+        values = np.asarray(values, dtype=np.float64)
+        return values[:, :-1], values[:, -1]
+    if kind == "saabas":
+        values, bias = predictor.fused.path_contributions(X)
+        return values, np.full(len(X), bias)
+    if kind == "linear":
+        from .fused import _scaler_params
+
+        fused = predictor.fused
+        mean, _ = _scaler_params(predictor.scaler, X.shape[1])
+        return (X - mean) * fused.coef, np.full(len(X), fused.intercept + fused.coef @ mean)
+    raise ValueError("Feature contributions are not available for this model")
+
+
+def cached_contributions(predictor, features):
+    """Contributions for one {column: value} incident, cached per input and model version.
+
+    Returns {"bias": acres, "contributions": {column: acres}}.
+    """
+    global _attribution_cache
+    with _attribution_lock:
+        if _attribution_cache is None:
+            _attribution_cache = PredictionCache(ATTRIBUTION_CACHE_SIZE)
+    cache = _attribution_cache
+
+    key = feature_key(features)
+    result = cache.get(key, predictor.version)
+    if result is None:
+        values, bias = predictor.predict_contributions([key])
+        result = {"bias": float(bias[0]),
+                  "contributions": dict(zip(FEATURE_COLUMNS, values[0].tolist()))}
+        cache.put(key, predictor.version, result)
+    return result
+
+
+def contribution_columns():
+    """Output column names for batch contributions, in FEATURE_COLUMNS order."""
+    return [f"{col}Contribution" for col in FEATURE_COLUMNS]
@@ -0,0 +1,186 @@
+"""Chunked scoring of uploaded incident files (CSV or Parquet).
+
+Files are read, validated and scored one chunk at a time so that a large
+upload never exists in memory as a single DataFrame. Scored chunks are
+appended straight to the output stream as CSV.
+"""
+import numpy as np
+import pandas as pd
+
+from .features import FEATURE_COLUMNS, MINOR_MAX_ACRES, MODERATE_MAX_ACRES
+
+DEFAULT_CHUNK_ROWS = 50000
+
+PREDICTION_COLUMN = "PredictedAcres"
+LOWER_COLUMN = "PredictedAcresLow"
+UPPER_COLUMN = "PredictedAcresHigh"
+SEVERITY_COLUMN = "Severity"
+
+_MAJOR_INCIDENT_VALUES = {
+    "yes": 1, "true": 1, "1": 1, "1.0": 1,
+    "no": 0, "false": 0, "0": 0, "0.0": 0,
+}
+
+
+def file_format(name):
+    """Return "csv" or "parquet" based on the file name extension."""
+    lowered = name.lower()
+    if lowered.endswith(".csv"):
+        return "csv"
+    if lowered.endswith((".parquet", ".pq")):
+        return "parquet"
+    raise ValueError(f"Unsupported file type: {name} (expected .csv or .parquet)")
+
+
+def validate_columns(columns):
+    """Raise ValueError if any of the ten model features is missing."""
+    missing = [col for col in FEATURE_COLUMNS if col not in set(columns)]
+    if missing:
+        raise ValueError(f"Missing required column(s): {', '.join(missing)}")
+
+
+def _file_size(fileobj):
+    position = fileobj.tell()
+    fileobj.seek(0, 2)
+    size = fileobj.tell()
+    fileobj.seek(position)
+    return size
+
+
+def _parquet_file(fileobj):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet support requires pyarrow (pip install pyarrow)") from e
+    return pq.ParquetFile(fileobj)
+
+
+def read_columns(fileobj, fmt):
+    """Read only the header/schema of an incident file and rewind it."""
+    fileobj.seek(0)
+    if fmt == "csv":
+        columns = list(pd.read_csv(fileobj, nrows=0).columns)
+    else:
+        columns = list(_parquet_file(fileobj).schema_arrow.names)
+    fileobj.seek(0)
+    return columns
+
+
+def iter_chunks(fileobj, fmt, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Yield (chunk, fraction_done) pairs without loading the whole file."""
+    fileobj.seek(0)
+    if fmt == "csv":
+        total_bytes = max(_file_size(fileobj), 1)
+        for chunk in pd.read_csv(fileobj, chunksize=chunk_rows):
+            yield chunk, min(fileobj.tell() / total_bytes, 1.0)
+    else:
+        parquet = _parquet_file(fileobj)
+        total_rows = max(parquet.metadata.num_rows, 1)
+        rows_read = 0
+        for batch in parquet.iter_batches(batch_size=chunk_rows):
+            rows_read += batch.num_rows
+            yield batch.to_pandas(), min(rows_read / total_rows, 1.0)
+
+
+def _major_incident(series):
+    if pd.api.types.is_bool_dtype(series):
+        return series.astype(np.float64)
+    if pd.api.types.is_numeric_dtype(series):
+        return pd.to_numeric(series, errors="coerce")
+    return series.astype(str).str.strip().str.lower().map(_MAJOR_INCIDENT_VALUES)
+
+
+def prepare_features(chunk):
+    """Return the numeric feature frame of a chunk and a mask of usable rows."""
+    features = pd.DataFrame(index=chunk.index)
+    for col in FEATURE_COLUMNS:
+        if col == "MajorIncident":
+            features[col] = _major_incident(chunk[col])
+        else:
+            features[col] = pd.to_numeric(chunk[col], errors="coerce")
+    features = features.astype(np.float64)
+    valid = features.notna().all(axis=1).to_numpy()
+    return features, valid
+
+
+def severity_bands(acres):
+    """Vectorized equivalent of features.severity_band (NaN stays empty)."""
+    acres = np.asarray(acres, dtype=np.float64)
+    bands = np.select(
+        [acres > MODERATE_MAX_ACRES, acres > MINOR_MAX_ACRES, acres >= -np.inf],
+        ["Severe", "Moderate", "Minor"],
+        default="",
+    )
+    return bands.astype(object)
+
+
+def score_file(fileobj, name, predict_fn, out, chunk_rows=DEFAULT_CHUNK_ROWS, intervals=False,
+               explain_fn=None):
+    """Score an incident file chunk by chunk, writing CSV rows to ``out``.
+
+    ``predict_fn`` receives a DataFrame holding FEATURE_COLUMNS and returns
+    one prediction per row. The original columns are kept and the
+    prediction and severity band are appended. Rows with missing or
+    non-numeric feature values are written with an empty prediction.
+
+    With ``intervals``, ``predict_fn`` returns (prediction, lower, upper)
+    instead (as ``Predictor.predict_interval`` does). The bounds are
+    written too, and rows whose interval spans more than one severity band
+    are counted as ``uncertain``.
+
+    ``explain_fn`` optionally returns an (n, 10) array of per-feature
+    contributions (``wildfire.attributions``), written as one
+    ``<feature>Contribution`` column per input.
+
+    This is a generator yielding a progress dict after every chunk so the
+    caller can drive a progress bar.
+    """
+    from .attributions import contribution_columns
+
+    fmt = file_format(name)
+    columns = read_columns(fileobj, fmt)
+    validate_columns(columns)
+
+    progress = {"rows": 0, "invalid": 0, "fraction": 0.0,
+                "severity": {"Minor": 0, "Moderate": 0, "Severe": 0}, "uncertain": 0}
+    extra_columns = [LOWER_COLUMN, UPPER_COLUMN] if intervals else []
+    explain_columns = contribution_columns() if explain_fn is not None else []
+    first = True
+    for chunk, fraction in iter_chunks(fileobj, fmt, chunk_rows):
+        features, valid = prepare_features(chunk)
+
+        predictions = np.full(len(chunk), np.nan)
+        bounds = np.full((2, len(chunk)), np.nan)
+        if valid.any():
+            if intervals:
+                predictions[valid], bounds[0, valid], bounds[1, valid] = predict_fn(features[valid])
+            else:
+                predictions[valid] = predict_fn(features[valid])
+
+        chunk[PREDICTION_COLUMN] = predictions
+        if intervals:
+            chunk[LOWER_COLUMN], chunk[UPPER_COLUMN] = bounds
+            progress["uncertain"] += int((severity_bands(bounds[0]) != severity_bands(bounds[1]))[valid].sum())
+        chunk[SEVERITY_COLUMN] = severity_bands(predictions)
+        if explain_fn is not None:
+            values = np.full((len(chunk), len(explain_columns)), np.nan)
+            if valid.any():
+                values[valid] = explain_fn(features[valid])
+            chunk[explain_columns] = values
+        chunk.to_csv(out, index=False, header=first)
+        first = False
+
+        bands, counts = np.unique(chunk[SEVERITY_COLUMN][valid], return_counts=True)
+        for band, count in zip(bands, counts):
+            progress["severity"][band] += int(count)
+        progress["rows"] += len(chunk)
+        progress["invalid"] += int((~valid).sum())
+        progress["fraction"] = fraction
+        yield progress
+
+    # Header-only upload: still produce a well-formed (empty) CSV
+    if first:
+        empty = pd.DataFrame(columns=columns + [PREDICTION_COLUMN] + extra_columns + [SEVERITY_COLUMN] + explain_columns)
+        empty.to_csv(out, index=False)
+        progress["fraction"] = 1.0
+        yield progress
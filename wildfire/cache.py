@@ -0,0 +1,91 @@
+"""Process-wide LRU cache of predictions keyed on the input feature vector.
+
+Entries are keyed by the model artifact version they were computed with
+as well as the features, so a retrained model never serves stale
+predictions. Versions share one LRU: during a hot reload the old and new
+predictor both use the cache, and the old version's entries simply age
+out once nothing looks them up.
+"""
+import threading
+from collections import OrderedDict
+
+from .features import FEATURE_COLUMNS
+
+DEFAULT_MAXSIZE = 4096
+
+# Decimal places kept when canonicalizing feature values
+KEY_DECIMALS = 6
+
+
+def feature_key(features):
+    """Canonical, hashable key for a {column: value} incident.
+
+    Values are ordered by FEATURE_COLUMNS and converted to rounded floats,
+    so ``10``, ``10.0`` and ``np.int64(10)`` map to the same key.
+    """
+    # Adding 0.0 folds -0.0 into 0.0
+    return tuple(round(float(features[col]), KEY_DECIMALS) + 0.0 for col in FEATURE_COLUMNS)
+
+
+class PredictionCache:
+    """Bounded, thread-safe LRU mapping feature keys to predictions."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        # Version of the latest put, for stats
+        self.version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, version):
+        """Return the cached value for ``key`` under ``version`` or None."""
+        with self._lock:
+            value = self._entries.get((version, key))
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((version, key))
+            self.hits += 1
+            return value
+
+    def put(self, key, version, value):
+        with self._lock:
+            self.version = version
+            self._entries[(version, key)] = value
+            self._entries.move_to_end((version, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "evictions": self.evictions,
+                "version": self.version,
+            }
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache(maxsize=DEFAULT_MAXSIZE):
+    """Return the process-wide PredictionCache, creating it on first use."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = PredictionCache(maxsize)
+        return _shared_cache
@@ -0,0 +1,301 @@
+"""Shared inference executor: bounded, thread-budgeted model calls for every session.
+
+Each Streamlit session runs its script on its own thread, and all of them
+share one predictor. Called directly, N sessions scoring at once start N
+native predicts, and each of those spreads over every core (XGBoost and
+scikit-learn default to all of them). The cores end up oversubscribed and
+tail latency grows with the number of sessions.
+
+``InferenceExecutor`` runs those calls on ``workers`` threads instead,
+with at most ``threads`` native threads each. Every worker applies
+``threadpoolctl`` limits (OpenMP thread counts are per calling thread),
+and calls go to a copy of the predictor whose models have ``n_jobs`` set
+to ``threads``. The predictor itself is left alone, so callers outside
+the executor keep the models' own thread counts. Pending calls wait on a
+bounded queue. A call arriving when ``max_queue`` are already waiting
+raises ``Overloaded`` straight away, and one not finished within its
+timeout raises ``InferenceTimeout``. A timed-out call that has not
+started yet is dropped from the queue; one that is already running
+cannot be interrupted and keeps its worker until it finishes. Calls that
+are expected to be slow (scoring an uploaded file, the resource search)
+therefore use ``long_running(predictor)``, which waits ``long_timeout``
+instead.
+
+``bind(predictor)`` returns a stand-in whose ``predict_*`` methods go
+through the executor and whose other attributes are the predictor's, so
+pages use it unchanged. The app shares one executor per process
+(``shared_executor``), configured by the environment:
+
+- ``WILDFIRE_INFERENCE_WORKERS``: worker threads (default: one per core;
+  ``0`` calls the predictor directly on the session thread)
+- ``WILDFIRE_INFERENCE_THREADS``: native threads per worker (default 1)
+- ``WILDFIRE_INFERENCE_QUEUE``: calls allowed to wait (default 64)
+- ``WILDFIRE_INFERENCE_TIMEOUT``: seconds per call (default 30)
+- ``WILDFIRE_INFERENCE_LONG_TIMEOUT``: seconds per long-running call
+  (default 600)
+
+See ``benchmarks/load_sessions.py`` for throughput and tail latency under
+concurrent sessions.
+"""
+import copy
+import functools
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from .instrumentation import INFERENCE_WAIT, timings
+from .metrics import LatencyRecorder
+
+WORKERS_ENV_VAR = "WILDFIRE_INFERENCE_WORKERS"
+THREADS_ENV_VAR = "WILDFIRE_INFERENCE_THREADS"
+QUEUE_ENV_VAR = "WILDFIRE_INFERENCE_QUEUE"
+TIMEOUT_ENV_VAR = "WILDFIRE_INFERENCE_TIMEOUT"
+LONG_TIMEOUT_ENV_VAR = "WILDFIRE_INFERENCE_LONG_TIMEOUT"
+
+DEFAULT_THREADS = 1
+DEFAULT_MAX_QUEUE = 64
+DEFAULT_TIMEOUT_SECONDS = 30.0
+DEFAULT_LONG_TIMEOUT_SECONDS = 600.0
+
+# Predictor methods routed through the executor by bind()
+BOUND_METHODS = ("predict_batch", "predict_one", "predict_interval", "predict_reference",
+                 "predict_contributions")
+
+logger = logging.getLogger(__name__)
+
+
+class Overloaded(Exception):
+    """Raised when the queue of pending inference calls is full."""
+
+
+class InferenceTimeout(TimeoutError):
+    """Raised when an inference call does not finish within its timeout."""
+
+
+def available_cores():
+    """Cores this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def limit_model_threads(predictor, threads):
+    """Set ``n_jobs`` on the predictor's native models (and interval models) to ``threads``."""
+    models = [predictor.model]
+    if predictor.interval_model is not None:
+        models += [predictor.interval_model[bound] for bound in ("lower", "upper")]
+    for model in models:
+        if model is not None and "n_jobs" in getattr(model, "get_params", dict)():
+            model.set_params(n_jobs=threads)
+
+
+def _thread_limited_model(model, threads):
+    """Copy of ``model`` using ``threads`` native threads; fitted trees are shared where possible."""
+    if model is None or "n_jobs" not in getattr(model, "get_params", dict)():
+        return model
+    limited = copy.copy(model)
+    booster = getattr(model, "_Booster", None)
+    if booster is not None:
+        # XGBoost keeps n_jobs on the booster, which a shallow copy would share
+        limited._Booster = booster.copy()
+    return limited.set_params(n_jobs=threads)
+
+
+def thread_limited(predictor, threads):
+    """Shallow copy of ``predictor`` whose native models use ``threads`` threads.
+
+    The predictor and its models are not modified, so other callers keep
+    their own thread counts.
+    """
+    limited = copy.copy(predictor)
+    limited.model = _thread_limited_model(predictor.model, threads)
+    if predictor.interval_model is not None:
+        limited.interval_model = {**predictor.interval_model, **{
+            bound: _thread_limited_model(predictor.interval_model[bound], threads) for bound in ("lower", "upper")
+        }}
+    return limited
+
+
+class InferenceExecutor:
+    """Worker threads serving inference calls from a bounded queue."""
+
+    def __init__(self, workers=None, threads=DEFAULT_THREADS, max_queue=DEFAULT_MAX_QUEUE,
+                 timeout=DEFAULT_TIMEOUT_SECONDS, long_timeout=DEFAULT_LONG_TIMEOUT_SECONDS):
+        self.workers = available_cores() if workers is None else workers
+        self.threads = threads
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.long_timeout = long_timeout
+        self.latency = LatencyRecorder()
+        self.wait = LatencyRecorder()
+        self.rejected = 0
+        self.timed_out = 0
+        self.running = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Predictor -> its thread-limited copy
+        self._limited = weakref.WeakKeyDictionary()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"inference-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _submit(self, fn, *args, **kwargs):
+        """Queue ``fn(*args, **kwargs)``; returns a Future. Raises Overloaded when the queue is full."""
+        future = Future()
+        try:
+            self._queue.put_nowait((future, functools.partial(fn, *args, **kwargs), time.perf_counter()))
+        except queue.Full:
+            with self._lock:
+                self.rejected += 1
+            raise Overloaded(f"Inference queue full ({self.max_queue} pending calls)")
+        return future
+
+    def run(self, fn, *args, timeout=None, **kwargs):
+        """Call ``fn(*args, **kwargs)`` on a worker and return its result.
+
+        Waits at most ``timeout`` seconds (default ``self.timeout``). Calls
+        made from a worker, or with no workers, run on the calling thread.
+        """
+        if not self._threads or getattr(self._local, "worker", False):
+            return fn(*args, **kwargs)
+        started = time.perf_counter()
+        future = self._submit(fn, *args, **kwargs)
+        timeout = self.timeout if timeout is None else timeout
+        error = True
+        try:
+            result, stages = future.result(timeout)
+            error = False
+        except FutureTimeout:
+            future.cancel()
+            with self._lock:
+                self.timed_out += 1
+            raise InferenceTimeout(f"Inference did not finish within {timeout:g} s")
+        finally:
+            self.latency.record(time.perf_counter() - started, error=error)
+        # Stages timed on the worker count towards this thread's rerun
+        timings.merge_run(stages)
+        return result
+
+    def bind(self, predictor):
+        """``predictor`` with its predict methods run here (``predictor`` itself without workers).
+
+        The calls go to a copy of ``predictor`` limited to ``self.threads``
+        native threads, made on its first bind.
+        """
+        if predictor is None or not self._threads:
+            return predictor
+        with self._lock:
+            limited = self._limited.get(predictor)
+            if limited is None:
+                limited = self._limited[predictor] = thread_limited(predictor, self.threads)
+        return BoundPredictor(predictor, self, limited)
+
+    def _run(self):
+        from threadpoolctl import threadpool_limits
+
+        self._local.worker = True
+        with threadpool_limits(limits=self.threads):
+            while True:
+                future, call, queued = self._queue.get()
+                # False when the caller timed out while this call was queued
+                if not future.set_running_or_notify_cancel():
+                    continue
+                waited = time.perf_counter() - queued
+                self.wait.record(waited)
+                with self._lock:
+                    self.running += 1
+                try:
+                    with timings.collect() as stages:
+                        timings.record(INFERENCE_WAIT, waited)
+                        result = call()
+                    future.set_result((result, stages))
+                except BaseException as e:
+                    future.set_exception(e)
+                finally:
+                    with self._lock:
+                        self.running -= 1
+
+    def stats(self):
+        """Call latency percentiles plus queue wait, depth and rejection counters."""
+        snapshot = self.latency.snapshot()
+        wait = self.wait.snapshot()
+        with self._lock:
+            snapshot.update({
+                "workers": self.workers,
+                "threads": self.threads,
+                "max_queue": self.max_queue,
+                "timeout_s": self.timeout,
+                "long_timeout_s": self.long_timeout,
+                "queue_depth": self._queue.qsize(),
+                "running": self.running,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+            })
+        snapshot.update({"wait_p50_ms": wait["p50_ms"], "wait_p99_ms": wait["p99_ms"]})
+        return snapshot
+
+
+class BoundPredictor:
+    """A Predictor whose predict methods run on an InferenceExecutor.
+
+    ``limited`` is the thread-limited copy the calls go to; every other
+    attribute is read from ``predictor``.
+    """
+
+    def __init__(self, predictor, executor, limited=None, timeout=None):
+        self.predictor = predictor
+        self.executor = executor
+        self.limited = predictor if limited is None else limited
+        self.timeout = timeout
+
+    def __getattr__(self, name):
+        if name in BOUND_METHODS:
+            return functools.partial(self.executor.run, getattr(self.limited, name), timeout=self.timeout)
+        return getattr(self.predictor, name)
+
+    def long_running(self):
+        """This predictor with the executor's ``long_timeout`` per call."""
+        return BoundPredictor(self.predictor, self.executor, self.limited, self.executor.long_timeout)
+
+
+def long_running(predictor):
+    """``predictor`` allowed the executor's long timeout, for batch files and searches.
+
+    Predictors not bound to an executor are returned unchanged.
+    """
+    if isinstance(predictor, BoundPredictor):
+        return predictor.long_running()
+    return predictor
+
+
+_shared_executor = None
+_shared_lock = threading.Lock()
+
+
+def shared_executor():
+    """Return the process-wide InferenceExecutor, configured from the environment."""
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None:
+            workers = os.environ.get(WORKERS_ENV_VAR)
+            _shared_executor = InferenceExecutor(
+                workers=int(workers) if workers else None,
+                threads=int(os.environ.get(THREADS_ENV_VAR, DEFAULT_THREADS)),
+                max_queue=int(os.environ.get(QUEUE_ENV_VAR, DEFAULT_MAX_QUEUE)),
+                timeout=float(os.environ.get(TIMEOUT_ENV_VAR, DEFAULT_TIMEOUT_SECONDS)),
+                long_timeout=float(os.environ.get(LONG_TIMEOUT_ENV_VAR, DEFAULT_LONG_TIMEOUT_SECONDS)),
+            )
+            logger.info("Inference executor: %d worker(s) x %d thread(s), queue %d, timeout %g s (long %g s)",
+                        _shared_executor.workers, _shared_executor.threads, _shared_executor.max_queue,
+                        _shared_executor.timeout, _shared_executor.long_timeout)
+        return _shared_executor
@@ -0,0 +1,21 @@
+"""Model input schema and severity bands shared by the app and batch tools."""
+
+# Column order the scaler and model were fitted with (see the training notebook)
+FEATURE_COLUMNS = [
+    "Counties", "Latitude", "Longitude", "PercentContained",
+    "PersonnelInvolved", "Engines", "Helicopters", "Dozers",
+    "WaterTenders", "MajorIncident",
+]
+
+# Upper acre bounds of the severity bands shown on the Prediction page
+MINOR_MAX_ACRES = 10000
+MODERATE_MAX_ACRES = 100000
+
+
+def severity_band(acres):
+    """Return "Minor", "Moderate" or "Severe" for a predicted acreage."""
+    if acres > MODERATE_MAX_ACRES:
+        return "Severe"
+    if acres > MINOR_MAX_ACRES:
+        return "Moderate"
+    return "Minor"
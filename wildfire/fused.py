@@ -0,0 +1,314 @@
+"""Scaler-folded models evaluated directly on raw feature vectors.
+
+The app scales inputs with a StandardScaler before the regressor sees them,
+so every split ``(x - mean) / scale < t`` can be rewritten once, at load
+time, as ``x < t * scale + mean``. The compiled model then evaluates raw
+numpy rows without going through pandas or the sklearn/xgboost input
+validation, which dominates single-row latency.
+
+Both libraries compare float32 copies of the scaled inputs, so each folded
+threshold is placed on the float64 midpoint between the two float32 values
+that bracket the original split. A raw row then takes exactly the branch it
+would have taken after scaling and float32 conversion.
+
+Trees are stored as flat node arrays (one entry per node across all trees)
+laid out breadth-first so the two children of a node are adjacent. Leaves
+point back to themselves, so the traversal runs a fixed number of
+branch-free numpy steps over every (row, tree) pair at once.
+"""
+import json
+
+import numpy as np
+
+# XGBoost objectives whose prediction is the raw margin (no link function)
+_IDENTITY_OBJECTIVES = {
+    "reg:squarederror", "reg:absoluteerror", "reg:pseudohubererror", "reg:linear",
+    "reg:quantileerror",
+}
+
+# Rows evaluated per traversal block; bounds the (rows x trees) temporaries
+BLOCK_ROWS = 4096
+
+
+class FusedTrees:
+    """Tree ensemble with split thresholds expressed in raw feature space.
+
+    ``feature``, ``threshold``, ``children``, ``default_left`` and ``value``
+    are flat per-node arrays; ``children`` holds the left child, the right
+    child being the next node. ``roots`` holds the node index of every
+    tree's root. Predictions are ``base + sum(leaves)`` when ``average`` is
+    false and ``mean(leaves)`` otherwise. Splits send a row left on
+    ``x < threshold`` and missing values along ``default_left``.
+    ``node_values`` is true when internal nodes hold the output their
+    subtree would predict, which ``path_contributions`` relies on.
+    """
+
+    def __init__(self, feature, threshold, children, default_left, value,
+                 roots, depth, base=0.0, average=False, node_values=True):
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.default_left = default_left
+        self.value = value
+        self.roots = roots
+        self.depth = int(depth)
+        self.base = float(base)
+        self.average = bool(average)
+        self.node_values = bool(node_values)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def leaf_indices(self, X):
+        """Return the (n_rows, n_trees) node index each row lands on."""
+        nodes = np.broadcast_to(self.roots, (X.shape[0], self.n_trees))
+        row_offset = (np.arange(X.shape[0]) * X.shape[1])[:, None]
+        flat_X = X.ravel()
+        has_missing = np.isnan(flat_X).any()
+        for _ in range(self.depth):
+            x = flat_X[row_offset + self.feature[nodes]]
+            go_right = ~(x < self.threshold[nodes])
+            if has_missing:
+                go_right[np.isnan(x) & self.default_left[nodes]] = False
+            nodes = self.children[nodes] + go_right
+        return nodes
+
+    def leaf_values(self, X):
+        """Return the (n_rows, n_trees) matrix of per-tree outputs."""
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        return self.value[self.leaf_indices(X)]
+
+    def predict(self, X):
+        """Predict a (n_rows, n_features) array of raw, unscaled features."""
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        out = np.empty(X.shape[0], dtype=np.float64)
+        for start in range(0, X.shape[0], BLOCK_ROWS):
+            leaves = self.value[self.leaf_indices(X[start:start + BLOCK_ROWS])]
+            block = leaves.mean(axis=1) if self.average else leaves.sum(axis=1)
+            out[start:start + BLOCK_ROWS] = block + self.base
+        return out
+
+    def path_contributions(self, X):
+        """Per-feature contributions along each row's decision paths (Saabas).
+
+        Every split a row passes credits its feature with the change in node
+        value from parent to child. Returns (contributions, bias) where
+        contributions is (n_rows, n_features), bias is the root value
+        (summed or averaged over trees, plus ``base``) and
+        ``bias + contributions.sum(axis=1)`` equals ``predict(X)``. Raises
+        ValueError without ``node_values``.
+        """
+        if not self.node_values:
+            raise ValueError("Internal node values are not stored for this model")
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        n_rows, n_features = X.shape
+        contributions = np.zeros(n_rows * n_features)
+        for start in range(0, n_rows, BLOCK_ROWS):
+            block = X[start:start + BLOCK_ROWS]
+            nodes = np.broadcast_to(self.roots, (block.shape[0], self.n_trees))
+            row_offset = (np.arange(block.shape[0]) * n_features)[:, None]
+            flat_X = block.ravel()
+            has_missing = np.isnan(flat_X).any()
+            for _ in range(self.depth):
+                cell = row_offset + self.feature[nodes]
+                x = flat_X[cell]
+                go_right = ~(x < self.threshold[nodes])
+                if has_missing:
+                    go_right[np.isnan(x) & self.default_left[nodes]] = False
+                step = self.children[nodes] + go_right
+                # Leaves point at themselves, so finished paths add zero
+                contributions[start * n_features:(start + len(block)) * n_features] += np.bincount(
+                    cell.ravel(), weights=(self.value[step] - self.value[nodes]).ravel(),
+                    minlength=len(block) * n_features)
+                nodes = step
+        contributions = contributions.reshape(n_rows, n_features)
+        roots = self.value[self.roots]
+        if self.average:
+            return contributions / self.n_trees, roots.mean() + self.base
+        return contributions, roots.sum() + self.base
+
+
+class FusedLinear:
+    """Linear model with the scaler folded into its coefficients."""
+
+    def __init__(self, coef, intercept):
+        self.coef = coef
+        self.intercept = float(intercept)
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        return X @ self.coef + self.intercept
+
+
+def _scaler_params(scaler, n_features):
+    mean = np.zeros(n_features)
+    scale = np.ones(n_features)
+    if scaler is None:
+        return mean, scale
+    if getattr(scaler, "with_mean", True) and getattr(scaler, "mean_", None) is not None:
+        mean = np.asarray(scaler.mean_, dtype=np.float64)
+    if getattr(scaler, "with_std", True) and getattr(scaler, "scale_", None) is not None:
+        scale = np.asarray(scaler.scale_, dtype=np.float64)
+    return mean, scale
+
+
+class _NodeBuilder:
+    """Accumulates trees into the flat node arrays used by FusedTrees."""
+
+    def __init__(self):
+        self.parts = {name: [] for name in
+                      ("feature", "threshold", "children", "default_left", "value")}
+        self.roots = []
+        self.depth = 0
+        self.size = 0
+
+    def add(self, feature, threshold, left, right, default_left, value):
+        # Breadth-first relabelling makes every right child follow its sibling
+        order = [0]
+        depth = {0: 0}
+        for node in order:
+            if left[node] >= 0:
+                order.extend((left[node], right[node]))
+                depth[left[node]] = depth[right[node]] = depth[node] + 1
+        order = np.asarray(order)
+        new_id = np.empty(len(order), dtype=np.int64)
+        new_id[order] = np.arange(len(order))
+
+        is_leaf = left[order] < 0
+        children = np.where(is_leaf, np.arange(len(order)), new_id[np.maximum(left[order], 0)])
+
+        # Leaves loop back to themselves so extra traversal steps are no-ops
+        self.parts["feature"].append(np.where(is_leaf, 0, feature[order]))
+        self.parts["threshold"].append(np.where(is_leaf, np.inf, threshold[order]))
+        self.parts["children"].append(children + self.size)
+        self.parts["default_left"].append(np.where(is_leaf, True, default_left[order]))
+        self.parts["value"].append(value[order])
+        self.roots.append(self.size)
+        self.depth = max(self.depth, max(depth.values()))
+        self.size += len(order)
+
+    def build(self, **kwargs):
+        arrays = {name: np.concatenate(parts) for name, parts in self.parts.items()}
+        return FusedTrees(
+            feature=arrays["feature"].astype(np.intp),
+            threshold=arrays["threshold"].astype(np.float64),
+            children=arrays["children"].astype(np.intp),
+            default_left=arrays["default_left"].astype(bool),
+            value=arrays["value"].astype(np.float64),
+            roots=np.asarray(self.roots, dtype=np.intp),
+            depth=self.depth,
+            **kwargs,
+        )
+
+
+def _float32_split(below):
+    """Midpoint between float32 ``below`` and the next float32 above it.
+
+    A float64 value ``v`` satisfies ``float32(v) <= below`` exactly when
+    ``v`` is less than this midpoint (ties-to-even aside).
+    """
+    below = np.asarray(below, dtype=np.float32)
+    above = np.nextafter(below, np.float32(np.inf))
+    return (below.astype(np.float64) + above.astype(np.float64)) / 2
+
+
+def _compile_xgboost(model, mean, scale):
+    learner = json.loads(model.get_booster().save_raw("json"))["learner"]
+    objective = learner["objective"]["name"]
+    if objective not in _IDENTITY_OBJECTIVES:
+        raise TypeError(f"Unsupported XGBoost objective for fused inference: {objective}")
+    booster = learner["gradient_booster"]
+    if booster["name"] != "gbtree":
+        raise TypeError(f"Unsupported XGBoost booster for fused inference: {booster['name']}")
+    if int(learner["learner_model_param"].get("num_target", "1")) > 1:
+        raise TypeError("Multi-target XGBoost models are not supported for fused inference")
+    base_score = float(learner["learner_model_param"]["base_score"].strip("[]"))
+
+    builder = _NodeBuilder()
+    for tree in booster["model"]["trees"]:
+        if any(tree["split_type"]):
+            raise TypeError("Categorical XGBoost splits are not supported for fused inference")
+        left = np.asarray(tree["left_children"], dtype=np.int64)
+        right = np.asarray(tree["right_children"], dtype=np.int64)
+        feature = np.asarray(tree["split_indices"], dtype=np.int64)
+        condition = np.asarray(tree["split_conditions"], dtype=np.float64)
+        is_leaf = left < 0
+        # float32(x) < c  <=>  float32(x) <= the float32 just below c
+        below = np.nextafter(condition.astype(np.float32), np.float32(-np.inf))
+        builder.add(
+            feature=feature,
+            threshold=_float32_split(below) * scale[feature] + mean[feature],
+            left=left,
+            right=right,
+            default_left=np.asarray(tree["default_left"], dtype=bool),
+            # Leaf outputs live in split_conditions; internal nodes keep their weight
+            value=np.where(is_leaf, condition, np.asarray(tree["base_weights"], dtype=np.float64)),
+        )
+    # base_weights are not scaled by the learning rate, so they are not the
+    # subtree outputs that path contributions need
+    return builder.build(base=base_score, node_values=False)
+
+
+def _compile_sklearn_trees(estimators, mean, scale):
+    builder = _NodeBuilder()
+    for estimator in estimators:
+        tree = estimator.tree_
+        if tree.n_outputs != 1:
+            raise TypeError("Multi-output trees are not supported for fused inference")
+        feature = np.maximum(tree.feature, 0)
+        # float32(x) <= t  <=>  float32(x) <= the largest float32 not above t
+        below = tree.threshold.astype(np.float32)
+        below = np.where(below > tree.threshold, np.nextafter(below, np.float32(-np.inf)), below)
+        # sklearn >= 1.3 trees route NaN to the right unless told otherwise
+        default_left = getattr(tree, "missing_go_to_left", np.zeros(tree.node_count))
+        builder.add(
+            feature=feature,
+            threshold=_float32_split(below) * scale[feature] + mean[feature],
+            left=tree.children_left,
+            right=tree.children_right,
+            default_left=np.asarray(default_left, dtype=bool),
+            value=tree.value[:, 0, 0],
+        )
+    return builder.build(average=len(estimators) > 1)
+
+
+def compile_model(model, scaler):
+    """Fold ``scaler`` into ``model`` and return a FusedTrees/FusedLinear.
+
+    Supports XGBoost gbtree regressors, scikit-learn decision trees and
+    forests, and linear regressors. Raises TypeError for anything else.
+    """
+    n_features = int(getattr(model, "n_features_in_", len(getattr(scaler, "mean_", []))))
+    mean, scale = _scaler_params(scaler, n_features)
+
+    if hasattr(model, "get_booster"):
+        return _compile_xgboost(model, mean, scale)
+    if hasattr(model, "tree_"):
+        return _compile_sklearn_trees([model], mean, scale)
+    if hasattr(model, "estimators_") and all(hasattr(e, "tree_") for e in model.estimators_):
+        if type(model).__name__ not in ("RandomForestRegressor", "ExtraTreesRegressor"):
+            raise TypeError(f"Unsupported ensemble for fused inference: {type(model).__name__}")
+        return _compile_sklearn_trees(model.estimators_, mean, scale)
+    if hasattr(model, "coef_") and hasattr(model, "intercept_"):
+        coef = np.ravel(model.coef_).astype(np.float64) / scale
+        intercept = float(np.ravel(model.intercept_)[0]) - float(coef @ mean)
+        return FusedLinear(coef, intercept)
+    raise TypeError(f"Unsupported model for fused inference: {type(model).__name__}")
+
+
+def check_parity(fused, reference_predict, X, rtol=1e-4, atol=1e-2):
+    """Raise AssertionError if ``fused`` disagrees with the reference path.
+
+    ``reference_predict`` is the original scale-then-predict callable and
+    ``X`` a raw feature array. Returns the largest absolute difference.
+    """
+    expected = np.asarray(reference_predict(X), dtype=np.float64)
+    actual = fused.predict(X)
+    if not np.allclose(actual, expected, rtol=rtol, atol=atol):
+        worst = int(np.argmax(np.abs(actual - expected)))
+        raise AssertionError(
+            f"Fused model diverges from scaler+model path at row {worst}: "
+            f"{actual[worst]!r} != {expected[worst]!r}"
+        )
+    return float(np.max(np.abs(actual - expected))) if len(X) else 0.0
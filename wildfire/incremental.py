@@ -0,0 +1,241 @@
+"""Incremental model updates from newly closed incidents.
+
+    python -m wildfire.incremental new_incidents.csv [--trees 25] [--holdout 0.2]
+
+The current model (``artifacts/LATEST``, or the repo's bundled pickles)
+is updated from new labeled rows only. The full history is not refitted:
+
+* XGBoost continues boosting from the existing booster (``xgb_model=``)
+  with ``--trees`` extra rounds.
+* Random Forest keeps its trees and fits ``--trees`` more on the new rows
+  (``warm_start``).
+
+Other model types have no incremental form; retrain them with
+``python -m wildfire.training``. The parent's scaler is reused unchanged,
+so the updated model sees features on the same scale it was trained on.
+County names are encoded with the parent's ``counties.json``. Names it
+has not seen get new codes at the end, and numeric ``Counties`` columns
+are used as they are.
+
+A ``--holdout`` share of the new rows is kept out of the update. Parent
+and updated model are both scored on it, and on the parent's reference
+sample of earlier held-out rows (``reference.pkl``, written by training).
+The update is written only if it loses no more than ``--tolerance`` R² on
+either (``--force`` writes it anyway). Parents without a reference sample
+(the bundled pickles) are checked on the new rows only. The new version's
+reference sample is the parent's plus this update's holdout.
+It becomes a new version under ``artifacts/`` whose manifest records the
+parent version and the full lineage, and ``LATEST`` moves to it. Time
+scales with the new rows and trees, not the full history.
+"""
+import argparse
+import copy
+import json
+import time
+from pathlib import Path
+
+from .features import FEATURE_COLUMNS
+from .intervals import INTERVAL_FILE
+from .training import (
+    RANDOM_STATE, REFERENCE_FILE, TARGET_COLUMN, _sha256, reference_sample, write_artifacts,
+)
+
+DEFAULT_EXTRA_TREES = 25
+DEFAULT_HOLDOUT = 0.2
+
+# Largest R² drop on the holdout that still counts as a valid update
+DEFAULT_TOLERANCE = 0.01
+
+
+def model_kind(model):
+    """Return "XGBoost" or "Random Forest", or raise ValueError for other models."""
+    from sklearn.ensemble import RandomForestRegressor
+    from xgboost import XGBRegressor
+
+    if isinstance(model, XGBRegressor):
+        return "XGBoost"
+    if isinstance(model, RandomForestRegressor):
+        return "Random Forest"
+    raise ValueError(f"{type(model).__name__} cannot be updated incrementally; "
+                     f"retrain it with `python -m wildfire.training`")
+
+
+def read_parent(model_dir):
+    """Return (manifest or None, county names or None) stored beside the parent pickles."""
+    model_dir = Path(model_dir)
+    manifest = counties = None
+    if (model_dir / "manifest.json").exists():
+        manifest = json.loads((model_dir / "manifest.json").read_text())
+    if (model_dir / "counties.json").exists():
+        counties = json.loads((model_dir / "counties.json").read_text())
+    return manifest, counties
+
+
+def prepare_rows(frame, counties):
+    """Clean new rows like the notebook; returns (X, y, county names).
+
+    ``counties`` is the parent's encoding. Unseen names are appended, so
+    the returned list extends it. With no encoding, ``Counties`` must
+    already hold numeric codes.
+    """
+    import pandas as pd
+
+    missing = [col for col in [TARGET_COLUMN] + FEATURE_COLUMNS if col not in frame.columns]
+    if missing:
+        raise ValueError(f"Dataset is missing column(s): {', '.join(missing)}")
+    df = frame[[TARGET_COLUMN] + FEATURE_COLUMNS].copy()
+    df.fillna(0, inplace=True)
+    counties = list(counties or [])
+    if not pd.api.types.is_numeric_dtype(df["Counties"]):
+        if not counties:
+            raise ValueError("Counties are names but the parent model has no counties.json; "
+                             "train it with `python -m wildfire.training` or pass numeric county codes")
+        codes = {name: code for code, name in enumerate(counties)}
+        for name in df["Counties"].astype(str).unique():
+            if name not in codes:
+                codes[name] = len(counties)
+                counties.append(name)
+        df["Counties"] = df["Counties"].astype(str).map(codes)
+    df["MajorIncident"] = df["MajorIncident"].astype(int)
+    return df[FEATURE_COLUMNS].to_numpy(dtype=float), df[TARGET_COLUMN].to_numpy(dtype=float), counties
+
+
+def extend_model(model, X, y, trees=DEFAULT_EXTRA_TREES):
+    """Return a copy of ``model`` with ``trees`` more trees fitted on (X, y)."""
+    kind = model_kind(model)
+    if kind == "XGBoost":
+        updated = copy.deepcopy(model)
+        updated.set_params(n_estimators=trees)
+        updated.fit(X, y, xgb_model=model.get_booster())
+        return updated
+    updated = copy.deepcopy(model)
+    updated.set_params(warm_start=True, n_estimators=len(model.estimators_) + trees)
+    updated.fit(X, y)
+    return updated
+
+
+def _scores(y_true, y_pred):
+    import numpy as np
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+    return {
+        "MAE": float(mean_absolute_error(y_true, y_pred)),
+        "RMSE": float(np.sqrt(mean_squared_error(y_true, y_pred))),
+        "R2": float(r2_score(y_true, y_pred)),
+    }
+
+
+def update(csv_path, base_dir=None, out_dir=None, trees=DEFAULT_EXTRA_TREES, holdout=DEFAULT_HOLDOUT,
+           tolerance=DEFAULT_TOLERANCE, force=False):
+    """Update the current model from ``csv_path`` and return the manifest.
+
+    The manifest's ``accepted`` flag is False (and nothing is written)
+    when the update fails validation and ``force`` is not set.
+    """
+    import joblib
+    import numpy as np
+    import pandas as pd
+    from sklearn.model_selection import train_test_split
+
+    from .predictor import ARTIFACTS_DIR, DEFAULT_MODEL_DIR, artifact_paths, artifact_version, latest_model_dir
+
+    base_dir = Path(base_dir) if base_dir is not None else DEFAULT_MODEL_DIR
+    out_dir = Path(out_dir) if out_dir is not None else base_dir / ARTIFACTS_DIR
+    start = time.perf_counter()
+
+    parent_dir = latest_model_dir(base_dir)
+    model_path, scaler_path = artifact_paths(parent_dir)
+    model, scaler = joblib.load(model_path), joblib.load(scaler_path)
+    kind = model_kind(model)
+    parent_manifest, counties = read_parent(parent_dir)
+    parent_version = parent_manifest["version"] if parent_manifest else artifact_version(parent_dir)
+
+    X, y, counties = prepare_rows(pd.read_csv(csv_path), counties)
+    X_fit, X_hold, y_fit, y_hold = train_test_split(X, y, test_size=holdout, random_state=RANDOM_STATE)
+    # Earlier held-out rows travel with each version and grow with every update
+    reference = {"X": X_hold, "y": y_hold}
+    if (parent_dir / REFERENCE_FILE).exists():
+        parent_reference = joblib.load(parent_dir / REFERENCE_FILE)
+        reference = reference_sample(np.concatenate([parent_reference["X"], X_hold]),
+                                     np.concatenate([parent_reference["y"], y_hold]))
+    else:
+        parent_reference = None
+    X_fit, X_hold = scaler.transform(X_fit), scaler.transform(X_hold)
+
+    fit_start = time.perf_counter()
+    updated = extend_model(model, X_fit, y_fit, trees)
+    fit_seconds = time.perf_counter() - fit_start
+
+    validation = {"parent": _scores(y_hold, model.predict(X_hold)),
+                  "updated": _scores(y_hold, updated.predict(X_hold)),
+                  "holdout_rows": len(y_hold)}
+    accepted = validation["updated"]["R2"] >= validation["parent"]["R2"] - tolerance
+    if parent_reference is not None:
+        X_ref = scaler.transform(parent_reference["X"])
+        validation["reference"] = {"parent": _scores(parent_reference["y"], model.predict(X_ref)),
+                                   "updated": _scores(parent_reference["y"], updated.predict(X_ref)),
+                                   "rows": len(parent_reference["y"])}
+        accepted = accepted and (validation["reference"]["updated"]["R2"]
+                                 >= validation["reference"]["parent"]["R2"] - tolerance)
+
+    lineage = (parent_manifest or {}).get("lineage", []) + [parent_version]
+    manifest = {
+        "version": time.strftime("%Y%m%d-%H%M%S"),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "mode": "incremental",
+        "best_model": kind,
+        "parent": parent_version,
+        "lineage": lineage,
+        "accepted": accepted,
+        "validation": validation,
+        "update": {"trees_added": trees, "fit_rows": len(y_fit), "fit_seconds": fit_seconds},
+        "dataset": {"path": str(Path(csv_path).resolve()), "sha256": _sha256(csv_path), "rows": len(y)},
+        "feature_columns": FEATURE_COLUMNS,
+    }
+    if accepted or force:
+        # The parent's interval model is carried over unchanged
+        extras = {REFERENCE_FILE: reference}
+        if (parent_dir / INTERVAL_FILE).exists():
+            extras[INTERVAL_FILE] = joblib.load(parent_dir / INTERVAL_FILE)
+            manifest["intervals"] = {"method": "quantile", "inherited_from": parent_version}
+        write_artifacts(out_dir, updated, scaler, manifest, counties, extras)
+    manifest["total_seconds"] = time.perf_counter() - start
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update the current model from new incidents")
+    parser.add_argument("csv", help="New labeled incidents (California_Fire_Incidents.csv columns)")
+    parser.add_argument("--base", default=None, help="Directory holding artifacts/ (default: the repo)")
+    parser.add_argument("--out", default=None, help="Artifacts directory (default: <base>/artifacts)")
+    parser.add_argument("--trees", type=int, default=DEFAULT_EXTRA_TREES, help="Boosting rounds or forest trees to add")
+    parser.add_argument("--holdout", type=float, default=DEFAULT_HOLDOUT, help="Share of new rows kept for validation")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Largest allowed holdout R² drop")
+    parser.add_argument("--force", action="store_true", help="Write the update even if validation fails")
+    args = parser.parse_args(argv)
+
+    manifest = update(args.csv, args.base, args.out, trees=args.trees, holdout=args.holdout,
+                      tolerance=args.tolerance, force=args.force)
+
+    validation = manifest["validation"]
+    print(f"{'holdout':<10}{'R2':>8}{'MAE':>12}{'RMSE':>12}")
+    for name in ("parent", "updated"):
+        scores = validation[name]
+        print(f"{name:<10}{scores['R2']:>8.3f}{scores['MAE']:>12,.0f}{scores['RMSE']:>12,.0f}")
+    if "reference" in validation:
+        print(f"\n{'reference':<10}{'R2':>8}{'MAE':>12}{'RMSE':>12}   ({validation['reference']['rows']:,} earlier rows)")
+        for name in ("parent", "updated"):
+            scores = validation["reference"][name]
+            print(f"{name:<10}{scores['R2']:>8.3f}{scores['MAE']:>12,.0f}{scores['RMSE']:>12,.0f}")
+    stats = manifest["update"]
+    print(f"\n{manifest['best_model']}: +{stats['trees_added']} trees on {stats['fit_rows']:,} rows "
+          f"in {stats['fit_seconds']:.2f} s ({manifest['total_seconds']:.2f} s total)")
+    if manifest["accepted"] or args.force:
+        print(f"Version {manifest['version']} (parent {manifest['parent']}) written; LATEST updated")
+    else:
+        raise SystemExit(f"Update rejected: holdout or reference R² fell by more than {args.tolerance}; "
+                         f"nothing written (use --force to keep it)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Hot-path timing with rolling histograms and structured JSON logs.
+
+Code under test wraps each stage in ``timed("stage")``. Samples feed one
+rolling LatencyRecorder per stage for the app's Diagnostics panel. They
+are also collected per rerun: ``begin_run()`` / ``end_run()`` bracket one
+Streamlit script run, and ``end_run`` emits a single JSON line on the
+``wildfire.timings`` logger with every stage timed during that run.
+An ``st.fragment`` rerun never reaches the end of the script, so fragment
+bodies are decorated with ``timed_fragment``, which brackets them the
+same way when they run on their own.
+
+Set ``WILDFIRE_TIMING_LOG`` to a file path (or ``-`` for stderr) to write
+those lines somewhere a scraper can read them.
+"""
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from .metrics import LatencyRecorder
+
+# Stage names used across the app and the predictor
+LOAD_MODEL = "load_model"
+INPUT_FRAME = "input_frame"
+SCALER_TRANSFORM = "scaler_transform"
+MODEL_PREDICT = "model_predict"
+FUSED_PREDICT = "fused_predict"
+FIGURE_BUILD = "figure_build"
+FIGURE_RENDER = "figure_render"
+INFERENCE_WAIT = "inference_wait"
+RERUN = "rerun"
+
+# Upper bucket edges (ms) of the latency histograms; the last bucket is open
+HISTOGRAM_EDGES_MS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000]
+
+LOG_ENV_VAR = "WILDFIRE_TIMING_LOG"
+
+logger = logging.getLogger("wildfire.timings")
+
+
+def histogram(latencies_ms, edges=HISTOGRAM_EDGES_MS):
+    """Count samples per bucket; returns [(label, count), ...]."""
+    counts = [0] * (len(edges) + 1)
+    for value in latencies_ms:
+        bucket = 0
+        while bucket < len(edges) and value > edges[bucket]:
+            bucket += 1
+        counts[bucket] += 1
+    labels = [f"≤{edge:g}" for edge in edges] + [f">{edges[-1]:g}"]
+    return list(zip(labels, counts))
+
+
+class StageTimings:
+    """Process-wide registry of per-stage latency windows."""
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._recorders = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _recorder(self, stage):
+        with self._lock:
+            recorder = self._recorders.get(stage)
+            if recorder is None:
+                recorder = self._recorders[stage] = LatencyRecorder(self.window)
+            return recorder
+
+    def record(self, stage, seconds):
+        self._recorder(stage).record(seconds)
+        run = getattr(self._local, "run", None)
+        if run is not None:
+            run[stage] = run.get(stage, 0.0) + seconds * 1000
+
+    @contextmanager
+    def timed(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def begin_run(self):
+        """Start collecting the stages of one script run on this thread."""
+        self._local.run = {}
+        self._local.run_started = time.perf_counter()
+
+    def in_run(self):
+        """Whether a run is being collected on this thread."""
+        return getattr(self._local, "run", None) is not None
+
+    @contextmanager
+    def collect(self):
+        """Collect the stages timed on this thread inside the block into the yielded dict.
+
+        For work done on behalf of another thread's run; hand the dict to
+        ``merge_run`` there.
+        """
+        previous = getattr(self._local, "run", None)
+        self._local.run = stages = {}
+        try:
+            yield stages
+        finally:
+            self._local.run = previous
+
+    def merge_run(self, stages):
+        """Add stage timings (ms) collected on another thread to this thread's run."""
+        run = getattr(self._local, "run", None)
+        if run is not None:
+            for stage, ms in stages.items():
+                run[stage] = run.get(stage, 0.0) + ms
+
+    def current_run(self):
+        """Stage timings (ms) collected so far in this thread's run."""
+        return dict(getattr(self._local, "run", None) or {})
+
+    def end_run(self, **fields):
+        """Finish the run, record its total time and emit one JSON log line."""
+        run = getattr(self._local, "run", None)
+        if run is None:
+            return None
+        self._local.run = None
+        total = time.perf_counter() - self._local.run_started
+        self._recorder(RERUN).record(total)
+        run[RERUN] = total * 1000
+
+        entry = {"event": "rerun", "ts": time.time(), **fields,
+                 "stages_ms": {stage: round(ms, 4) for stage, ms in run.items()}}
+        logger.info(json.dumps(entry))
+        return entry
+
+    def summary(self):
+        """Per-stage rolling statistics and histograms."""
+        with self._lock:
+            recorders = dict(self._recorders)
+        summary = {}
+        for stage, recorder in sorted(recorders.items()):
+            stats = recorder.snapshot()
+            stats["histogram"] = histogram([s * 1000 for s in recorder.latencies()])
+            summary[stage] = stats
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._recorders.clear()
+
+
+timings = StageTimings()
+
+
+def timed(stage):
+    """Time a block as ``stage`` in the process-wide registry."""
+    return timings.timed(stage)
+
+
+def timed_fragment(fn):
+    """Time each rerun of the ``st.fragment`` body ``fn`` that is not part of a full run.
+
+    Goes under ``@st.fragment``. Inside a full script run the body is
+    timed as part of that run; on its own it is one run, logged with
+    ``fragment=<name>``.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if timings.in_run():
+            return fn(*args, **kwargs)
+        timings.begin_run()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            timings.end_run(fragment=fn.__name__)
+    return wrapper
+
+
+_log_configured = False
+
+
+def configure_json_log(target=None):
+    """Send ``wildfire.timings`` lines to ``target`` (path or ``-``) once.
+
+    Defaults to the WILDFIRE_TIMING_LOG environment variable; does nothing
+    when neither is set.
+    """
+    global _log_configured
+    target = target or os.environ.get(LOG_ENV_VAR)
+    if _log_configured or not target:
+        return
+    handler = logging.StreamHandler(sys.stderr) if target == "-" else logging.FileHandler(target)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    _log_configured = True
@@ -0,0 +1,110 @@
+"""Prediction intervals next to the point estimate.
+
+Two sources, chosen by what the served model supports:
+
+* ``"trees"``: for forests, the spread of the individual trees. Every tree's
+  output for every row comes from one vectorized pass: the fused
+  traversal (``leaf_values``) for small batches, or the forest's native
+  ``apply`` plus a gather from a (trees x nodes) value table for large
+  ones. Quantiles across each row give the bounds and the row mean is the
+  point prediction.
+* ``"quantile"``: for every other model, two XGBoost regressors with the
+  ``reg:quantileerror`` objective, one per bound. They are saved together
+  as ``interval_model.pkl`` beside the main pickles; ``wildfire.training``
+  fits them next to the best model. Like the main model, both are
+  compiled to the fused fast path for small batches.
+
+Bounds are widened where needed to contain the point estimate, so the
+interval never excludes the number the page reports.
+"""
+from .fused import BLOCK_ROWS
+
+INTERVAL_FILE = "interval_model.pkl"
+
+# Share of outcomes the interval is meant to cover
+DEFAULT_COVERAGE = 0.8
+
+
+def quantile_levels(coverage):
+    """Lower and upper quantile for a central interval of ``coverage``."""
+    return (1 - coverage) / 2, (1 + coverage) / 2
+
+
+def contain(prediction, first, second):
+    """Return (prediction, lower, upper) with both bounds ordered and around the prediction."""
+    import numpy as np
+
+    lower = np.minimum(np.minimum(first, second), prediction)
+    upper = np.maximum(np.maximum(first, second), prediction)
+    return prediction, lower, upper
+
+
+def _summarize(leaves, levels):
+    import numpy as np
+
+    lower, upper = np.quantile(leaves, levels, axis=1)
+    return leaves.mean(axis=1), lower, upper
+
+
+def tree_intervals(fused, X, coverage=DEFAULT_COVERAGE):
+    """(prediction, lower, upper) from the per-tree spread of a fused forest on raw rows."""
+    import numpy as np
+
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    out = np.empty((3, X.shape[0]), dtype=np.float64)
+    levels = quantile_levels(coverage)
+    for start in range(0, X.shape[0], BLOCK_ROWS):
+        block = fused.leaf_values(X[start:start + BLOCK_ROWS])
+        out[:, start:start + len(block)] = _summarize(block, levels)
+    return contain(*(out + fused.base))
+
+
+def forest_value_table(model):
+    """(n_trees, max_nodes) node values of a fitted sklearn forest, indexed like ``apply``."""
+    import numpy as np
+
+    trees = [estimator.tree_ for estimator in model.estimators_]
+    table = np.zeros((len(trees), max(tree.node_count for tree in trees)))
+    for index, tree in enumerate(trees):
+        table[index, :tree.node_count] = tree.value[:, 0, 0]
+    return table
+
+
+def native_tree_intervals(model, table, scaled, coverage=DEFAULT_COVERAGE):
+    """(prediction, lower, upper) from the forest's native ``apply`` on scaled rows."""
+    import numpy as np
+
+    out = np.empty((3, len(scaled)), dtype=np.float64)
+    levels = quantile_levels(coverage)
+    tree_index = np.arange(table.shape[0])
+    for start in range(0, len(scaled), BLOCK_ROWS):
+        nodes = model.apply(scaled[start:start + BLOCK_ROWS])
+        out[:, start:start + len(nodes)] = _summarize(table[tree_index, nodes], levels)
+    return contain(*out)
+
+
+def make_quantile_model(alpha, threads=1, random_state=42):
+    """Unfitted XGBoost model predicting the ``alpha`` quantile."""
+    from xgboost import XGBRegressor
+
+    return XGBRegressor(objective="reg:quantileerror", quantile_alpha=alpha, n_estimators=100,
+                        learning_rate=0.1, random_state=random_state, n_jobs=threads)
+
+
+def fit_interval_models(X, y, coverage=DEFAULT_COVERAGE, threads=1, random_state=42):
+    """Fit both bound models on scaled features; returns the ``interval_model.pkl`` payload."""
+    lower, upper = quantile_levels(coverage)
+    return {
+        "coverage": coverage,
+        "lower": make_quantile_model(lower, threads, random_state).fit(X, y),
+        "upper": make_quantile_model(upper, threads, random_state).fit(X, y),
+    }
+
+
+def empirical_coverage(y, lower, upper):
+    """Share of ``y`` inside [lower, upper] and the mean interval width."""
+    import numpy as np
+
+    y = np.asarray(y, dtype=np.float64)
+    return {"coverage": float(np.mean((y >= lower) & (y <= upper))),
+            "mean_width": float(np.mean(upper - lower))}
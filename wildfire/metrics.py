@@ -0,0 +1,63 @@
+"""Rolling latency and throughput counters."""
+import threading
+import time
+from collections import deque
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted sequence (q in 0-100)."""
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[rank]
+
+
+class LatencyRecorder:
+    """Thread-safe rolling window of latencies.
+
+    Percentiles and throughput cover the most recent ``window`` samples;
+    ``count`` keeps the lifetime total.
+    """
+
+    def __init__(self, window=10000):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.errors = 0
+
+    def record(self, seconds, error=False):
+        with self._lock:
+            self._samples.append((time.monotonic(), seconds))
+            self.count += 1
+            if error:
+                self.errors += 1
+
+    def latencies(self):
+        """Return the latencies (seconds) currently in the window, oldest first."""
+        with self._lock:
+            return [seconds for _, seconds in self._samples]
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self.count = 0
+            self.errors = 0
+
+    def snapshot(self):
+        """Return count, p50/p90/p99/max/mean latency (ms) and throughput (/s)."""
+        with self._lock:
+            samples = list(self._samples)
+            count, errors = self.count, self.errors
+
+        latencies = sorted(seconds for _, seconds in samples)
+        elapsed = samples[-1][0] - samples[0][0] if len(samples) > 1 else 0.0
+        return {
+            "count": count,
+            "errors": errors,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p90_ms": percentile(latencies, 90) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+            "mean_ms": (sum(latencies) / len(latencies) if latencies else 0.0) * 1000,
+            "throughput_per_s": (len(samples) - 1) / elapsed if elapsed > 0 else 0.0,
+        }
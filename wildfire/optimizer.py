@@ -0,0 +1,274 @@
+"""Cheapest resource mix that keeps an incident under a severity band.
+
+    python -m wildfire.optimizer --scenario "Severe Fire (Critical)" --band Moderate [--workers 4]
+
+The tree model only changes its output where a resource count crosses a
+split threshold. For integer counts, the values worth trying for a
+resource are therefore 0 and ``ceil(t)`` for each of its thresholds.
+Anything between two of those levels predicts the same as the lower one
+but costs more. The candidate set is the product of those levels under the
+availability caps (a few hundred thousand mixes for the shipped model).
+Models without a fused tree form fall back to every integer up to the cap.
+
+Candidates are sorted by cost and scored in fixed-size chunks of one batch
+call each. The first chunk holding a feasible mix therefore holds the
+cheapest one, so the search stops there. With ``workers`` the chunks are
+scored by a process pool whose workers load the parent's model
+directory. They map its ``.wfm`` artifact (see ``wildfire.artifact``)
+when it was exported from the same model version, and unpickle the model
+otherwise.
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .features import FEATURE_COLUMNS, MINOR_MAX_ACRES, MODERATE_MAX_ACRES, severity_band
+from .scenarios import feature_ranges
+
+RESOURCE_FEATURES = ["PersonnelInvolved", "Engines", "Helicopters", "Dozers", "WaterTenders"]
+
+# Illustrative daily cost per unit (USD); the Prediction page lets users edit them
+DEFAULT_UNIT_COSTS = {
+    "PersonnelInvolved": 800,
+    "Engines": 3500,
+    "Helicopters": 15000,
+    "Dozers": 2500,
+    "WaterTenders": 1500,
+}
+
+# Highest acreage allowed for each target band
+BAND_LIMITS = {"Minor": MINOR_MAX_ACRES, "Moderate": MODERATE_MAX_ACRES}
+
+# Candidates scored per batch call
+CHUNK_ROWS = 65536
+
+# Largest candidate set enumerated before levels are thinned
+MAX_CANDIDATES = 5_000_000
+
+
+def default_caps():
+    """Availability caps from the demo-scenario ranges."""
+    ranges = feature_ranges()
+    return {feature: int(ranges[feature][1]) for feature in RESOURCE_FEATURES}
+
+
+def candidate_levels(predictor, feature, cap, minimum=0):
+    """Integer counts of ``feature`` in [minimum, cap] that can change the prediction."""
+    import numpy as np
+
+    from .fused import FusedTrees
+
+    fused = predictor.fused
+    if isinstance(fused, FusedTrees):
+        column = FEATURE_COLUMNS.index(feature)
+        splits = fused.threshold[(fused.feature == column) & np.isfinite(fused.threshold)]
+        levels = np.ceil(splits)
+        levels = levels[(levels > minimum) & (levels <= cap)]
+        return np.unique(np.concatenate([[float(minimum)], levels]))
+    return np.arange(int(minimum), int(cap) + 1, dtype=np.float64)
+
+
+def _thin(levels, size):
+    """Keep ``size`` evenly spaced levels, always including the first and last."""
+    import numpy as np
+
+    if len(levels) <= size:
+        return levels
+    return levels[np.unique(np.round(np.linspace(0, len(levels) - 1, size)).astype(int))]
+
+
+def _candidate_rows(base, levels, flat_index):
+    import numpy as np
+
+    rows = np.tile(base, (len(flat_index), 1))
+    counts = np.unravel_index(flat_index, [len(level) for level in levels])
+    for feature, level, idx in zip(RESOURCE_FEATURES, levels, counts):
+        rows[:, FEATURE_COLUMNS.index(feature)] = level[idx]
+    return rows
+
+
+def _score_chunk(predictor, base, levels, flat_index, limit):
+    """Return (first feasible position or -1, min-acres position, acres)."""
+    import numpy as np
+
+    acres = predictor.predict_batch(_candidate_rows(base, levels, flat_index))
+    feasible = np.flatnonzero(acres <= limit)
+    return (int(feasible[0]) if len(feasible) else -1), int(np.argmin(acres)), acres
+
+
+_worker_predictor = None
+
+
+def _artifact_version(path):
+    """Source model version of the ``.wfm`` at ``path``, or None if there is no usable one."""
+    from .artifact import read_header
+
+    try:
+        return read_header(path)["metadata"]["source_version"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _init_worker(model_dir, version):
+    global _worker_predictor
+    from .artifact import ARTIFACT_FILE
+    from .predictor import Predictor, latest_model_dir
+
+    model_dir = latest_model_dir() if model_dir is None else Path(model_dir)
+    artifact = model_dir / ARTIFACT_FILE
+    # A .wfm left over from an older model would score with the wrong trees
+    if version is not None and _artifact_version(artifact) == version:
+        _worker_predictor = Predictor.load_mapped(artifact)
+    else:
+        _worker_predictor = Predictor.load(model_dir)
+
+
+def _worker_score(base, levels, flat_index, limit):
+    first, lowest, acres = _score_chunk(_worker_predictor, base, levels, flat_index, limit)
+    # Ship back only what the parent needs, not the whole acres vector
+    return first, lowest, float(acres[lowest]), _worker_predictor.version
+
+
+def optimize(predictor, features, band="Minor", costs=None, caps=None, minimums=None,
+             chunk_rows=CHUNK_ROWS, workers=0, model_dir=None):
+    """Find the cheapest resource mix keeping ``features`` within ``band``.
+
+    ``features`` is a {column: value} incident; its resource values are
+    ignored and the rest (location, containment, major incident) held fixed.
+    ``costs`` and ``caps`` map resource columns to per-unit cost and
+    maximum count, defaulting to DEFAULT_UNIT_COSTS and default_caps().
+    ``minimums`` holds counts already committed (default 0); the mix never
+    goes below them and their cost is included. Process pool ``workers``
+    load ``model_dir``, defaulting to the directory ``predictor`` was
+    loaded from.
+
+    Returns a dict with ``feasible``, the ``allocation`` ({column: count}),
+    its ``cost``, ``predicted_acres`` and ``severity``, plus search stats.
+    When no mix qualifies, the allocation with the fewest predicted acres
+    is returned with ``feasible`` False.
+    """
+    import numpy as np
+
+    if band not in BAND_LIMITS:
+        raise ValueError(f"Unknown target band {band!r}; choose from {', '.join(BAND_LIMITS)}")
+    costs = {**DEFAULT_UNIT_COSTS, **(costs or {})}
+    caps = {**default_caps(), **(caps or {})}
+    minimums = {feature: 0 for feature in RESOURCE_FEATURES} | (minimums or {})
+    for feature in RESOURCE_FEATURES:
+        if minimums[feature] > caps[feature]:
+            raise ValueError(f"{feature}: minimum {minimums[feature]} exceeds cap {caps[feature]}")
+    limit = BAND_LIMITS[band]
+    if model_dir is None:
+        model_dir = predictor.model_dir
+    start = time.perf_counter()
+
+    levels = [candidate_levels(predictor, feature, caps[feature], minimums[feature])
+              for feature in RESOURCE_FEATURES]
+    total = int(np.prod([len(level) for level in levels], dtype=np.int64))
+    if total > MAX_CANDIDATES:
+        per_axis = max(2, int(MAX_CANDIDATES ** (1 / len(levels))))
+        levels = [_thin(level, per_axis) for level in levels]
+        total = int(np.prod([len(level) for level in levels], dtype=np.int64))
+
+    # Cost of every mix via broadcasting, then candidate order by cost
+    cost_grid = np.zeros([len(level) for level in levels])
+    for axis, (feature, level) in enumerate(zip(RESOURCE_FEATURES, levels)):
+        shape = [1] * len(levels)
+        shape[axis] = len(level)
+        cost_grid = cost_grid + (level * costs[feature]).reshape(shape)
+    cost_flat = cost_grid.ravel()
+    order = np.argsort(cost_flat, kind="stable")
+
+    base = np.array([float(features[col]) for col in FEATURE_COLUMNS])
+    chunks = [order[i:i + chunk_rows] for i in range(0, total, chunk_rows)]
+
+    best = None
+    lowest = (np.inf, None)
+    evaluated = 0
+
+    def consume(chunk, first, low, low_acres):
+        nonlocal best, lowest, evaluated
+        evaluated += len(chunk)
+        if low_acres < lowest[0]:
+            lowest = (low_acres, chunk[low])
+        if first >= 0:
+            best = chunk[first]
+
+    if workers and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(model_dir, predictor.version)) as pool:
+            # Keep a few chunks in flight and consume them in cost order
+            pending = []
+            next_chunk = 0
+            while best is None and (pending or next_chunk < len(chunks)):
+                while next_chunk < len(chunks) and len(pending) < 2 * workers:
+                    chunk = chunks[next_chunk]
+                    pending.append((chunk, pool.submit(_worker_score, base, levels, chunk, limit)))
+                    next_chunk += 1
+                chunk, future = pending.pop(0)
+                first, low, low_acres, version = future.result()
+                if version != predictor.version:
+                    raise RuntimeError(f"Worker model version {version} does not match {predictor.version}")
+                consume(chunk, first, low, low_acres)
+            for _, future in pending:
+                future.cancel()
+    else:
+        for chunk in chunks:
+            first, low, acres = _score_chunk(predictor, base, levels, chunk, limit)
+            consume(chunk, first, low, float(acres[low]))
+            if best is not None:
+                break
+
+    choice = best if best is not None else lowest[1]
+    counts = np.unravel_index(choice, [len(level) for level in levels])
+    allocation = {feature: int(level[idx]) for feature, level, idx in zip(RESOURCE_FEATURES, levels, counts)}
+    acres = float(predictor.predict_batch(_candidate_rows(base, levels, np.array([choice])))[0])
+    return {
+        "feasible": best is not None,
+        "band": band,
+        "allocation": allocation,
+        "cost": float(cost_flat[choice]),
+        "predicted_acres": acres,
+        "severity": severity_band(acres),
+        "candidates": total,
+        "evaluated": evaluated,
+        "elapsed_s": time.perf_counter() - start,
+    }
+
+
+def main(argv=None):
+    from .predictor import Predictor
+    from .scenarios import DEMO_SCENARIOS, scenario_features
+
+    parser = argparse.ArgumentParser(description="Find the cheapest resource mix for a target severity band")
+    parser.add_argument("--scenario", default="Severe Fire (Critical)", choices=list(DEMO_SCENARIOS))
+    parser.add_argument("--band", default="Moderate", choices=list(BAND_LIMITS))
+    parser.add_argument("--workers", type=int, default=0, help="Process pool size (0 scores in-process)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--keep-current", action="store_true",
+                        help="Never go below the scenario's current resources")
+    for feature in RESOURCE_FEATURES:
+        parser.add_argument(f"--cap-{feature.lower()}", type=int, dest=f"cap_{feature}",
+                            help=f"Maximum {feature} (default {default_caps()[feature]})")
+    args = parser.parse_args(argv)
+
+    caps = {feature: getattr(args, f"cap_{feature}") for feature in RESOURCE_FEATURES
+            if getattr(args, f"cap_{feature}") is not None}
+    features = scenario_features(DEMO_SCENARIOS[args.scenario])
+    minimums = {feature: int(features[feature]) for feature in RESOURCE_FEATURES} if args.keep_current else None
+    predictor = Predictor.load()
+    result = optimize(predictor, features, band=args.band, caps=caps, minimums=minimums,
+                      chunk_rows=args.chunk_rows, workers=args.workers)
+
+    status = "Cheapest mix" if result["feasible"] else f"No mix reaches {args.band}; lowest prediction"
+    print(f"{status}: {result['predicted_acres']:,.0f} acres ({result['severity']}), "
+          f"cost {result['cost']:,.0f}")
+    for feature, count in result["allocation"].items():
+        print(f"  {feature:<18}{count:>6}")
+    print(f"Scored {result['evaluated']:,} of {result['candidates']:,} candidates "
+          f"in {result['elapsed_s']:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+"""Headless inference on the trained model and scaler.
+
+Importing this module pulls in nothing beyond the standard library; numpy,
+pandas and joblib are imported on first use so batch workers and scripts
+start quickly and never touch Streamlit or Plotly.
+
+At load time the scaler is folded into the model (see ``wildfire.fused``)
+and the result is checked against the original scale-then-predict path;
+small batches then run on raw numpy rows. Large batches stay on the
+native multithreaded predict, which overtakes the numpy traversal at a few
+hundred rows. Models that cannot be fused always use the original path.
+"""
+import hashlib
+import logging
+import time
+from pathlib import Path
+
+from .features import FEATURE_COLUMNS
+from .instrumentation import (
+    FUSED_PREDICT, INPUT_FRAME, MODEL_PREDICT, SCALER_TRANSFORM, timed,
+)
+
+MODEL_FILE = "best_fire_model.pkl"
+SCALER_FILE = "scaler.pkl"
+
+# Artifacts ship next to app.py, one level above this package
+DEFAULT_MODEL_DIR = Path(__file__).resolve().parent.parent
+
+# Versioned training output (see wildfire.training): artifacts/<version>/ and
+# artifacts/LATEST naming the version to serve
+ARTIFACTS_DIR = "artifacts"
+LATEST_FILE = "LATEST"
+
+# Rows sampled around the scaler's training distribution for the parity check
+PARITY_PROBE_ROWS = 2048
+
+# Largest batch routed through the fused path (see benchmarks/bench_fused.py)
+FUSED_MAX_ROWS = 512
+
+# Synthetic rows scored by warm_up (exercises the native batch path too)
+WARM_UP_BATCH_ROWS = 2048
+
+logger = logging.getLogger(__name__)
+
+
+def artifact_paths(base_dir=None):
+    base_dir = Path(base_dir) if base_dir is not None else DEFAULT_MODEL_DIR
+    return base_dir / MODEL_FILE, base_dir / SCALER_FILE
+
+
+def latest_model_dir(base_dir=None):
+    """Directory holding the pickles to serve from ``base_dir``.
+
+    This is ``artifacts/<version>`` when ``artifacts/LATEST`` names a
+    version that exists, and ``base_dir`` itself otherwise (the pickles
+    shipped with the repo).
+    """
+    base_dir = Path(base_dir) if base_dir is not None else DEFAULT_MODEL_DIR
+    try:
+        version = (base_dir / ARTIFACTS_DIR / LATEST_FILE).read_text().strip()
+    except FileNotFoundError:
+        return base_dir
+    version_dir = base_dir / ARTIFACTS_DIR / version
+    if version and all(path.exists() for path in artifact_paths(version_dir)):
+        return version_dir
+    logger.warning("%s names missing version %r; serving %s", LATEST_FILE, version, base_dir)
+    return base_dir
+
+
+def artifact_stamp(base_dir=None):
+    """Cheap (mtime_ns, size) fingerprint of the artifacts for change detection."""
+    stamp = []
+    for path in artifact_paths(base_dir):
+        try:
+            stat = path.stat()
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def artifact_version(base_dir=None):
+    """Short content hash of the model and scaler files."""
+    digest = hashlib.sha256()
+    for path in artifact_paths(base_dir):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+class Predictor:
+    """Scaler + regressor pair exposing single-row and batch predictions."""
+
+    def __init__(self, model, scaler, fused=None, version=None, cache=None):
+        self.model = model
+        self.scaler = scaler
+        self.fused = fused
+        self.version = version
+        self.cache = cache
+        # Directory the model was loaded from, for processes that load it again
+        self.model_dir = None
+        self.interval_model = None
+        self.interval_fused = None
+        self._leaf_table = None
+        self.scenario_predictions = {}
+        self.warm_up_report = None
+        # First prediction after loading, timed before compile() warms the model up
+        self.cold_ms = None
+
+    @classmethod
+    def load(cls, base_dir=None, fused=True, cache=None):
+        """Load the model and scaler pickles from ``base_dir``.
+
+        With ``fused`` (the default) the scaler-folded fast path is compiled
+        and parity-checked straight away. ``cache`` is an optional
+        PredictionCache consulted by predict_one. Raises FileNotFoundError
+        naming the missing file. An ``interval_model.pkl`` next to the
+        pickles is loaded for predict_interval.
+        """
+        import joblib
+
+        from .intervals import INTERVAL_FILE
+
+        model_path, scaler_path = artifact_paths(base_dir)
+        for path in (model_path, scaler_path):
+            if not path.exists():
+                raise FileNotFoundError(f"Model artifact not found: {path}")
+
+        predictor = cls(joblib.load(str(model_path)), joblib.load(str(scaler_path)),
+                        version=artifact_version(base_dir), cache=cache)
+        predictor.model_dir = model_path.parent
+        if (model_path.parent / INTERVAL_FILE).exists():
+            predictor.interval_model = joblib.load(str(model_path.parent / INTERVAL_FILE))
+        if fused:
+            predictor.cold_ms = predictor._first_call_ms()
+            predictor.compile()
+        return predictor
+
+    def _first_call_ms(self):
+        """Time one single-row prediction (ms)."""
+        from .scenarios import synthetic_incidents
+
+        row = synthetic_incidents(1)
+        start = time.perf_counter()
+        self.predict_batch(row)
+        return (time.perf_counter() - start) * 1000
+
+    @classmethod
+    def load_mapped(cls, path=None, cache=None):
+        """Load a memory-mapped ``.wfm`` artifact (see ``wildfire.artifact``).
+
+        Nothing is unpickled and the node arrays are shared with every other
+        process mapping the same file. Without the original estimator all
+        predictions use the fused model. The scaler is rebuilt from the mean
+        and scale stored in the file.
+        """
+        from .artifact import ARTIFACT_FILE, load_artifact
+
+        path = Path(path) if path is not None else DEFAULT_MODEL_DIR / ARTIFACT_FILE
+        fused, scaler, header = load_artifact(path)
+        predictor = cls(None, scaler, fused=fused, version=header["metadata"]["source_version"],
+                        cache=cache)
+        predictor.model_dir = path.parent
+        return predictor
+
+    def compile(self, probe_rows=PARITY_PROBE_ROWS, seed=0):
+        """Build the fused fast path and assert parity with the original path.
+
+        Returns True when the fast path is active. Unsupported models and
+        parity failures are logged and leave the original path in use.
+        """
+        import numpy as np
+
+        from .fused import check_parity, compile_model
+
+        try:
+            fused = compile_model(self.model, self.scaler)
+        except TypeError as e:
+            logger.info("Fused inference unavailable: %s", e)
+            return False
+
+        # Probe around the training distribution, on and off integer values
+        rng = np.random.default_rng(seed)
+        probe = rng.normal(self.scaler.mean_, self.scaler.scale_,
+                           size=(probe_rows, len(FEATURE_COLUMNS)))
+        probe[::2] = np.round(probe[::2])
+        try:
+            max_error = check_parity(fused, self.predict_reference, probe)
+        except AssertionError as e:
+            logger.error("Fused inference disabled: %s", e)
+            return False
+
+        logger.debug("Fused inference enabled (max abs error %.6g)", max_error)
+        self.fused = fused
+        if self.interval_model is not None:
+            self._compile_intervals(probe)
+        return True
+
+    def _compile_intervals(self, probe):
+        """Fuse the quantile models too, keeping the native ones if parity fails."""
+        from .fused import _scaler_params, check_parity, compile_model
+
+        mean, scale = _scaler_params(self.scaler, probe.shape[1])
+        fused_bounds = []
+        for bound in ("lower", "upper"):
+            model = self.interval_model[bound]
+            try:
+                fused = compile_model(model, self.scaler)
+                check_parity(fused, lambda X: model.predict((X - mean) / scale), probe)
+            except (TypeError, AssertionError) as e:
+                logger.info("Fused intervals unavailable: %s", e)
+                return
+            fused_bounds.append(fused)
+        self.interval_fused = tuple(fused_bounds)
+
+    def warm_up(self, scenarios=None, batch_rows=WARM_UP_BATCH_ROWS, repeats=25):
+        """Run representative predictions and precompute scenario results.
+
+        ``scenarios`` maps names to {feature column: value} dicts. They are
+        scored through predict_one, so with a cache attached the first user
+        request for a scenario is a lookup. The results are kept on
+        ``self.scenario_predictions``.
+
+        Returns (and stores on ``self.warm_up_report``) the latency of the
+        first single-row prediction, the median single-row latency once
+        warm, the synthetic batch time and the post-warm-up latency of a
+        scenario request, all in milliseconds. The first prediction is the
+        one ``load`` timed before compiling the fast path, when it did.
+        """
+        from .scenarios import synthetic_incidents
+
+        def elapsed_ms(fn):
+            start = time.perf_counter()
+            fn()
+            return (time.perf_counter() - start) * 1000
+
+        scenarios = scenarios or {}
+        X = synthetic_incidents(max(batch_rows, 1))
+        row = X[:1]
+
+        cold_ms = self.cold_ms if self.cold_ms is not None else elapsed_ms(lambda: self.predict_batch(row))
+        batch_ms = elapsed_ms(lambda: self.predict_batch(X))
+        self.predict_batch(X[:FUSED_MAX_ROWS])
+
+        start = time.perf_counter()
+        self.scenario_predictions = {
+            name: self.predict_one(features) for name, features in scenarios.items()
+        }
+        scenarios_ms = (time.perf_counter() - start) * 1000
+
+        warm = sorted(elapsed_ms(lambda: self.predict_batch(row)) for _ in range(repeats))
+        first_request_ms = None
+        if scenarios:
+            first = next(iter(scenarios.values()))
+            first_request_ms = elapsed_ms(lambda: self.predict_one(first))
+
+        self.warm_up_report = {
+            "cold_ms": cold_ms,
+            "warm_ms": warm[len(warm) // 2],
+            "batch_rows": len(X),
+            "batch_ms": batch_ms,
+            "scenarios": len(scenarios),
+            "scenarios_ms": scenarios_ms,
+            "first_request_ms": first_request_ms,
+        }
+        logger.info("Warm-up: %s", self.warm_up_report)
+        return self.warm_up_report
+
+    @staticmethod
+    def _array(X):
+        """Return X as a float64 (n, 10) array in FEATURE_COLUMNS order."""
+        import numpy as np
+
+        if hasattr(X, "columns"):
+            missing = [col for col in FEATURE_COLUMNS if col not in X.columns]
+            if missing:
+                raise ValueError(f"Missing feature column(s): {', '.join(missing)}")
+            return X[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != len(FEATURE_COLUMNS):
+            raise ValueError(
+                f"Expected an array of shape (n, {len(FEATURE_COLUMNS)}), got {X.shape}"
+            )
+        return X
+
+    def predict_reference(self, X):
+        """Predict through scaler.transform + model.predict (the slow path)."""
+        import numpy as np
+        import pandas as pd
+
+        with timed(INPUT_FRAME):
+            frame = pd.DataFrame(self._array(X), columns=FEATURE_COLUMNS)
+        with timed(SCALER_TRANSFORM):
+            scaled = self.scaler.transform(frame)
+        with timed(MODEL_PREDICT):
+            return np.asarray(self.model.predict(scaled), dtype=np.float64)
+
+    def predict_batch(self, X):
+        """Predict acres burned for a DataFrame or (n, 10) array of incidents.
+
+        Arrays must follow FEATURE_COLUMNS order; DataFrames are reordered
+        by column name and may carry extra columns.
+        """
+        with timed(INPUT_FRAME):
+            X = self._array(X)
+        if self.fused is None or (len(X) > FUSED_MAX_ROWS and self.model is not None):
+            return self.predict_reference(X)
+        with timed(FUSED_PREDICT):
+            return self.fused.predict(X)
+
+    def predict_one(self, features):
+        """Predict acres burned for one incident given as {column: value}.
+
+        Served from ``self.cache`` when the same canonical feature vector
+        was already scored by this model version.
+        """
+        missing = [col for col in FEATURE_COLUMNS if col not in features]
+        if missing:
+            raise ValueError(f"Missing feature(s): {', '.join(missing)}")
+
+        if self.cache is None:
+            row = [[float(features[col]) for col in FEATURE_COLUMNS]]
+            return float(self.predict_batch(row)[0])
+
+        from .cache import feature_key
+
+        key = feature_key(features)
+        prediction = self.cache.get(key, self.version)
+        if prediction is None:
+            prediction = float(self.predict_batch([key])[0])
+            self.cache.put(key, self.version, prediction)
+        return prediction
+
+    @property
+    def interval_method(self):
+        """"quantile", "trees" or None: how predict_interval gets its bounds."""
+        from .fused import FusedTrees
+
+        if self.interval_model is not None and self.scaler is not None:
+            return "quantile"
+        if isinstance(self.fused, FusedTrees) and self.fused.average and self.fused.n_trees > 1:
+            return "trees"
+        return None
+
+    @property
+    def interval_coverage(self):
+        """Nominal share of outcomes inside the interval."""
+        from .intervals import DEFAULT_COVERAGE
+
+        if self.interval_method == "quantile":
+            return self.interval_model["coverage"]
+        return DEFAULT_COVERAGE
+
+    def predict_interval(self, X):
+        """Return (prediction, lower, upper) arrays for a batch of incidents.
+
+        Like predict_batch, batches up to FUSED_MAX_ROWS use the fused
+        models and larger ones the native libraries. Raises ValueError when
+        the model has no interval source (see ``interval_method``).
+        """
+        from .fused import _scaler_params
+        from .intervals import contain, forest_value_table, native_tree_intervals, tree_intervals
+
+        method = self.interval_method
+        if method is None:
+            raise ValueError("This model has no prediction intervals (no forest and no interval_model.pkl)")
+        with timed(INPUT_FRAME):
+            X = self._array(X)
+        native = len(X) > FUSED_MAX_ROWS and self.model is not None
+        if native or (method == "quantile" and self.interval_fused is None):
+            mean, scale = _scaler_params(self.scaler, X.shape[1])
+            scaled = (X - mean) / scale
+
+        if method == "trees":
+            if not native:
+                with timed(FUSED_PREDICT):
+                    return tree_intervals(self.fused, X, self.interval_coverage)
+            if self._leaf_table is None:
+                self._leaf_table = forest_value_table(self.model)
+            with timed(MODEL_PREDICT):
+                return native_tree_intervals(self.model, self._leaf_table, scaled, self.interval_coverage)
+
+        prediction = self.predict_batch(X)
+        if self.interval_fused is not None and len(X) <= FUSED_MAX_ROWS:
+            with timed(FUSED_PREDICT):
+                return contain(prediction, *(fused.predict(X) for fused in self.interval_fused))
+        with timed(MODEL_PREDICT):
+            return contain(prediction, *(self.interval_model[bound].predict(scaled) for bound in ("lower", "upper")))
+
+    def predict_contributions(self, X):
+        """Return (contributions (n, 10), bias (n,)) per feature (see ``wildfire.attributions``)."""
+        from .attributions import contributions
+
+        return contributions(self, X)
@@ -0,0 +1,124 @@
+"""Hot reload of model artifacts behind a long-running app or service.
+
+A ModelReloader owns the predictor being served. ``current()`` returns
+it. At most every ``poll_seconds`` it also compares the artifact stamp of
+``latest_model_dir(base_dir)`` with the stamp that was loaded. The stamp
+changes when ``artifacts/LATEST`` moves to a new version or the pickles
+are rewritten in place.
+
+A changed stamp starts a background thread that loads and warms the new
+artifacts with ``loader(model_dir)``. Meanwhile callers keep getting the
+old predictor. When loading succeeds the reference is swapped under a
+lock, so the next ``current()`` returns the new model. Callers that
+already hold the old predictor (a rerun in progress) finish with it, and
+it is freed when the last of them lets go. A failed load is logged and
+leaves the old model in service. It is not retried until the stamp
+changes again, for example when a half-written pickle is finished.
+"""
+import logging
+import threading
+import time
+
+from .predictor import artifact_stamp, latest_model_dir
+
+# Minimum seconds between artifact checks
+POLL_SECONDS = 2.0
+
+logger = logging.getLogger(__name__)
+
+
+class ModelReloader:
+    """Serves one predictor and swaps in new artifacts loaded in the background."""
+
+    def __init__(self, base_dir, loader, poll_seconds=POLL_SECONDS):
+        self.base_dir = base_dir
+        self.poll_seconds = poll_seconds
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._predictor = None
+        self._stamp = None
+        self._pending = None
+        self._failed = None
+        self._checked = 0.0
+        self.model_dir = None
+        self.loaded_at = None
+        self.swaps = 0
+        self.last_error = None
+
+    def current(self):
+        """Return the active predictor, first starting a reload if the artifacts changed.
+
+        The very first load happens in the calling thread, since there is
+        nothing to serve until it finishes. Returns None while no load has
+        succeeded.
+        """
+        self.check()
+        return self._predictor
+
+    def _fingerprint(self):
+        model_dir = latest_model_dir(self.base_dir)
+        return model_dir, (str(model_dir), artifact_stamp(model_dir))
+
+    def check(self, force=False):
+        """Start loading new artifacts if their stamp changed (at most every poll_seconds)."""
+        now = time.monotonic()
+        if not force and self._predictor is not None and now - self._checked < self.poll_seconds:
+            return
+        self._checked = now
+        model_dir, stamp = self._fingerprint()
+        with self._lock:
+            if stamp in (self._stamp, self._pending, self._failed):
+                return
+            self._pending = stamp
+        if self._predictor is None:
+            self._load(model_dir, stamp)
+        else:
+            threading.Thread(target=self._load, args=(model_dir, stamp),
+                             name="model-reloader", daemon=True).start()
+
+    def _load(self, model_dir, stamp):
+        try:
+            predictor = self._loader(model_dir)
+        except Exception as exc:
+            logger.exception("Loading %s failed; still serving %s", model_dir, self.version)
+            with self._lock:
+                self._failed, self._pending = stamp, None
+                self.last_error = exc
+            return
+        with self._lock:
+            swapped = self._predictor is not None
+            self._predictor, self._stamp, self._pending, self._failed = predictor, stamp, None, None
+            self.model_dir = model_dir
+            self.loaded_at = time.time()
+            self.last_error = None
+            self.swaps += swapped
+        if swapped:
+            logger.info("Now serving model %s from %s", predictor.version, model_dir)
+
+    @property
+    def version(self):
+        return getattr(self._predictor, "version", None)
+
+    @property
+    def loading(self):
+        return self._pending is not None
+
+    def wait(self, timeout=None):
+        """Block until no background load is pending; returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.loading:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def status(self):
+        """Snapshot for display: active version, where it came from and reload state."""
+        return {
+            "version": self.version,
+            "model_dir": str(self.model_dir) if self.model_dir is not None else None,
+            "loaded_at": self.loaded_at,
+            "loading": self.loading,
+            "swaps": self.swaps,
+            "last_error": str(self.last_error) if self.last_error is not None else None,
+        }
@@ -0,0 +1,212 @@
+"""Statewide risk grid: predicted acres over California for one profile.
+
+A *profile* is every model input except Latitude and Longitude (county
+code, containment, resources, major-incident flag). The state's bounding
+box is split into square tiles of ``tile_deg`` degrees, each sampled at
+``resolution`` x ``resolution`` cell centres and scored with one
+``predict_batch`` call.
+
+Finished tiles are saved as ``.npy`` files under::
+
+    <cache_dir>/<model version>/<profile hash>/<tile_deg>x<resolution>/<row>_<col>.npy
+
+so a view only computes the tiles it has never seen for that profile and
+model. A retrained model gets a new version directory. Writes go through a
+temp file and ``os.replace``, so concurrent sessions can share the cache.
+
+The cache is pruned so it does not grow without bound. ``prune_versions``
+deletes every version directory but the one being served (the app calls it
+when it loads a model), and starting a new profile deletes the least
+recently viewed ones beyond ``max_profiles`` for that version.
+"""
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+from .features import FEATURE_COLUMNS
+
+# (south, north, west, east) in degrees
+CALIFORNIA_BOUNDS = (32.5, 42.0, -124.5, -114.0)
+
+DEFAULT_TILE_DEG = 0.5
+DEFAULT_RESOLUTION = 16
+
+CACHE_ENV_VAR = "WILDFIRE_TILE_CACHE"
+
+# Profiles kept per model version (about 0.5 MB each for the full state at 16x16)
+DEFAULT_MAX_PROFILES = 200
+
+# Inputs held fixed across the map
+PROFILE_FEATURES = [col for col in FEATURE_COLUMNS if col not in ("Latitude", "Longitude")]
+
+
+def default_cache_dir():
+    from .predictor import DEFAULT_MODEL_DIR
+
+    return Path(os.environ.get(CACHE_ENV_VAR) or DEFAULT_MODEL_DIR / ".tile_cache")
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+def prune_versions(version, cache_dir=None):
+    """Delete the cached tiles of every model version but ``version``; returns how many."""
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    if not cache_dir.is_dir():
+        return 0
+    stale = [path for path in cache_dir.iterdir() if path.is_dir() and path.name != str(version)]
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+    return len(stale)
+
+
+def prune_profiles(version_dir, max_profiles=DEFAULT_MAX_PROFILES):
+    """Delete all but the ``max_profiles`` most recently viewed profiles; returns how many."""
+    version_dir = Path(version_dir)
+    if not version_dir.is_dir():
+        return 0
+    profiles = sorted((path for path in version_dir.iterdir() if path.is_dir()), key=_mtime, reverse=True)
+    for path in profiles[max_profiles:]:
+        shutil.rmtree(path, ignore_errors=True)
+    return len(profiles[max_profiles:])
+
+
+def profile_hash(profile):
+    """Short stable hash of a profile's {column: value} inputs."""
+    canonical = json.dumps({col: round(float(profile[col]), 6) + 0.0 for col in PROFILE_FEATURES},
+                           sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:12]
+
+
+class RiskGrid:
+    """Tiled, disk-cached predictions over CALIFORNIA_BOUNDS for one profile."""
+
+    def __init__(self, predictor, profile, cache_dir=None, tile_deg=DEFAULT_TILE_DEG,
+                 resolution=DEFAULT_RESOLUTION, bounds=CALIFORNIA_BOUNDS, max_profiles=DEFAULT_MAX_PROFILES):
+        missing = [col for col in PROFILE_FEATURES if col not in profile]
+        if missing:
+            raise ValueError(f"Missing profile input(s): {', '.join(missing)}")
+        self.predictor = predictor
+        self.profile = {col: float(profile[col]) for col in PROFILE_FEATURES}
+        self.tile_deg = float(tile_deg)
+        self.resolution = int(resolution)
+        self.bounds = bounds
+        self.max_profiles = max_profiles
+        self.directory = (Path(cache_dir) if cache_dir is not None else default_cache_dir()) \
+            / str(predictor.version) / profile_hash(self.profile) / f"{self.tile_deg:g}x{self.resolution}"
+
+        south, north, west, east = bounds
+        self.rows = int(round((north - south) / self.tile_deg))
+        self.cols = int(round((east - west) / self.tile_deg))
+
+    def tiles_in_view(self, view=None):
+        """Return the (row, col) tiles overlapping ``view`` (south, north, west, east)."""
+        import math
+
+        south, north, west, east = view or self.bounds
+        s0, _, w0, _ = self.bounds
+        first_row = max(0, math.floor((south - s0) / self.tile_deg))
+        last_row = min(self.rows - 1, math.ceil((north - s0) / self.tile_deg) - 1)
+        first_col = max(0, math.floor((west - w0) / self.tile_deg))
+        last_col = min(self.cols - 1, math.ceil((east - w0) / self.tile_deg) - 1)
+        return [(row, col) for row in range(first_row, last_row + 1)
+                for col in range(first_col, last_col + 1)]
+
+    def cell_centres(self, row, col):
+        """Latitudes and longitudes of a tile's cell centres (south to north, west to east)."""
+        import numpy as np
+
+        step = self.tile_deg / self.resolution
+        offsets = (np.arange(self.resolution) + 0.5) * step
+        south, _, west, _ = self.bounds
+        return south + row * self.tile_deg + offsets, west + col * self.tile_deg + offsets
+
+    def _path(self, row, col):
+        return self.directory / f"{row}_{col}.npy"
+
+    def is_cached(self, row, col):
+        return self._path(row, col).exists()
+
+    def compute_tile(self, row, col):
+        """Score one tile; returns a (resolution, resolution) array of acres."""
+        import numpy as np
+
+        lats, lons = self.cell_centres(row, col)
+        grid = np.empty((self.resolution * self.resolution, len(FEATURE_COLUMNS)))
+        for col_index, feature in enumerate(FEATURE_COLUMNS):
+            if feature not in self.profile:
+                continue
+            grid[:, col_index] = self.profile[feature]
+        grid[:, FEATURE_COLUMNS.index("Latitude")] = np.repeat(lats, self.resolution)
+        grid[:, FEATURE_COLUMNS.index("Longitude")] = np.tile(lons, self.resolution)
+        return self.predictor.predict_batch(grid).reshape(self.resolution, self.resolution)
+
+    def tile(self, row, col):
+        """Return (acres, from_cache) for a tile, computing and saving it if needed."""
+        import numpy as np
+
+        path = self._path(row, col)
+        try:
+            return np.load(path), True
+        except (FileNotFoundError, ValueError, EOFError):
+            pass
+
+        acres = self.compute_tile(row, col).astype(np.float32)
+        profile_dir = self.directory.parent
+        if not profile_dir.exists():
+            prune_profiles(profile_dir.parent, max(self.max_profiles - 1, 0))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, acres)
+        os.replace(tmp, path)
+        return acres, False
+
+    def iter_tiles(self, view=None):
+        """Yield (row, col, acres, from_cache) for ``view``, cached tiles first.
+
+        Cached tiles come back immediately, so a caller redrawing after each
+        yield shows everything already known before the first new tile.
+        """
+        tiles = self.tiles_in_view(view)
+        # Viewing a profile keeps it from being pruned
+        try:
+            os.utime(self.directory.parent)
+        except FileNotFoundError:
+            pass
+        cached = [tile for tile in tiles if self.is_cached(*tile)]
+        missing = [tile for tile in tiles if not self.is_cached(*tile)]
+        for row, col in cached + missing:
+            acres, from_cache = self.tile(row, col)
+            yield row, col, acres, from_cache
+
+    def mosaic(self, tiles):
+        """Assemble {(row, col): acres} into one array plus its cell-centre axes.
+
+        Covers the bounding rectangle of ``tiles``; tiles not in the mapping
+        are NaN.
+        """
+        import numpy as np
+
+        rows = [row for row, _ in tiles]
+        cols = [col for _, col in tiles]
+        first_row, first_col = min(rows), min(cols)
+        n_rows, n_cols = max(rows) - first_row + 1, max(cols) - first_col + 1
+        res = self.resolution
+
+        z = np.full((n_rows * res, n_cols * res), np.nan, dtype=np.float32)
+        for (row, col), acres in tiles.items():
+            r, c = (row - first_row) * res, (col - first_col) * res
+            z[r:r + res, c:c + res] = acres
+
+        lats = np.concatenate([self.cell_centres(row, first_col)[0]
+                               for row in range(first_row, first_row + n_rows)])
+        lons = np.concatenate([self.cell_centres(first_row, col)[1]
+                               for col in range(first_col, first_col + n_cols)])
+        return lats, lons, z
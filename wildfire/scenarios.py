@@ -0,0 +1,104 @@
+"""Demo scenarios from DEMO_SCENARIOS.md and synthetic incidents around them."""
+from .features import FEATURE_COLUMNS
+
+# Preset inputs for the Prediction page, keyed by the page's widget names
+DEMO_SCENARIOS = {
+    "Custom Input": {
+        "county": 10, "latitude": 37.0, "longitude": -120.0,
+        "percent_contained": 50.0, "personnel": 50, "engines": 10,
+        "helicopters": 2, "dozers": 1, "water_tenders": 2, "major_incident": "No"
+    },
+    "Minor Fire (Small Scale)": {
+        "county": 15, "latitude": 38.5, "longitude": -121.5,
+        "percent_contained": 75.0, "personnel": 25, "engines": 5,
+        "helicopters": 1, "dozers": 0, "water_tenders": 1, "major_incident": "No"
+    },
+    "Moderate Fire (Growing)": {
+        "county": 25, "latitude": 36.5, "longitude": -119.5,
+        "percent_contained": 30.0, "personnel": 150, "engines": 25,
+        "helicopters": 5, "dozers": 3, "water_tenders": 8, "major_incident": "Yes"
+    },
+    "Severe Fire (Critical)": {
+        "county": 35, "latitude": 39.0, "longitude": -122.0,
+        "percent_contained": 10.0, "personnel": 500, "engines": 75,
+        "helicopters": 15, "dozers": 10, "water_tenders": 20, "major_incident": "Yes"
+    },
+    "Contained Fire (Nearly Out)": {
+        "county": 20, "latitude": 37.8, "longitude": -120.8,
+        "percent_contained": 95.0, "personnel": 100, "engines": 15,
+        "helicopters": 3, "dozers": 2, "water_tenders": 5, "major_incident": "No"
+    }
+}
+
+# Widget name for every model feature, in FEATURE_COLUMNS order
+INPUT_KEYS = [
+    "county", "latitude", "longitude", "percent_contained", "personnel",
+    "engines", "helicopters", "dozers", "water_tenders", "major_incident",
+]
+
+
+def scenario_features(values):
+    """Convert Prediction page inputs into a {feature column: value} dict."""
+    features = {col: values[key] for col, key in zip(FEATURE_COLUMNS, INPUT_KEYS)}
+    features["MajorIncident"] = 1 if values["major_incident"] == "Yes" else 0
+    return features
+
+
+# Slack around the demo scenarios for synthetic incidents
+LOCATION_MARGIN_DEG = 1.0
+RESOURCE_HEADROOM = 2.0
+
+# Hard limits from the Prediction page widgets
+COUNTY_RANGE = (0, 60)
+PERCENT_RANGE = (0.0, 100.0)
+
+
+def feature_ranges():
+    """Return {feature column: (low, high)} implied by the demo scenarios.
+
+    County and containment use the Prediction page's widget limits.
+    Latitude and longitude span the scenarios plus LOCATION_MARGIN_DEG.
+    Resources run from 0 to RESOURCE_HEADROOM times the largest demo value.
+    """
+    rows = [scenario_features(values) for values in DEMO_SCENARIOS.values()]
+    ranges = {}
+    for col in FEATURE_COLUMNS:
+        values = [row[col] for row in rows]
+        if col == "Counties":
+            ranges[col] = COUNTY_RANGE
+        elif col == "PercentContained":
+            ranges[col] = PERCENT_RANGE
+        elif col in ("Latitude", "Longitude"):
+            ranges[col] = (min(values) - LOCATION_MARGIN_DEG, max(values) + LOCATION_MARGIN_DEG)
+        elif col == "MajorIncident":
+            ranges[col] = (0, 1)
+        else:
+            ranges[col] = (0, max(values) * RESOURCE_HEADROOM)
+    return ranges
+
+
+def synthetic_incidents(n, seed=0):
+    """Return an (n, 10) array of incidents jittered around the demo scenarios.
+
+    Each row starts from a random scenario. Resources are scaled by a
+    log-normal factor, containment shifts by up to ±20 points, the
+    location moves by up to ±1 degree, and 10% of major-incident flags
+    are flipped. Every column is then clipped to ``feature_ranges()``.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    base = np.array([list(scenario_features(v).values()) for v in DEMO_SCENARIOS.values()],
+                    dtype=np.float64)
+    X = base[rng.integers(0, len(base), size=n)]
+
+    X[:, 0] = rng.integers(COUNTY_RANGE[0], COUNTY_RANGE[1] + 1, size=n)
+    X[:, 1:3] += rng.uniform(-1.0, 1.0, size=(n, 2))
+    X[:, 3] = np.clip(X[:, 3] + rng.uniform(-20, 20, size=n), 0, 100)
+    X[:, 4:9] = np.round(X[:, 4:9] * rng.lognormal(0.0, 0.5, size=(n, 5)))
+    flip = rng.random(n) < 0.1
+    X[flip, 9] = 1 - X[flip, 9]
+
+    ranges = feature_ranges()
+    low, high = (np.array([ranges[col][i] for col in FEATURE_COLUMNS]) for i in (0, 1))
+    return np.clip(X, low, high, out=X)
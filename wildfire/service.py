@@ -0,0 +1,359 @@
+"""Local HTTP scoring service with dynamic micro-batching.
+
+    python -m wildfire.service --port 8765 --window-ms 2 --max-batch 256
+
+Endpoints:
+
+- ``POST /predict`` takes one incident as a JSON object keyed by the ten
+  feature columns, or a JSON list of them. It returns
+  ``{"prediction", "severity"}`` or ``{"predictions", "severity"}``.
+- ``GET /metrics`` returns latency percentiles, throughput and batching
+  counters, plus divergence stats under ``shadow`` when a candidate model
+  is shadowing (``--shadow-model-dir``, see ``wildfire.shadow``).
+- ``GET /health`` returns ``{"status": "ok"}``.
+
+Concurrent requests that arrive within ``window_ms`` of each other are
+scored in one vectorized ``predict_batch`` call of at most ``max_batch``
+rows; a request with more rows is split into ``max_batch``-row chunks,
+each queued on its own. The queue is bounded; once it holds ``max_queue``
+pending chunks, new requests are rejected with 503 instead of queueing
+without limit.
+
+The server is a deliberately small HTTP/1.1 implementation on asyncio
+streams (keep-alive, Content-Length bodies only) so it needs no web
+framework.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .features import FEATURE_COLUMNS, severity_band
+from .metrics import LatencyRecorder
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_WINDOW_MS = 2.0
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_QUEUE = 1024
+
+# Largest request body accepted (bytes)
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class Overloaded(Exception):
+    """Raised when the micro-batch queue is full."""
+
+
+class MicroBatcher:
+    """Collects concurrent requests into bounded, time-windowed batches.
+
+    ``predict_batch`` is called from a single worker thread with a list of
+    feature rows and must return one prediction per row.
+    """
+
+    def __init__(self, predict_batch, window_ms=DEFAULT_WINDOW_MS,
+                 max_batch=DEFAULT_MAX_BATCH, max_queue=DEFAULT_MAX_QUEUE):
+        self.predict_batch = predict_batch
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.max_queue = max_queue
+        self.latency = LatencyRecorder()
+        self.batches = 0
+        self.batched_rows = 0
+        self.rejected = 0
+        self._queue = None
+        self._task = None
+        # Request taken off the queue that would have overfilled the last batch
+        self._carry = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="micro-batch")
+
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=False)
+
+    async def submit(self, rows):
+        """Score ``rows`` (a list of feature rows) as part of the next batch(es)."""
+        started = time.perf_counter()
+        chunks = [rows[i:i + self.max_batch] for i in range(0, len(rows), self.max_batch)]
+        # All chunks or none: a half-queued request would be scored for nothing
+        if self.max_queue > 0 and self._queue.qsize() + len(chunks) > self.max_queue:
+            self.rejected += 1
+            raise Overloaded(f"Queue full ({self.max_queue} pending chunks)")
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in chunks]
+        for chunk, future in zip(chunks, futures):
+            self._queue.put_nowait((chunk, future))
+        error = True
+        try:
+            predictions = [p for chunk in await asyncio.gather(*futures) for p in chunk]
+            error = False
+            return predictions
+        finally:
+            self.latency.record(time.perf_counter() - started, error=error)
+
+    async def _collect(self):
+        """Wait for one request, then gather more until the window closes or the batch is full."""
+        if self._carry is not None:
+            pending, self._carry = [self._carry], None
+        else:
+            pending = [await self._queue.get()]
+        rows = len(pending[0][0])
+        deadline = time.perf_counter() + self.window
+        while rows < self.max_batch:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if rows + len(item[0]) > self.max_batch:
+                # Starts the next batch instead
+                self._carry = item
+                break
+            pending.append(item)
+            rows += len(item[0])
+        return pending
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = await self._collect()
+            batch = [row for rows, _ in pending for row in rows]
+            try:
+                predictions = await loop.run_in_executor(self._executor, self.predict_batch, batch)
+            except Exception as e:
+                logger.exception("Batch prediction failed")
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.batched_rows += len(batch)
+            offset = 0
+            for rows, future in pending:
+                if not future.done():
+                    future.set_result([float(p) for p in predictions[offset:offset + len(rows)]])
+                offset += len(rows)
+
+    def metrics(self):
+        snapshot = self.latency.snapshot()
+        snapshot.update({
+            "batches": self.batches,
+            "mean_batch_rows": self.batched_rows / self.batches if self.batches else 0.0,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "rejected": self.rejected,
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+            "max_queue": self.max_queue,
+        })
+        return snapshot
+
+
+def _parse_incidents(payload):
+    """Return (rows, single) from a JSON object or list of objects."""
+    single = isinstance(payload, dict)
+    incidents = [payload] if single else payload
+    if not isinstance(incidents, list) or not incidents:
+        raise ValueError("Expected a JSON object or a non-empty list of objects")
+
+    rows = []
+    for i, incident in enumerate(incidents):
+        if not isinstance(incident, dict):
+            raise ValueError(f"Incident {i} is not a JSON object")
+        missing = [col for col in FEATURE_COLUMNS if col not in incident]
+        if missing:
+            raise ValueError(f"Incident {i} is missing: {', '.join(missing)}")
+        try:
+            rows.append([float(incident[col]) for col in FEATURE_COLUMNS])
+        except (TypeError, ValueError):
+            raise ValueError(f"Incident {i} has non-numeric feature values")
+    return rows, single
+
+
+class ScoringService:
+    """asyncio HTTP front end for a MicroBatcher."""
+
+    def __init__(self, batcher, host=DEFAULT_HOST, port=DEFAULT_PORT, shadow=None):
+        self.batcher = batcher
+        self.shadow = shadow
+        self.host = host
+        self.port = port
+        self.server = None
+
+    async def start(self):
+        await self.batcher.start()
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        # Port 0 binds an ephemeral port; report the real one
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.batcher.stop()
+
+    async def _route(self, method, path, body):
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/metrics":
+            metrics = self.batcher.metrics()
+            if self.shadow is not None:
+                metrics["shadow"] = self.shadow.stats()
+            return 200, metrics
+        if path != "/predict":
+            return 404, {"error": f"Unknown path: {path}"}
+        if method != "POST":
+            return 405, {"error": "Use POST for /predict"}
+
+        try:
+            rows, single = _parse_incidents(json.loads(body or b"null"))
+        except (ValueError, UnicodeDecodeError) as e:
+            return 400, {"error": str(e)}
+        try:
+            predictions = await self.batcher.submit(rows)
+        except Overloaded as e:
+            return 503, {"error": str(e)}
+
+        severity = [severity_band(p) for p in predictions]
+        if single:
+            return 200, {"prediction": predictions[0], "severity": severity[0]}
+        return 200, {"predictions": predictions, "severity": severity}
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Malformed request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {"error": "Invalid Content-Length"}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": "Request body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, payload = await self._route(method, target.split("?", 1)[0], body)
+                except Exception:
+                    logger.exception("Unhandled error for %s %s", method, target)
+                    status, payload = 500, {"error": "Internal server error"}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        headers = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == 503:
+            headers.append("Retry-After: 1")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+
+def create_service(predictor, host=DEFAULT_HOST, port=DEFAULT_PORT, window_ms=DEFAULT_WINDOW_MS,
+                   max_batch=DEFAULT_MAX_BATCH, max_queue=DEFAULT_MAX_QUEUE, shadow=None):
+    """Build a ScoringService around a loaded Predictor.
+
+    ``shadow`` is an optional ShadowScorer that also receives every batch.
+    """
+    predict_batch = predictor.predict_batch if shadow is None else shadow.wrap(predictor.predict_batch)
+    batcher = MicroBatcher(predict_batch, window_ms=window_ms,
+                           max_batch=max_batch, max_queue=max_queue)
+    return ScoringService(batcher, host=host, port=port, shadow=shadow)
+
+
+async def _serve(args):
+    from .predictor import Predictor, latest_model_dir
+
+    shadow = None
+    if args.shadow_model_dir:
+        from .shadow import ShadowScorer
+
+        shadow = ShadowScorer(Predictor.load(args.shadow_model_dir))
+    predictor = Predictor.load(latest_model_dir(args.model_dir))
+    service = create_service(predictor, host=args.host, port=args.port,
+                             window_ms=args.window_ms, max_batch=args.max_batch,
+                             max_queue=args.max_queue, shadow=shadow)
+    await service.start()
+    logger.info("Scoring service listening on http://%s:%d", service.host, service.port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local micro-batching wildfire scoring service")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW_MS,
+                        help="How long to wait for more requests before scoring a batch")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                        help="Maximum rows per predict call")
+    parser.add_argument("--max-queue", type=int, default=DEFAULT_MAX_QUEUE,
+                        help="Pending chunks before new requests get 503")
+    parser.add_argument("--model-dir", default=None,
+                        help="Directory holding best_fire_model.pkl and scaler.pkl, or a base directory "
+                             "whose artifacts/LATEST names one (default: the repo's, like the app)")
+    parser.add_argument("--shadow-model-dir", default=None,
+                        help="Candidate model scored on the same inputs in the background")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Shadow scoring: run a candidate model on live inputs, off the request path.
+
+Set ``WILDFIRE_SHADOW_MODEL`` to a directory holding a candidate's
+``best_fire_model.pkl`` and ``scaler.pkl`` (for example
+``artifacts/<version>`` before pointing LATEST at it). The app and the
+scoring service (``--shadow-model-dir``) then queue every prediction they
+serve, together with its inputs, for the candidate as well.
+
+The user-visible prediction never waits on the candidate. ``submit`` only
+queues the batch, without copying it; a batch that would take the queue
+past ``max_rows`` pending rows is dropped (counted as ``dropped``). One
+daemon thread scores queued batches with the candidate and accumulates
+divergence statistics: absolute and relative deltas, and how often the
+two models put an incident in different severity bands.
+
+The candidate shares the cores with the served model and the inference
+executor (``wildfire.executor``), so its thread runs at a lower OS
+priority, with its models and native thread pools limited to one thread.
+"""
+import logging
+import os
+import queue
+import threading
+from collections import deque
+
+SHADOW_ENV_VAR = "WILDFIRE_SHADOW_MODEL"
+
+# Rows waiting for the candidate before new batches are dropped
+DEFAULT_MAX_ROWS = 100000
+
+# Added to the shadow thread's niceness (Linux applies it to that thread only)
+NICE_INCREMENT = 10
+
+# Native threads the candidate may use
+CANDIDATE_THREADS = 1
+
+# Recent per-row deltas kept for percentiles
+DEFAULT_WINDOW = 10000
+
+# Relative deltas use max(|primary|, this) as the denominator
+RELATIVE_FLOOR_ACRES = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+class ShadowScorer:
+    """Scores submitted inputs with a candidate predictor on a background thread."""
+
+    def __init__(self, candidate, max_rows=DEFAULT_MAX_ROWS, window=DEFAULT_WINDOW):
+        from .executor import limit_model_threads
+
+        if getattr(candidate, "model", None) is not None:
+            limit_model_threads(candidate, CANDIDATE_THREADS)
+        self.candidate = candidate
+        self.max_rows = max_rows
+        self.pending_rows = 0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._abs_deltas = deque(maxlen=window)
+        self._rel_deltas = deque(maxlen=window)
+        self.reset()
+        self._thread = threading.Thread(target=self._run, name="shadow-scorer", daemon=True)
+        self._thread.start()
+
+    def reset(self):
+        with self._lock:
+            self._abs_deltas.clear()
+            self._rel_deltas.clear()
+            self.rows = 0
+            self.batches = 0
+            self.dropped = 0
+            self.errors = 0
+            self.abs_delta_sum = 0.0
+            self.max_abs_delta = 0.0
+            self.band_disagreements = 0
+            # {(primary band, candidate band): rows}
+            self.band_pairs = {}
+
+    def submit(self, X, primary):
+        """Queue (inputs, served predictions) for the candidate; never blocks.
+
+        Returns False if the batch would take the queue past ``max_rows``
+        pending rows and was dropped. The inputs are not copied, so callers
+        must not modify them afterwards.
+        """
+        import numpy as np
+
+        X, primary = np.asarray(X, dtype=np.float64), np.asarray(primary, dtype=np.float64)
+        with self._lock:
+            if self.pending_rows + len(X) > self.max_rows:
+                self.dropped += 1
+                return False
+            self.pending_rows += len(X)
+        self._queue.put_nowait((X, primary))
+        return True
+
+    def wrap(self, predict_fn):
+        """Return ``predict_fn`` with every batch it scores also submitted here.
+
+        ``predict_fn`` may also return (prediction, lower, upper); only the
+        prediction is compared.
+        """
+        def predict(X):
+            predictions = predict_fn(X)
+            self.submit(X, predictions[0] if isinstance(predictions, tuple) else predictions)
+            return predictions
+        return predict
+
+    def _run(self):
+        from threadpoolctl import threadpool_limits
+
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), NICE_INCREMENT)
+        except (AttributeError, OSError):
+            logger.debug("Could not lower the shadow thread's priority")
+        with threadpool_limits(limits=CANDIDATE_THREADS):
+            while True:
+                X, primary = self._queue.get()
+                try:
+                    self._record(primary, self.candidate.predict_batch(X))
+                except Exception:
+                    logger.exception("Shadow scoring failed for a batch of %d rows", len(X))
+                    with self._lock:
+                        self.errors += 1
+                finally:
+                    with self._lock:
+                        self.pending_rows -= len(X)
+                    self._queue.task_done()
+
+    def _record(self, primary, shadow):
+        import numpy as np
+
+        from .batch import severity_bands
+
+        abs_delta = np.abs(shadow - primary)
+        rel_delta = abs_delta / np.maximum(np.abs(primary), RELATIVE_FLOOR_ACRES)
+        primary_bands, shadow_bands = severity_bands(primary), severity_bands(shadow)
+        pairs, counts = np.unique(np.stack([primary_bands, shadow_bands]).astype(str), axis=1,
+                                  return_counts=True)
+        with self._lock:
+            self.rows += len(primary)
+            self.batches += 1
+            self.abs_delta_sum += float(abs_delta.sum())
+            self.max_abs_delta = max(self.max_abs_delta, float(abs_delta.max(initial=0.0)))
+            self.band_disagreements += int((primary_bands != shadow_bands).sum())
+            for (first, second), count in zip(pairs.T, counts):
+                self.band_pairs[(first, second)] = self.band_pairs.get((first, second), 0) + int(count)
+            self._abs_deltas.extend(abs_delta.tolist())
+            self._rel_deltas.extend(rel_delta.tolist())
+
+    def flush(self, timeout=None):
+        """Wait until every queued batch has been scored; returns False on timeout."""
+        if timeout is None:
+            self._queue.join()
+            return True
+        done = threading.Event()
+        threading.Thread(target=lambda: (self._queue.join(), done.set()), daemon=True).start()
+        return done.wait(timeout)
+
+    def stats(self):
+        """Divergence summary since the last reset."""
+        from .metrics import percentile
+
+        with self._lock:
+            abs_deltas = sorted(self._abs_deltas)
+            rel_deltas = sorted(self._rel_deltas)
+            rows = self.rows
+            summary = {
+                "candidate": getattr(self.candidate, "version", None),
+                "rows": rows,
+                "batches": self.batches,
+                "pending": self._queue.qsize(),
+                "pending_rows": self.pending_rows,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "mean_abs_delta": self.abs_delta_sum / rows if rows else 0.0,
+                "max_abs_delta": self.max_abs_delta,
+                "band_disagreement": self.band_disagreements / rows if rows else 0.0,
+                "band_pairs": {f"{first}->{second}": count
+                               for (first, second), count in sorted(self.band_pairs.items())},
+            }
+        summary.update({
+            "p50_abs_delta": percentile(abs_deltas, 50),
+            "p95_abs_delta": percentile(abs_deltas, 95),
+            "p50_rel_delta": percentile(rel_deltas, 50),
+            "p95_rel_delta": percentile(rel_deltas, 95),
+        })
+        return summary
+
+
+_shared_shadow = None
+_shared_loaded = False
+_shared_lock = threading.Lock()
+
+
+def shared_shadow():
+    """Return the process-wide ShadowScorer for ``$WILDFIRE_SHADOW_MODEL``, or None.
+
+    The candidate is loaded on first use. A candidate that fails to load
+    is logged once and shadow scoring stays off.
+    """
+    global _shared_shadow, _shared_loaded
+    with _shared_lock:
+        if not _shared_loaded:
+            _shared_loaded = True
+            model_dir = os.environ.get(SHADOW_ENV_VAR)
+            if model_dir:
+                from .predictor import Predictor
+
+                try:
+                    _shared_shadow = ShadowScorer(Predictor.load(model_dir))
+                except Exception:
+                    logger.exception("Could not load shadow model from %s", model_dir)
+        return _shared_shadow
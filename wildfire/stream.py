@@ -0,0 +1,474 @@
+"""Live incident updates: ingest, re-score what changed, publish to a dashboard.
+
+    python -m wildfire.stream --jsonl updates.jsonl
+    python -m wildfire.stream --port 8766
+
+Each update is one JSON object per line. It holds an ``incident_id`` and
+any subset of the feature columns, for example
+``{"incident_id": "CA-2024-117", "PercentContained": 40, "Engines": 12}``.
+Fields left out keep the incident's previous value. An incident is
+scored once all ten features are known.
+
+Sources (both feed the same ``StreamIngestor``):
+
+- ``tail(path)`` follows a JSONL file as it grows, like ``tail -F``. It
+  starts over when the file is truncated or replaced.
+- ``serve(host, port)`` accepts local TCP connections that send
+  newline-delimited updates (``nc localhost 8766 < updates.jsonl``).
+
+Sources read raw blocks and hand whole lists of lines to one worker
+thread. The worker parses them and applies them to the ``IncidentStream``
+in micro-batches. The stream keeps every incident's latest feature vector
+in a preallocated array. Only incidents whose vector differs from the one
+last scored are re-scored, with one ``predict_batch`` call per
+micro-batch. When the served model version changes (hot reload), every
+incident is re-scored once. Each re-scored incident gets a new sequence
+number, so the Live page asks for ``frame(since)`` and merges only the
+rows that moved.
+
+Set ``WILDFIRE_STREAM`` to a JSONL path or ``tcp://host:port`` and the app
+starts ingesting on launch (see ``shared_stream``).
+"""
+import argparse
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+from collections import deque
+
+from .features import FEATURE_COLUMNS
+
+STREAM_ENV_VAR = "WILDFIRE_STREAM"
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8766
+
+ID_FIELD = "incident_id"
+
+# Updates applied per predict call at most
+DEFAULT_BATCH_ROWS = 4096
+
+# Blocks of lines waiting for the worker before sources block (backpressure)
+DEFAULT_QUEUE_BLOCKS = 256
+
+# Bytes read from a file or socket at a time
+READ_BYTES = 1 << 16
+
+# Seconds between checks of a tailed file that has no new data
+TAIL_POLL_SECONDS = 0.05
+
+# Recent band changes kept for the dashboard
+DEFAULT_HISTORY = 500
+
+# Seconds the updates/s rate is averaged over
+RATE_WINDOW_SECONDS = 5.0
+
+logger = logging.getLogger(__name__)
+
+_POSITIONS = {col: pos for pos, col in enumerate(FEATURE_COLUMNS)}
+
+
+class IncidentStream:
+    """Latest features and prediction per incident, re-scored only when they change.
+
+    ``predictor_fn`` returns the predictor to score with, for example
+    ``ModelReloader.current``, so hot-reloaded models are picked up.
+    """
+
+    def __init__(self, predictor_fn, capacity=1024, history=DEFAULT_HISTORY):
+        import numpy as np
+
+        self._predictor_fn = predictor_fn
+        self._lock = threading.Lock()
+        self._index = {}
+        self._ids = []
+        self._features = np.full((capacity, len(FEATURE_COLUMNS)), np.nan)
+        # Feature vector each prediction was computed from
+        self._scored = np.full((capacity, len(FEATURE_COLUMNS)), np.nan)
+        self._predictions = np.full(capacity, np.nan)
+        self._sequences = np.zeros(capacity, dtype=np.int64)
+        self._updated = np.zeros(capacity)
+        self._version = None
+        self._rate = deque()
+        self.band_changes = deque(maxlen=history)
+        self.sequence = 0
+        self.updates = 0
+        self.invalid = 0
+        self.rescored = 0
+        self.unchanged = 0
+        self.batches = 0
+        self.score_seconds = 0.0
+
+    def __len__(self):
+        return len(self._ids)
+
+    def _grow(self):
+        import numpy as np
+
+        capacity = 2 * len(self._predictions)
+        for name in ("_features", "_scored", "_predictions", "_sequences", "_updated"):
+            old = getattr(self, name)
+            new = np.full((capacity,) + old.shape[1:], np.nan if old.dtype.kind == "f" else 0,
+                          dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _merge(self, updates):
+        touched = set()
+        for update in updates:
+            try:
+                incident = update[ID_FIELD]
+                values = [(_POSITIONS[col], float(value)) for col, value in update.items()
+                          if col in _POSITIONS]
+            except (KeyError, TypeError, ValueError, AttributeError):
+                self.invalid += 1
+                continue
+            row = self._index.get(incident)
+            if row is None:
+                row = len(self._ids)
+                if row == len(self._predictions):
+                    self._grow()
+                self._index[incident] = row
+                self._ids.append(incident)
+            for pos, value in values:
+                self._features[row, pos] = value
+            touched.add(row)
+        self.updates += len(updates)
+        return touched
+
+    def apply(self, updates):
+        """Merge parsed update dicts and re-score the incidents that changed.
+
+        Returns the number of incidents re-scored.
+        """
+        import numpy as np
+
+        predictor = self._predictor_fn()
+        with self._lock:
+            touched = self._merge(updates)
+            # A new model makes every prediction stale
+            stale = predictor is not None and predictor.version != self._version
+            if stale:
+                self._version = predictor.version
+                touched.update(range(len(self._ids)))
+            rows = np.fromiter(touched, dtype=np.int64, count=len(touched))
+            features = self._features[rows]
+            complete = ~np.isnan(features).any(axis=1)
+            changed = complete & (
+                stale | (features != self._scored[rows]).any(axis=1) | np.isnan(self._predictions[rows])
+            )
+            self.unchanged += int((complete & ~changed).sum())
+            rows, X = rows[changed], features[changed]
+            self._note_rate(len(updates))
+
+        if predictor is None or not len(rows):
+            return 0
+        start = time.perf_counter()
+        predictions = predictor.predict_batch(X)
+        elapsed = time.perf_counter() - start
+
+        from .batch import severity_bands
+
+        with self._lock:
+            old_bands = severity_bands(self._predictions[rows])
+            new_bands = severity_bands(predictions)
+            self._scored[rows] = X
+            self._predictions[rows] = predictions
+            self._sequences[rows] = np.arange(self.sequence + 1, self.sequence + 1 + len(rows))
+            self.sequence += len(rows)
+            now = time.time()
+            self._updated[rows] = now
+            for position in np.flatnonzero((old_bands != new_bands) & (old_bands != "")):
+                self.band_changes.append({
+                    "time": now, "incident_id": self._ids[rows[position]],
+                    "from": old_bands[position], "to": new_bands[position],
+                    "acres": float(predictions[position]),
+                })
+            self.rescored += len(rows)
+            self.batches += 1
+            self.score_seconds += elapsed
+        return len(rows)
+
+    def reject(self, count):
+        """Count ``count`` updates that could not be parsed."""
+        with self._lock:
+            self.updates += count
+            self.invalid += count
+
+    def _note_rate(self, count):
+        now = time.monotonic()
+        self._rate.append((now, count))
+        while self._rate and now - self._rate[0][0] > RATE_WINDOW_SECONDS:
+            self._rate.popleft()
+
+    def frame(self, since=0):
+        """DataFrame (indexed by incident_id) of incidents re-scored after sequence ``since``."""
+        import numpy as np
+        import pandas as pd
+
+        from .batch import PREDICTION_COLUMN, SEVERITY_COLUMN, severity_bands
+
+        with self._lock:
+            count = len(self._ids)
+            rows = np.flatnonzero(self._sequences[:count] > since)
+            frame = pd.DataFrame(self._features[rows], columns=FEATURE_COLUMNS,
+                                 index=pd.Index([self._ids[row] for row in rows], name=ID_FIELD))
+            frame[PREDICTION_COLUMN] = self._predictions[rows]
+            frame["Sequence"] = self._sequences[rows]
+            frame["Updated"] = pd.to_datetime(self._updated[rows], unit="s")
+        frame[SEVERITY_COLUMN] = severity_bands(frame[PREDICTION_COLUMN].to_numpy())
+        return frame
+
+    def stats(self):
+        """Ingest and re-scoring counters."""
+        with self._lock:
+            self._note_rate(0)
+            recent = sum(count for _, count in self._rate)
+            return {
+                "incidents": len(self._ids),
+                "sequence": self.sequence,
+                "version": self._version,
+                "updates": self.updates,
+                "invalid": self.invalid,
+                "rescored": self.rescored,
+                "unchanged": self.unchanged,
+                "batches": self.batches,
+                "band_changes": len(self.band_changes),
+                "updates_per_second": recent / RATE_WINDOW_SECONDS,
+                "mean_score_ms": self.score_seconds / self.batches * 1000 if self.batches else 0.0,
+            }
+
+
+def split_lines(pending, data):
+    """Split ``pending + data`` into complete lines and the unterminated rest."""
+    lines = (pending + data).split(b"\n")
+    return lines[:-1], lines[-1]
+
+
+class StreamIngestor:
+    """Parses blocks of JSON lines from any number of sources into an IncidentStream."""
+
+    def __init__(self, stream, batch_rows=DEFAULT_BATCH_ROWS, queue_blocks=DEFAULT_QUEUE_BLOCKS):
+        self.stream = stream
+        self.batch_rows = batch_rows
+        self.lines = 0
+        self._queue = queue.Queue(maxsize=queue_blocks)
+        self._stop = threading.Event()
+        self._threads = []
+        self._server = None
+        self._start(self._run, "stream-ingest")
+
+    def _start(self, target, name, *args):
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        return thread
+
+    def feed(self, lines):
+        """Queue a list of raw JSON lines (bytes or str); blocks while the worker is behind."""
+        if lines:
+            self._queue.put(lines)
+
+    def _run(self):
+        while True:
+            block = self._queue.get()
+            blocks = [block]
+            size = len(block)
+            # Drain whatever else is waiting, up to one micro-batch
+            while size < self.batch_rows:
+                try:
+                    block = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                blocks.append(block)
+                size += len(block)
+            try:
+                self._apply(blocks)
+            except Exception:
+                logger.exception("Failed to apply %d stream updates", size)
+            finally:
+                for _ in blocks:
+                    self._queue.task_done()
+
+    def _apply(self, blocks):
+        updates = []
+        invalid = 0
+        for block in blocks:
+            for line in block:
+                if not line.strip():
+                    continue
+                try:
+                    update = json.loads(line)
+                except ValueError:
+                    invalid += 1
+                    continue
+                if isinstance(update, dict):
+                    updates.append(update)
+                else:
+                    invalid += 1
+        for start in range(0, len(updates), self.batch_rows):
+            self.stream.apply(updates[start:start + self.batch_rows])
+        self.stream.reject(invalid)
+        self.lines += len(updates) + invalid
+
+    def flush(self, timeout=None):
+        """Wait until every queued line has been applied; returns False on timeout."""
+        if timeout is None:
+            self._queue.join()
+            return True
+        done = threading.Event()
+        threading.Thread(target=lambda: (self._queue.join(), done.set()), daemon=True).start()
+        return done.wait(timeout)
+
+    def tail(self, path, from_start=False):
+        """Follow ``path`` in a background thread."""
+        return self._start(self._tail, f"stream-tail:{path}", os.fspath(path), from_start)
+
+    def _tail(self, path, from_start):
+        handle = None
+        pending = b""
+        while not self._stop.is_set():
+            if handle is None:
+                try:
+                    handle = open(path, "rb")
+                except FileNotFoundError:
+                    # Whatever the file holds once it appears is new
+                    from_start = True
+                    self._stop.wait(TAIL_POLL_SECONDS)
+                    continue
+                if not from_start:
+                    handle.seek(0, os.SEEK_END)
+                # Anything written after the first open is new
+                from_start = True
+                pending = b""
+            data = handle.read(READ_BYTES)
+            if data:
+                lines, pending = split_lines(pending, data)
+                self.feed(lines)
+                continue
+            try:
+                stat = os.stat(path)
+                replaced = (stat.st_ino != os.fstat(handle.fileno()).st_ino
+                            or stat.st_size < handle.tell())
+            except FileNotFoundError:
+                replaced = True
+            if replaced:
+                handle.close()
+                handle = None
+            else:
+                self._stop.wait(TAIL_POLL_SECONDS)
+        if handle is not None:
+            handle.close()
+
+    def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Accept newline-delimited updates on a local TCP port; returns the bound port."""
+        server = socket.create_server((host, port))
+        server.settimeout(0.5)
+        self._server = server
+        self._start(self._accept, f"stream-server:{port}", server)
+        return server.getsockname()[1]
+
+    def _accept(self, server):
+        while not self._stop.is_set():
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            threading.Thread(target=self._receive, args=(conn,), name="stream-conn", daemon=True).start()
+
+    def _receive(self, conn):
+        pending = b""
+        with conn:
+            while True:
+                data = conn.recv(READ_BYTES)
+                if not data:
+                    break
+                lines, pending = split_lines(pending, data)
+                self.feed(lines)
+        self.feed([pending])
+
+    def stop(self):
+        """Stop the sources; updates already queued are still applied."""
+        self._stop.set()
+        if self._server is not None:
+            self._server.close()
+
+
+def start(source, predictor_fn):
+    """Return a running StreamIngestor for a JSONL path or ``tcp://host:port``."""
+    ingestor = StreamIngestor(IncidentStream(predictor_fn))
+    if source.startswith("tcp://"):
+        host, _, port = source[len("tcp://"):].rpartition(":")
+        ingestor.serve(host or DEFAULT_HOST, int(port))
+    else:
+        ingestor.tail(source)
+    return ingestor
+
+
+_shared_ingestor = None
+_shared_loaded = False
+_shared_lock = threading.Lock()
+
+
+def shared_stream(predictor_fn=None):
+    """Return the process-wide StreamIngestor for ``$WILDFIRE_STREAM``, or None.
+
+    It starts on the first call that passes ``predictor_fn``. Later calls
+    return the same ingestor. A source that fails to start is logged once
+    and live ingest stays off.
+    """
+    global _shared_ingestor, _shared_loaded
+    with _shared_lock:
+        if not _shared_loaded and predictor_fn is not None:
+            _shared_loaded = True
+            source = os.environ.get(STREAM_ENV_VAR)
+            if source:
+                try:
+                    _shared_ingestor = start(source, predictor_fn)
+                except Exception:
+                    logger.exception("Could not start the incident stream from %s", source)
+        return _shared_ingestor
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest live incident updates and re-score them")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--jsonl", help="JSONL file to follow")
+    source.add_argument("--port", type=int, help="Local TCP port to accept updates on")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--from-start", action="store_true", help="Read the existing file before following it")
+    parser.add_argument("--model-dir", default=None,
+                        help="Directory holding best_fire_model.pkl and scaler.pkl")
+    parser.add_argument("--report-seconds", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    from .predictor import Predictor
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    predictor = Predictor.load(args.model_dir)
+    predictor.compile()
+    ingestor = StreamIngestor(IncidentStream(lambda: predictor))
+    if args.jsonl:
+        ingestor.tail(args.jsonl, from_start=args.from_start)
+        logger.info("Following %s", args.jsonl)
+    else:
+        port = ingestor.serve(args.host, args.port)
+        logger.info("Accepting updates on %s:%d", args.host, port)
+    try:
+        while True:
+            time.sleep(args.report_seconds)
+            stats = ingestor.stream.stats()
+            logger.info("%d incidents • %d updates (%.0f/s) • %d re-scored • %d unchanged • %d invalid",
+                        stats["incidents"], stats["updates"], stats["updates_per_second"],
+                        stats["rescored"], stats["unchanged"], stats["invalid"])
+    except KeyboardInterrupt:
+        ingestor.stop()
+
+
+if __name__ == "__main__":
+    main()
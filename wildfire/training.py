@@ -0,0 +1,342 @@
+"""Offline training pipeline (the Colab notebook as a command).
+
+    python -m wildfire.training California_Fire_Incidents.csv [--jobs 8] [--out artifacts]
+
+Reproduces ``Model Training/CIProject(WildFire).ipynb``. It keeps the
+selected columns, fills missing values with 0, label-encodes Counties,
+makes an 80/20 split with random_state 42 and fits a StandardScaler. It
+then fits the notebook's four models and keeps the best by test R².
+
+The models are fitted at the same time in a process pool. ``--jobs`` cores
+are split into per-model thread budgets: single-threaded models get one
+core and the rest is shared by the models that can use it (n_jobs, plus a
+threadpoolctl limit on BLAS). The pool never asks for more threads than
+cores.
+
+Each stage reports wall time and peak memory. For in-process stages this
+is the tracemalloc peak and the process RSS high-water mark; for each fit,
+its worker's RSS high-water mark. The run is written to
+``<out>/<version>/`` with the model and scaler pickles, the county
+encoding, a reference sample of the test split (``reference.pkl``, used
+by ``wildfire.incremental`` to check updates against earlier data) and a
+``manifest.json``. ``<out>/LATEST`` then names that version,
+and ``wildfire.predictor.latest_model_dir`` resolves it for the app.
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import resource
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from .features import FEATURE_COLUMNS
+
+TARGET_COLUMN = "AcresBurned"
+TEST_SIZE = 0.2
+RANDOM_STATE = 42
+
+# Models that take an n_jobs thread count
+MULTITHREADED = {"Random Forest", "XGBoost"}
+
+MODEL_NAMES = ["Linear Regression", "Decision Tree", "Random Forest", "XGBoost"]
+
+# Held-out rows kept with each version: {"X": raw features, "y": acres}
+REFERENCE_FILE = "reference.pkl"
+REFERENCE_ROWS = 2000
+
+
+def make_model(name, threads=1, params=None):
+    """Return the notebook's unfitted model ``name`` using ``threads`` cores.
+
+    ``params`` (e.g. from ``wildfire.tuning``) override the notebook's
+    hyperparameters.
+    """
+    params = params or {}
+    if name == "Linear Regression":
+        from sklearn.linear_model import LinearRegression
+        return LinearRegression(**params)
+    if name == "Decision Tree":
+        from sklearn.tree import DecisionTreeRegressor
+        return DecisionTreeRegressor(**{"random_state": RANDOM_STATE, **params})
+    if name == "Random Forest":
+        from sklearn.ensemble import RandomForestRegressor
+        return RandomForestRegressor(**{"n_estimators": 100, "random_state": RANDOM_STATE, **params},
+                                     n_jobs=threads)
+    if name == "XGBoost":
+        from xgboost import XGBRegressor
+        return XGBRegressor(**{"n_estimators": 100, "learning_rate": 0.1, "random_state": RANDOM_STATE, **params},
+                            n_jobs=threads)
+    raise ValueError(f"Unknown model {name!r}; choose from {', '.join(MODEL_NAMES)}")
+
+
+def thread_budgets(names, cores):
+    """Split ``cores`` between models: 1 each, spare cores to multithreaded ones."""
+    budgets = {name: 1 for name in names}
+    parallel = [name for name in names if name in MULTITHREADED]
+    spare = cores - len(names)
+    for i, name in enumerate(parallel):
+        if spare > 0:
+            budgets[name] += spare // len(parallel) + (1 if i < spare % len(parallel) else 0)
+    return budgets
+
+
+def _rss_peak_mb():
+    # ru_maxrss is in kB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+@contextmanager
+def stage(name, report):
+    """Record wall time, tracemalloc peak and RSS high-water mark for a stage."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report[name] = {
+            "seconds": time.perf_counter() - start,
+            "peak_traced_mb": peak / 2**20,
+            "rss_peak_mb": _rss_peak_mb(),
+        }
+
+
+def preprocess(frame):
+    """The notebook's cleaning; returns (X DataFrame, y Series, county labels)."""
+    from sklearn.preprocessing import LabelEncoder
+
+    missing = [col for col in [TARGET_COLUMN] + FEATURE_COLUMNS if col not in frame.columns]
+    if missing:
+        raise ValueError(f"Dataset is missing column(s): {', '.join(missing)}")
+    df = frame[[TARGET_COLUMN] + FEATURE_COLUMNS].copy()
+    df.fillna(0, inplace=True)
+    encoder = LabelEncoder()
+    df["Counties"] = encoder.fit_transform(df["Counties"].astype(str))
+    df["MajorIncident"] = df["MajorIncident"].astype(int)
+    return df.drop(TARGET_COLUMN, axis=1), df[TARGET_COLUMN], [str(c) for c in encoder.classes_]
+
+
+def _fit_model(name, threads, X_train, y_train, X_test, y_test, params=None):
+    """Fit and score one model; runs in a worker process."""
+    import numpy as np
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+    from threadpoolctl import threadpool_limits
+
+    start = time.perf_counter()
+    with threadpool_limits(limits=threads):
+        model = make_model(name, threads, params)
+        model.fit(X_train, y_train)
+        fitted = time.perf_counter()
+        y_pred = model.predict(X_test)
+    return name, model, {
+        "MAE": float(mean_absolute_error(y_test, y_pred)),
+        "RMSE": float(np.sqrt(mean_squared_error(y_test, y_pred))),
+        "R2": float(r2_score(y_test, y_pred)),
+    }, {
+        "threads": threads,
+        "fit_seconds": fitted - start,
+        "seconds": time.perf_counter() - start,
+        "rss_peak_mb": _rss_peak_mb(),
+    }
+
+
+def fit_models(names, X_train, y_train, X_test, y_test, jobs, params=None):
+    """Fit ``names`` concurrently within ``jobs`` cores.
+
+    ``params`` maps model names to hyperparameter overrides. Returns
+    {name: (model, metrics, stats)}. With one job everything runs
+    in-process, one model after another.
+    """
+    budgets = thread_budgets(names, jobs)
+    params = params or {}
+    args = (X_train, y_train, X_test, y_test)
+    if jobs <= 1:
+        results = [_fit_model(name, 1, *args, params.get(name)) for name in names]
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(names), jobs)) as pool:
+            futures = [pool.submit(_fit_model, name, budgets[name], *args, params.get(name))
+                       for name in names]
+            results = [future.result() for future in futures]
+    return {name: (model, metrics, stats) for name, model, metrics, stats in results}
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_artifacts(out_dir, model, scaler, manifest, counties, extras=None):
+    """Write a version directory and point ``<out_dir>/LATEST`` at it.
+
+    ``extras`` maps further file names to objects pickled beside the model.
+    When ``manifest["version"]`` is already taken (two runs in the same
+    second) a ``-2``, ``-3``... suffix is added to it.
+    """
+    import joblib
+
+    from .predictor import LATEST_FILE, MODEL_FILE, SCALER_FILE
+
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    base_version, suffix = manifest["version"], 1
+    while True:
+        version_dir = Path(out_dir) / manifest["version"]
+        try:
+            version_dir.mkdir()
+            break
+        except FileExistsError:
+            suffix += 1
+            manifest["version"] = f"{base_version}-{suffix}"
+    joblib.dump(model, version_dir / MODEL_FILE)
+    joblib.dump(scaler, version_dir / SCALER_FILE)
+    for name, obj in (extras or {}).items():
+        joblib.dump(obj, version_dir / name)
+    (version_dir / "counties.json").write_text(json.dumps(counties, indent=1))
+    manifest["files"] = {path.name: _sha256(path) for path in sorted(version_dir.iterdir())}
+    (version_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+
+    latest = Path(out_dir) / LATEST_FILE
+    tmp = latest.with_name(f".{LATEST_FILE}.{os.getpid()}.tmp")
+    tmp.write_text(manifest["version"] + "\n")
+    os.replace(tmp, latest)
+    return version_dir
+
+
+def reference_sample(X, y, max_rows=REFERENCE_ROWS):
+    """{"X", "y"} of at most ``max_rows`` rows of held-out raw features and targets."""
+    import numpy as np
+
+    if len(y) > max_rows:
+        keep = np.sort(np.random.default_rng(RANDOM_STATE).choice(len(y), max_rows, replace=False))
+        X, y = X[keep], y[keep]
+    return {"X": X, "y": y}
+
+
+def train(csv_path, out_dir, jobs=None, names=None, tune=False):
+    """Run the full pipeline and return the manifest.
+
+    With ``tune`` the tree models are first searched by
+    ``wildfire.tuning.tune`` and fitted with the winning hyperparameters.
+    """
+    import pandas as pd
+    import sklearn
+    import xgboost
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+
+    jobs = jobs or os.cpu_count() or 1
+    names = names or MODEL_NAMES
+    stages = {}
+    start = time.perf_counter()
+
+    with stage("load", stages):
+        raw = pd.read_csv(csv_path)
+    with stage("preprocess", stages):
+        X, y, counties = preprocess(raw)
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE)
+        scaler = StandardScaler()
+        X_train_scaled = scaler.fit_transform(X_train)
+        X_test_scaled = scaler.transform(X_test)
+
+    params, tuning = {}, None
+    if tune:
+        from .tuning import PARAM_GRIDS
+        from .tuning import tune as search
+
+        tune_start = time.perf_counter()
+        tuning = search(csv_path, names=[name for name in names if name in PARAM_GRIDS], jobs=jobs)
+        params = {name: result["best_params"] for name, result in tuning.items()}
+        stages["tune"] = {"seconds": time.perf_counter() - tune_start, "rss_peak_mb": _rss_peak_mb()}
+
+    # Child processes are measured on their own; here only wall time counts
+    fit_start = time.perf_counter()
+    fitted = fit_models(names, X_train_scaled, y_train.to_numpy(), X_test_scaled, y_test.to_numpy(), jobs,
+                        params)
+    stages["fit"] = {"seconds": time.perf_counter() - fit_start, "rss_peak_mb": _rss_peak_mb(),
+                     "models": {name: stats for name, (_, _, stats) in fitted.items()}}
+
+    best_name = max(fitted, key=lambda name: fitted[name][1]["R2"])
+
+    # Forests get intervals from their own trees; anything else gets a quantile model
+    extras, intervals = {}, None
+    if best_name != "Random Forest":
+        from .intervals import INTERVAL_FILE, contain, empirical_coverage, fit_interval_models
+
+        with stage("intervals", stages):
+            interval_model = fit_interval_models(X_train_scaled, y_train.to_numpy(), threads=jobs,
+                                                 random_state=RANDOM_STATE)
+            _, lower, upper = contain(fitted[best_name][0].predict(X_test_scaled),
+                                      interval_model["lower"].predict(X_test_scaled),
+                                      interval_model["upper"].predict(X_test_scaled))
+            intervals = {"method": "quantile", "nominal": interval_model["coverage"],
+                         **empirical_coverage(y_test, lower, upper)}
+        extras[INTERVAL_FILE] = interval_model
+    extras[REFERENCE_FILE] = reference_sample(X_test.to_numpy(dtype=float), y_test.to_numpy(dtype=float))
+
+    version = time.strftime("%Y%m%d-%H%M%S")
+    manifest = {
+        "version": version,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "best_model": best_name,
+        "metrics": {name: metrics for name, (_, metrics, _) in fitted.items()},
+        "dataset": {"path": str(Path(csv_path).resolve()), "sha256": _sha256(csv_path),
+                    "rows": len(raw), "train_rows": len(X_train), "test_rows": len(X_test)},
+        "feature_columns": FEATURE_COLUMNS,
+        "jobs": jobs,
+        "params": params,
+        "intervals": intervals or {"method": "trees"},
+        "environment": {"python": platform.python_version(), "sklearn": sklearn.__version__,
+                        "xgboost": xgboost.__version__},
+    }
+    with stage("write", stages):
+        version_dir = write_artifacts(out_dir, fitted[best_name][0], scaler, manifest, counties, extras)
+    if tuning is not None:
+        manifest["tuning"] = {name: {key: value for key, value in result.items() if key != "trials"}
+                              for name, result in tuning.items()}
+    manifest["stages"] = stages
+    manifest["total_seconds"] = time.perf_counter() - start
+    # Rewrite with the timings of the write stage included
+    (version_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def main(argv=None):
+    from .predictor import ARTIFACTS_DIR, DEFAULT_MODEL_DIR
+
+    parser = argparse.ArgumentParser(description="Train the wildfire models and write versioned artifacts")
+    parser.add_argument("csv", help="California_Fire_Incidents.csv")
+    parser.add_argument("--out", default=str(DEFAULT_MODEL_DIR / ARTIFACTS_DIR),
+                        help="Artifacts directory (default: <repo>/artifacts)")
+    parser.add_argument("--jobs", type=int, default=None, help="Cores to use (default: all)")
+    parser.add_argument("--models", nargs="+", choices=MODEL_NAMES, default=None)
+    parser.add_argument("--tune", action="store_true",
+                        help="Search XGBoost/Random Forest hyperparameters first (wildfire.tuning)")
+    args = parser.parse_args(argv)
+
+    manifest = train(args.csv, args.out, jobs=args.jobs, names=args.models, tune=args.tune)
+
+    print(f"{'model':<20}{'R2':>8}{'MAE':>12}{'RMSE':>12}{'threads':>9}{'fit s':>8}{'RSS MB':>9}")
+    for name, metrics in sorted(manifest["metrics"].items(), key=lambda item: -item[1]["R2"]):
+        stats = manifest["stages"]["fit"]["models"][name]
+        print(f"{name:<20}{metrics['R2']:>8.3f}{metrics['MAE']:>12,.0f}{metrics['RMSE']:>12,.0f}"
+              f"{stats['threads']:>9}{stats['fit_seconds']:>8.2f}{stats['rss_peak_mb']:>9.0f}")
+    print()
+    print(f"{'stage':<12}{'wall s':>8}{'traced MB':>11}{'RSS MB':>9}")
+    for name, stats in manifest["stages"].items():
+        traced = f"{stats['peak_traced_mb']:.1f}" if "peak_traced_mb" in stats else "-"
+        print(f"{name:<12}{stats['seconds']:>8.2f}{traced:>11}{stats['rss_peak_mb']:>9.0f}")
+    print(f"\nBest: {manifest['best_model']} • version {manifest['version']} "
+          f"written to {Path(args.out) / manifest['version']} (LATEST updated)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""What-if sweeps: vary one or two resource inputs around an incident.
+
+The whole grid is built as one (n, 10) array and scored with a single
+``predict_batch`` call, so a 100 x 100 sweep costs about as much as one
+10k-row batch. Results are cached per (base incident, axes, model version)
+in their own small LRU, separate from the single-prediction cache.
+"""
+import threading
+
+from .cache import PredictionCache, feature_key
+from .features import FEATURE_COLUMNS
+from .scenarios import feature_ranges
+
+# Inputs an incident commander can change
+SWEEP_FEATURES = [
+    "PersonnelInvolved", "Engines", "Helicopters", "Dozers", "WaterTenders", "PercentContained",
+]
+
+DEFAULT_POINTS = 50
+
+# Sweeps kept per process (each holds at most a few hundred KB of floats)
+SWEEP_CACHE_SIZE = 32
+
+
+def axis_values(feature, base_value, points=DEFAULT_POINTS):
+    """Return sorted sweep values for ``feature`` around ``base_value``.
+
+    Containment spans 0-100%. Resources run from 0 to the larger of twice
+    the current value and the demo-scenario range, in whole units, so an
+    axis can end up with fewer than ``points`` values.
+    """
+    import numpy as np
+
+    if feature not in SWEEP_FEATURES:
+        raise ValueError(f"Cannot sweep {feature!r}; choose from {', '.join(SWEEP_FEATURES)}")
+
+    low, high = feature_ranges()[feature]
+    if feature == "PercentContained":
+        return np.linspace(low, high, points)
+    high = max(high, 2 * float(base_value))
+    return np.unique(np.round(np.linspace(0, high, points)))
+
+
+def sweep(predictor, features, x_feature, x_values, y_feature=None, y_values=None):
+    """Score ``features`` with one or two inputs replaced by grid values.
+
+    Returns {"x", "y", "acres"}, where acres has shape (len(y), len(x)) for
+    a two-axis sweep (y is None and acres is 1-D otherwise).
+    """
+    import numpy as np
+
+    if y_feature is not None and y_feature == x_feature:
+        raise ValueError("Choose two different inputs to sweep")
+
+    base = np.array([float(features[col]) for col in FEATURE_COLUMNS])
+    x_values = np.asarray(x_values, dtype=np.float64)
+    x_col = FEATURE_COLUMNS.index(x_feature)
+
+    if y_feature is None:
+        grid = np.tile(base, (len(x_values), 1))
+        grid[:, x_col] = x_values
+        return {"x": x_values, "y": None, "acres": predictor.predict_batch(grid)}
+
+    y_values = np.asarray(y_values, dtype=np.float64)
+    grid = np.tile(base, (len(x_values) * len(y_values), 1))
+    # Row-major over (y, x) so the result reshapes straight into a heatmap
+    grid[:, x_col] = np.tile(x_values, len(y_values))
+    grid[:, FEATURE_COLUMNS.index(y_feature)] = np.repeat(y_values, len(x_values))
+    acres = predictor.predict_batch(grid).reshape(len(y_values), len(x_values))
+    return {"x": x_values, "y": y_values, "acres": acres}
+
+
+_sweep_cache = None
+_sweep_lock = threading.Lock()
+
+
+def cached_sweep(predictor, features, x_feature, y_feature=None, points=DEFAULT_POINTS):
+    """``sweep`` over ``axis_values`` grids, cached per base incident and model version."""
+    global _sweep_cache
+    with _sweep_lock:
+        if _sweep_cache is None:
+            _sweep_cache = PredictionCache(SWEEP_CACHE_SIZE)
+    cache = _sweep_cache
+
+    key = (feature_key(features), x_feature, y_feature, points)
+    result = cache.get(key, predictor.version)
+    if result is None:
+        x_values = axis_values(x_feature, features[x_feature], points)
+        y_values = axis_values(y_feature, features[y_feature], points) if y_feature else None
+        result = sweep(predictor, features, x_feature, x_values, y_feature, y_values)
+        cache.put(key, predictor.version, result)
+    return result